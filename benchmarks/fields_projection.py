@@ -0,0 +1,83 @@
+"""Bytes transferred and decode time with and without `fields=` projections
+
+Usage:
+    python benchmarks/fields_projection.py
+    python benchmarks/fields_projection.py --date 2022-06-01 --team 145 --season 2022
+    MLB_API_ROOT=http://127.0.0.1:8900/api python benchmarks/fields_projection.py   # against mlb.devserver
+
+Each scenario requests the url the library used to send ("before") and
+the projected one it sends now ("after") straight through the transport
+(no response cache), then checks that the parser produces the same result
+from both payloads.
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mlb import decoders, parsing, functions, projections
+from mlb import constants as c
+from mlb.utils import get_tzinfo
+from mlb.async_mlb import run_sync
+from mlb.async_mlb.transport import request
+
+OLD_HIGHLIGHTS = "game(content(media(all),summary,gamenotes,highlights(highlights)))"
+NEW_HIGHLIGHTS = "game(content(highlights(highlights)))"
+SCHEDULE_EXTRA = ("awayPlayers", "homePlayers")
+
+
+def scenarios(args) -> list:
+    schedule = lambda data: parsing._parse_schedule_data(data, get_tzinfo(None))
+    scores = f"{c.BASE}/schedule?sportId=1&date={args.date}&hydrate=linescore"
+    team_sched = f"{c.BASE}/schedule?sportId=1&teamId={args.team}&season={args.season}&hydrate=broadcasts(all),linescore,decisions"
+    highlights = f"{c.BASE}/schedule?sportId=1&teamId={args.team}&season={args.season}&hydrate="
+    return [
+        ("scores()", scores,
+         projections.with_fields(scores, parsing._parse_schedule_data, SCHEDULE_EXTRA), schedule),
+        ("schedule(season, hydrate)", team_sched,
+         projections.with_fields(team_sched, parsing._parse_schedule_data, SCHEDULE_EXTRA), schedule),
+        ("game_highlights(season)", highlights + OLD_HIGHLIGHTS,
+         projections.with_fields(highlights + NEW_HIGHLIGHTS, functions._parse_highlights), functions._parse_highlights),
+    ]
+
+
+def measure(url, repeat) -> tuple:
+    start = time.perf_counter()
+    body = run_sync(request(url)).body
+    elapsed = time.perf_counter() - start
+    best = float('inf')
+    for _ in range(repeat):
+        t = time.perf_counter()
+        data = decoders.loads(body)
+        best = min(best, time.perf_counter() - t)
+    return len(body), best, elapsed, data
+
+
+def same(a, b) -> bool:
+    try:
+        return bool(a == b) if not hasattr(a, 'equals') else a.equals(b)
+    except ValueError:
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--date', default='2022-06-01')
+    parser.add_argument('--team', type=int, default=145)
+    parser.add_argument('--season', type=int, default=2022)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<28} {'KB before':>10} {'KB after':>9} {'decode ms':>16} {'fetch s':>12} {'same':>5}")
+    for name, before_url, after_url, parse in scenarios(args):
+        b_size, b_dec, b_fetch, b_data = measure(before_url, args.repeat)
+        a_size, a_dec, a_fetch, a_data = measure(after_url, args.repeat)
+        print(f"{name:<28} {b_size / 1024:>10.1f} {a_size / 1024:>9.1f} "
+              f"{b_dec * 1e3:>7.2f} -> {a_dec * 1e3:<6.2f} {b_fetch:>5.2f} -> {a_fetch:<4.2f} "
+              f"{'yes' if same(parse(b_data), parse(a_data)) else 'NO':>5}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Compare the JSON decoding backends on recorded StatsAPI payloads
+
+Usage:
+    python benchmarks/json_decoders.py                  # payloads from the response cache
+    python benchmarks/json_decoders.py feed.json ...    # payloads from files
+    python benchmarks/json_decoders.py --repeat 50
+
+Payloads are read from the files given on the command line, otherwise from
+the on-disk response cache (`mlb.cache_inspect()`), which holds every
+response the library has recorded. If neither is available, a synthetic
+live-feed-shaped payload is generated.
+"""
+import os
+import sys
+import time
+import json
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mlb import decoders
+from mlb.cache import get_cache
+
+
+def _synthetic_feed(plays=600) -> bytes:
+    rnd = random.Random(0)
+    all_plays = []
+    for i in range(plays):
+        all_plays.append({
+            "result": {"type": "atBat", "event": rnd.choice(["Single", "Strikeout", "Groundout", "Walk"]),
+                       "description": "x" * rnd.randint(20, 120), "rbi": rnd.randint(0, 2)},
+            "about": {"atBatIndex": i, "halfInning": rnd.choice(["top", "bottom"]), "inning": i // 70 + 1},
+            "playEvents": [{
+                "pitchData": {"startSpeed": rnd.uniform(70, 100), "endSpeed": rnd.uniform(60, 90),
+                              "coordinates": {k: rnd.uniform(-5, 5) for k in ("x", "y", "pX", "pZ", "aX", "aY", "aZ")}},
+                "details": {"call": {"code": "B", "description": "Ball"}, "isInPlay": False},
+            } for _ in range(rnd.randint(1, 7))],
+        })
+    return json.dumps({"gamePk": 1, "liveData": {"plays": {"allPlays": all_plays}}}).encode()
+
+
+def load_payloads(paths) -> list:
+    if paths:
+        payloads = []
+        for p in paths:
+            with open(p, 'rb') as f:
+                payloads.append((p, f.read()))
+        return payloads
+    cache = get_cache()
+    rows = cache._connection().execute(
+        "SELECT url, body FROM responses ORDER BY size DESC LIMIT 50").fetchall()
+    if rows:
+        return [(url, bytes(body)) for url, body in rows]
+    return [("synthetic live feed", _synthetic_feed())]
+
+
+def bench(loads, payloads, repeat) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _, body in payloads:
+            loads(body)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='*')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    payloads = load_payloads(args.paths)
+    total_bytes = sum(len(body) for _, body in payloads)
+    print(f"{len(payloads)} payload(s), {total_bytes / 1e6:.2f} MB, best of {args.repeat}\n")
+
+    results = []
+    for name in decoders.available():
+        loads = decoders.get_backend(name)
+        seconds = bench(loads, payloads, args.repeat)
+        results.append((name, seconds))
+
+    baseline = dict(results)['json']
+    print(f"{'backend':<10} {'ms':>10} {'MB/s':>10} {'vs json':>8}")
+    for name, seconds in sorted(results, key=lambda r: r[1]):
+        print(f"{name:<10} {seconds * 1e3:>10.2f} {total_bytes / 1e6 / seconds:>10.1f} {baseline / seconds:>7.2f}x")
+    print(f"\nactive backend: {decoders.get_decoder()}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Compare `mlb.search` lookups with scanning the reference tables
+
+Usage:
+    python benchmarks/name_search.py
+    python benchmarks/name_search.py --queries "jose ab" yankes wrigly --repeat 200
+
+"scan" is the old way of matching a name: a lowercase substring test on
+every row of people.csv, teams.csv and venues.csv. "search" ranks matches
+from the prebuilt indexes (their one-time build is reported separately).
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mlb
+from mlb.name_search import KINDS, get_index
+
+QUERIES = ['j', 'abreu', 'jose ab', 'white so', 'yankes', 'wrigly', 'smith']
+
+
+def _scan(query: str) -> int:
+    query = query.lower()
+    people = mlb.people()
+    names = (people['name_first'] + ' ' + people['name_last']).str.lower()
+    found = names.str.contains(query, regex=False, na=False).sum()
+    found += mlb.teams()['name_full'].str.lower().str.contains(query, regex=False).sum()
+    found += mlb.venues()['name'].str.lower().str.contains(query, regex=False).sum()
+    return int(found)
+
+
+def _time(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', nargs='+', default=QUERIES)
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args(argv)
+
+    for kind in KINDS:
+        start = time.perf_counter()
+        index = get_index(kind)
+        print(f"build {kind:<8} {len(index):>6} names {(time.perf_counter() - start) * 1e3:>8.1f} ms")
+
+    print(f"\n{'':<12} {'scan ms':>10} {'search ms':>10} {'speedup':>9}  top match")
+    for query in args.queries:
+        scan = _time(lambda: _scan(query), max(args.repeat // 10, 1))
+        lookup = _time(lambda: mlb.search(query), args.repeat)
+        top = mlb.search(query, limit=1)
+        top = f"{top[0]['name']} ({top[0]['match']})" if top else '-'
+        print(f"{query!r:<12} {scan * 1e3:>10.2f} {lookup * 1e3:>10.3f} {scan / lookup:>8.0f}x  {top}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Profile the library offline against recorded StatsAPI traffic
+
+Usage:
+    python benchmarks/offline_profile.py --record fixtures.jsonl.gz     # hits the network once
+    python benchmarks/offline_profile.py fixtures.jsonl.gz              # replays it
+    python benchmarks/offline_profile.py fixtures.jsonl.gz --latency 0.05 --jitter 0.02
+    python benchmarks/offline_profile.py fixtures.jsonl.gz --profile Team
+
+Every scenario is run once while recording (`mlb.record_fixtures`) and then
+replayed from the archive (`mlb.replay_fixtures`) as many times as asked,
+so the numbers don't depend on the network or on the response cache.
+"""
+import os
+import sys
+import time
+import pstats
+import argparse
+import cProfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mlb
+
+SCENARIOS = {
+    'Person':      lambda: mlb.Person(547989),
+    'Team':        lambda: mlb.Team(145, 2022),
+    'Franchise':   lambda: mlb.Franchise(145),
+    'Game':        lambda: mlb.Game(662993),
+    'update_leagues':     lambda: mlb.update_leagues(inplace=False),
+    'update_seasons':     lambda: mlb.update_seasons(inplace=False),
+    'update_pitch_types': lambda: mlb.update_pitch_types(inplace=False),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('archive')
+    parser.add_argument('--record', action='store_true', help='record the scenarios into the archive first')
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS), help='run only these (repeatable)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--profile', choices=list(SCENARIOS), help='print a cProfile report for one scenario')
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+
+    if args.record:
+        with mlb.record_fixtures(args.archive) as recorder:
+            for name in names:
+                SCENARIOS[name]()
+        print(f"recorded {len(recorder.entries)} responses to {args.archive}\n")
+
+    print(f"{'scenario':<20} {'best ms':>10} {'mean ms':>10} {'requests':>9}")
+    for name in names:
+        times = []
+        for _ in range(args.repeat):
+            with mlb.replay_fixtures(args.archive, latency=args.latency, jitter=args.jitter) as replayer:
+                start = time.perf_counter()
+                SCENARIOS[name]()
+                times.append(time.perf_counter() - start)
+        print(f"{name:<20} {min(times) * 1e3:>10.1f} {sum(times) / len(times) * 1e3:>10.1f} {len(replayer.requests):>9}")
+
+    if args.profile:
+        with mlb.replay_fixtures(args.archive, latency=args.latency, jitter=args.jitter):
+            profiler = cProfile.Profile()
+            profiler.runcall(SCENARIOS[args.profile])
+        print()
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(30)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
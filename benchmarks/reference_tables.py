@@ -0,0 +1,74 @@
+"""Measure what the reference-table registry saves on repeated `Person()` builds
+
+Usage:
+    python benchmarks/reference_tables.py
+    python benchmarks/reference_tables.py --people 547989 660271 --repeat 20
+    python benchmarks/reference_tables.py --latency 0.02
+
+Requests go to the in-process StatsAPI stand-in (`mlb.devserver`) with the
+response cache turned off, so only the local work differs between the two
+runs: "cold" drops every loaded table before each build (the old behaviour
+of parsing people.csv, teams.csv and leagues.csv for every `Person`),
+"warm" keeps them loaded.
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mlb
+from mlb import mlbdata
+from mlb.devserver import serve
+
+GETTERS = {
+    'people':  mlbdata.get_people_df,
+    'teams':   mlbdata.get_teams_df,
+    'leagues': mlbdata.get_leagues_df,
+    'seasons': mlbdata.get_seasons_df,
+}
+
+
+def _time(fn, repeat: int, cold: bool) -> list:
+    times = []
+    for _ in range(repeat):
+        if cold:
+            mlbdata.clear_tables()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _row(name: str, cold: list, warm: list):
+    c, w = sum(cold) / len(cold), sum(warm) / len(warm)
+    print(f"{name:<20} {c * 1e3:>10.2f} {w * 1e3:>10.2f} {c / w if w else float('inf'):>8.1f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--people', type=int, nargs='+', default=[547989, 660271, 592450])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    mlb.configure_cache(enabled=False)
+
+    print(f"{'':<20} {'cold ms':>10} {'warm ms':>10} {'speedup':>9}")
+    for name, getter in GETTERS.items():
+        _row(f"get_{name}_df", _time(getter, args.repeat, True), _time(getter, args.repeat, False))
+
+    def build():
+        for mlbam in args.people:
+            mlb.Person(mlbam)
+
+    with serve(latency=args.latency):
+        build()     # warm up the session and the server
+        cold = _time(build, args.repeat, True)
+        warm = _time(build, args.repeat, False)
+    _row(f"Person() x{len(args.people)}", cold, warm)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
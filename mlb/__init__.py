@@ -77,6 +77,8 @@ from .functions import scores
 from .functions import games_today
 from .functions import free_agents
 from .functions import player_bio
+from .functions import people_bulk
+from .functions import teams_bulk
 from .functions import player_stats
 from .functions import player_game_logs
 from .functions import player_date_range
@@ -117,6 +119,9 @@ from .mlbdata import get_bbref_hitting_war_df as bbref_war_hit
 from .mlbdata import get_bbref_pitching_war_df as bbref_war_pitch
 from .mlbdata import get_teams_from_register_df as chadwick_teams
 from .mlbdata import get_coaches as coaches
+from .mlbdata import get_person_row as person_row
+from .mlbdata import convert_person_id as convert_id
+from .name_search import search
 legends = hall_of_fame
 
 from .updatedb import update_hof
@@ -138,12 +143,40 @@ update_bbref_batting_war = update_bbref_hitting_war
 
 from .async_mlb import fetch
 from .async_mlb import fetch_text
+from .async_mlb import fetch_as_completed
+from .async_mlb import FetchResult
+from .async_mlb import FetchError
+from .async_mlb import DeadlineExceeded
+from .async_mlb import configure_session
+from .async_mlb import close_sessions
+from .async_mlb import configure_scheduler
+from .async_mlb import configure_transport
+from .async_mlb import use_transport
+from .async_mlb import set_api_root
+from .async_mlb import configure_rate_limit
+from .async_mlb import configure_breaker
+from .async_mlb import breaker_state
+from .async_mlb import CircuitOpenError
+from .async_mlb import events
+from .async_mlb import subscribe as subscribe_events
+from .async_mlb import unsubscribe as unsubscribe_events
+from .async_mlb import record as record_fixtures
+from .async_mlb import replay as replay_fixtures
+
+from .cache import info as cache_info
+from .cache import inspect as cache_inspect
+from .cache import clear as clear_cache
+from .cache import configure as configure_cache
+
+from .projections import configure_fields
 
 from .paths import *
 
 from . import constants
 from .mlb_dataclasses import Leagues
 
+from . import aio
+
 from .objects import MlbWrapper
 from .objects import MlbDate
 from .objects import MlbDatetime
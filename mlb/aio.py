@@ -0,0 +1,93 @@
+"""# mlb.aio
+
+Awaitable versions of the public API.
+
+Everything here runs natively on the caller's event loop (no loop patching,
+no `run_until_complete`), so it can be used from inside an aiohttp/FastAPI
+server without blocking it:
+
+```
+from mlb import aio
+
+async def handler(request):
+    team = await aio.Team(145, 2022)
+    sched = await aio.schedule(date='2022-06-01')
+```
+
+The synchronous functions in `mlb` are thin wrappers around the same
+coroutines (available as the `.aio` attribute of each of them, e.g.
+`mlb.schedule.aio`).
+
+Each event loop gets its own pooled HTTP session; call
+`await aio.close_session()` before shutting the loop down.
+"""
+from . import functions as _funcs
+from . import classes as _classes
+from .game import Game as _Game
+from .game import _feed_url
+from .utils import default_season
+from .async_mlb import fetch_async as fetch
+from .async_mlb import fetch_as_completed_async as fetch_as_completed
+from .async_mlb import fetch_text_async as fetch_text
+from .async_mlb import close_session
+from .async_mlb import with_deadline
+
+
+async def Person(mlbam: int, **kwargs) -> _classes.Person:
+    """Awaitable `mlb.Person`"""
+    data = await with_deadline(_funcs._player_data(mlbam), kwargs.get('deadline'))
+    return _classes.Person(mlbam, _data=data, **kwargs)
+
+
+async def Franchise(mlbam: int, **kwargs) -> _classes.Franchise:
+    """Awaitable `mlb.Franchise`"""
+    data = await with_deadline(_funcs._franchise_data(int(mlbam)), kwargs.get('deadline'), kwargs.get('partial', False))
+    return _classes.Franchise(mlbam, _data=data)
+
+
+async def Team(mlbam: int, season=None, **kwargs) -> _classes.Team:
+    """Awaitable `mlb.Team`"""
+    if season is None:
+        season = default_season()
+    data = await with_deadline(_funcs._team_data(int(mlbam), int(season), log=kwargs.get('log')), kwargs.get('deadline'), kwargs.get('partial', False))
+    return _classes.Team(mlbam, season, _data=data, **kwargs)
+
+
+async def Game(game_pk, timecode=None, tz='et', deadline=None) -> _Game:
+    """Awaitable `mlb.Game`"""
+    resp = await _funcs._get_json(_feed_url(game_pk, timecode), deadline=deadline)
+    return _Game(game_pk, timecode, tz, _data=resp.json)
+
+
+person = Person
+franchise = Franchise
+team = Team
+game = Game
+
+play_search = _funcs.play_search.aio
+pitch_search = _funcs.pitch_search.aio
+game_search = _funcs.game_search.aio
+last_game = _funcs.last_game.aio
+next_game = _funcs.next_game.aio
+schedule = _funcs.schedule.aio
+scores = _funcs.scores.aio
+games_today = _funcs.games_today.aio
+free_agents = _funcs.free_agents.aio
+player_bio = _funcs.player_bio.aio
+people_bulk = _funcs.people_bulk.aio
+teams_bulk = _funcs.teams_bulk.aio
+player_stats = _funcs.player_stats.aio
+player_game_logs = _funcs.player_game_logs.aio
+player_date_range = _funcs.player_date_range.aio
+player_date_range_advanced = _funcs.player_date_range_advanced.aio
+player_splits = _funcs.player_splits.aio
+player_splits_advanced = _funcs.player_splits_advanced.aio
+team_roster = _funcs.team_roster.aio
+team_game_logs = _funcs.team_game_logs.aio
+team_appearances = _funcs.team_appearances.aio
+team_stats = _funcs.team_stats.aio
+league_stats = _funcs.league_stats.aio
+league_leaders = _funcs.league_leaders.aio
+season_standings = _funcs.season_standings.aio
+game_highlights = _funcs.game_highlights.aio
+get_video_link = _funcs.get_video_link.aio
@@ -1,7 +1,6 @@
 import datetime as dt
 from typing import Union, Optional, TypeAlias, TypeVar
 
-import nest_asyncio
 import pandas as pd
 
 from . import constants as c
@@ -14,8 +13,6 @@ from . import helpers
 
 from .functions import schedule, season_standings, league_stats
 
-nest_asyncio.apply()
-
 # DateOrStr = Union[str,Union[dt.datetime,dt.date]]
 
 def fetch_home_page_content(**kwargs):
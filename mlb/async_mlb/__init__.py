@@ -1,6 +1,56 @@
 from .fetch import runit as fetch
+from .fetch import fetch as fetch_async
+from .fetch import get_json
+from .fetch import get_json_async
+from .fetch import runit_as_completed as fetch_as_completed
+from .fetch import as_completed as fetch_as_completed_async
 from .fetch_text import runit as fetch_text
+from .fetch_text import fetch as fetch_text_async
 from .fetch import _determine_loop
+from .fetch import FetchedResponse
+from .fetch import FetchFailure
+from .fetch import FetchResult
+from .fetch import FetchError
+from .deadline import DeadlineExceeded
+from .deadline import deadline
+from .deadline import with_deadline
+from .session import get_session
+from .session import close_session
+from .session import close_sessions
+from .session import configure_session
+from .scheduler import get_scheduler
+from .scheduler import configure_scheduler
+from .runner import run_sync
+from .runner import syncable
+from .transport import Transport
+from .transport import AiohttpTransport
+from .transport import MockTransport
+from .transport import get_transport
+from .transport import set_transport
+from .transport import use_transport
+from .transport import configure_transport
+from .transport import set_api_root
+from .ratelimit import RateLimiter
+from .ratelimit import TokenBucket
+from .ratelimit import FileTokenBucket
+from .ratelimit import get_rate_limiter
+from .ratelimit import configure_rate_limit
+from .breaker import CircuitBreaker
+from .breaker import CircuitOpenError
+from .breaker import get_breaker
+from .breaker import breaker_state
+from .breaker import reset_breakers
+from .breaker import configure_breaker
+from . import events
+from .events import RequestEvent
+from .events import StageEvent
+from .events import subscribe
+from .events import unsubscribe
+from .replay import RecordingTransport
+from .replay import ReplayTransport
+from .replay import ReplayMiss
+from .replay import record
+from .replay import replay
 from .yby_records import runit as get_updated_records
 from .coaches import runit as fetch_coaching_roster
 from .standings import runit as fetch_standings
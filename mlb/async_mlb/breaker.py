@@ -0,0 +1,206 @@
+"""Circuit breakers for upstream outages
+
+Every request is counted against the breaker of its endpoint class (see
+`mlb.endpoints.ENDPOINT_CLASSES`). After `threshold` consecutive failures
+(connection errors, timeouts, 429/5xx responses) the circuit opens, and for
+the next `reset_timeout` seconds requests to that class fail immediately
+with `CircuitOpenError` instead of reaching StatsAPI and piling up retries.
+Then a single trial request is let through ("half-open"); if it succeeds
+the circuit closes again, otherwise it stays open for another
+`reset_timeout`.
+
+While a circuit is open, `fetch` serves the last good cached payload for a
+url (however old) marked with `stale=True`, and fails fast only when there
+is none:
+
+```
+mlb.configure_breaker(threshold=5, reset_timeout=30, stale_fallback=True)
+mlb.breaker_state()
+# {'schedule': {'state': 'open', 'failures': 5, 'trips': 1, 'retry_in': 21.7}, ...}
+```
+
+Set MLB_BREAKER=0 in the environment (or call
+`configure_breaker(enabled=False)`) to turn the breakers off.
+"""
+import os
+import time
+import threading
+from typing import Optional
+
+from ..endpoints import endpoint_class
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# responses that count as a failure of the upstream service
+FAILURE_STATUSES = (429, 500, 502, 503, 504)
+
+_DEFAULTS = {
+    'enabled': os.environ.get('MLB_BREAKER', '1') not in ('0', 'false', 'False', 'off'),
+    'threshold': 5,             # consecutive failures that open a circuit
+    'reset_timeout': 30.0,      # seconds a circuit stays open before a trial request
+    'stale_fallback': True,     # serve expired cache entries while a circuit is open
+}
+
+_config = dict(_DEFAULTS)
+
+
+class CircuitOpenError(Exception):
+    """Raised for a request whose endpoint class has an open circuit"""
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f"circuit for '{endpoint}' endpoints is open (next trial in {retry_in:.1f}s)")
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (thread-safe)
+
+    Parameters:
+    -----------
+    name : str
+        endpoint class the breaker guards
+
+    threshold : int, default 5
+        consecutive failures that open the circuit
+
+    reset_timeout : float, default 30
+        seconds the circuit stays open before a trial request is let through
+
+    """
+    def __init__(self, name: str, threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<CircuitBreaker {self.name} [{self.state}] failures={self.failures}>"
+
+    def _retry_in(self) -> float:
+        return max(self._opened_at + self.reset_timeout - time.monotonic(), 0.0)
+
+    def before(self):
+        """Let a request through or raise `CircuitOpenError`"""
+        with self._lock:
+            if self.state == OPEN:
+                retry_in = self._retry_in()
+                if retry_in > 0:
+                    raise CircuitOpenError(self.name, retry_in)
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN:
+                if self._trial:
+                    raise CircuitOpenError(self.name, 0.0)
+                self._trial = True
+
+    def success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._trial = False
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.threshold):
+                self.state = OPEN
+                self.trips += 1
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+    def release(self):
+        """Forget a request that ended without an outcome (e.g. it was cancelled)"""
+        with self._lock:
+            if self.state == HALF_OPEN and self._trial:
+                self.state = OPEN
+                self._trial = False
+
+    def record(self, status: int):
+        if status in FAILURE_STATUSES:
+            self.failure()
+        else:
+            self.success()
+
+    def reset(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._trial = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'trips': self.trips,
+                'retry_in': self._retry_in() if self.state == OPEN else 0.0,
+            }
+
+
+# endpoint class -> CircuitBreaker
+_breakers: "dict[str,CircuitBreaker]" = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(url: str) -> Optional[CircuitBreaker]:
+    """The breaker guarding `url` (None when breakers are turned off)"""
+    if not _config['enabled']:
+        return None
+    name = endpoint_class(url)
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(name, CircuitBreaker(name, _config['threshold'], _config['reset_timeout']))
+    return breaker
+
+
+def stale_fallback() -> bool:
+    """Whether expired cache entries are served while a circuit is open"""
+    return _config['stale_fallback']
+
+
+def breaker_state() -> dict:
+    """State of every breaker that has seen a request (endpoint class -> dict)"""
+    return {name: breaker.snapshot() for name, breaker in list(_breakers.items())}
+
+
+def reset_breakers():
+    """Close every circuit"""
+    for breaker in list(_breakers.values()):
+        breaker.reset()
+
+
+def configure_breaker(**kwargs) -> dict:
+    """Configure the circuit breakers
+
+    Parameters:
+    -----------
+    enabled : bool, default True
+        turn the breakers on/off
+
+    threshold : int, default 5
+        consecutive failures that open a circuit
+
+    reset_timeout : float, default 30
+        seconds a circuit stays open before a trial request is let through
+
+    stale_fallback : bool, default True
+        while a circuit is open, serve the last cached payload for a url
+        (marked `stale`) instead of failing
+
+    Returns the active configuration
+    """
+    for key, value in kwargs.items():
+        if key not in _DEFAULTS:
+            raise TypeError(f"configure_breaker() got an unexpected keyword argument '{key}'")
+        _config[key] = value
+    for breaker in list(_breakers.values()):
+        breaker.threshold = _config['threshold']
+        breaker.reset_timeout = _config['reset_timeout']
+    return dict(_config)
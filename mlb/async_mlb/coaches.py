@@ -4,7 +4,12 @@ from urllib.parse import urlparse, parse_qs
 
 import pandas as pd
 
-from ..mlbdata import get_teams_df
+from ..mlbdata import get_teams_df, get_team_row
+from .. import decoders
+from .runner import run_sync
+from .scheduler import get_scheduler
+from .transport import request, RawResponse
+from . import events
 
 TEAMS = get_teams_df().sort_values(by='season',ascending=False)
 
@@ -32,7 +37,7 @@ def roster_json_to_df(rosters_list:list[dict]):
     df = pd.DataFrame(data)
     return df
 
-async def parse_data(response:aiohttp.ClientResponse):
+async def parse_data(response:RawResponse):
     url_components = urlparse(str(response.url))
     path = url_components.path
     params = parse_qs(url_components.query)
@@ -43,29 +48,30 @@ async def parse_data(response:aiohttp.ClientResponse):
     mlbam = path[first_slash_idx+1:last_slash_idx]
     season = params['season'][0]
     
-    team_row = TEAMS[(TEAMS['mlbam']==int(mlbam)) & (TEAMS['season']==int(season))].iloc[0]
+    team_row = get_team_row(mlbam,season)
     
-    roster: dict = await response.json()
+    roster: dict = decoders.loads(await response.read())
     roster['season'] = int(season)
     roster['team_mlbam'] = roster.pop('teamId')
     roster['team_name'] = team_row['name_full']
     
     return roster
 
-async def fetch_coaches():
-    parsed_responses = []
-    async with aiohttp.ClientSession() as sesh:
-        tasks = []
-        for idx,row in TEAMS.iterrows():
-            mlbam, season = (row['mlbam'], row['season'])
-            url = f'https://statsapi.mlb.com/api/v1/teams/{mlbam}/coaches?season={season}'
-            tasks.append(sesh.get(url,ssl=False))
-        client_responses = await asyncio.gather(*tasks)
-        for response in client_responses:
-            parsed_responses.append(await parse_data(response))
-            
+async def fetch_coaches(**kwargs):
+    urls = []
+    for idx,row in TEAMS.iterrows():
+        mlbam, season = (row['mlbam'], row['season'])
+        urls.append(f'https://statsapi.mlb.com/api/v1/teams/{mlbam}/coaches?season={season}')
+
+    async def _get(url):
+        response = await request(url)
+        return await parse_data(response)
+
+    parsed_responses = await get_scheduler().map(urls,_get)
+        
     return parsed_responses
 
-def runit():
-    retrieved = asyncio.run(fetch_coaches())
+def runit(**kwargs):
+    with events.printing(kwargs.get("log")), events.stage('total','coaches'):
+        retrieved = run_sync(fetch_coaches(**kwargs))
     return retrieved
\ No newline at end of file
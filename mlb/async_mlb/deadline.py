@@ -0,0 +1,99 @@
+"""Per-call deadlines
+
+A deadline covers everything a public call fetches, however many requests
+that takes:
+
+```
+mlb.Team(145, 2022, deadline=2.0)                 # raises DeadlineExceeded after 2s
+mlb.Team(145, 2022, deadline=2.0, partial=True)   # keeps the sections that arrived
+mlb.schedule(date='2022-06-01', deadline=1.5)
+```
+
+When it expires, `fetch` cancels the requests that are still queued or in
+flight (their connections are released, retries and backoff waits stop)
+and either raises `DeadlineExceeded` or, for calls made with
+`partial=True`, hands back the responses that did arrive with a
+`FetchFailure` in place of each missing one.
+
+Deadlines are kept in a context variable, so nested calls share the
+tightest one in effect.
+"""
+import time
+import asyncio
+import contextlib
+import contextvars
+from typing import Optional
+
+# seconds past the deadline before the backstop cancels a whole call, so that
+# fetches (which stop exactly at the deadline) get to report first
+DEADLINE_GRACE = 0.05
+
+# (absolute `time.monotonic()` deadline, partial results allowed)
+_deadline: contextvars.ContextVar = contextvars.ContextVar('mlb_deadline', default=None)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """Raised when a call's deadline expires before its requests finished
+
+    `result` holds what did arrive (a `FetchResult`, or None when the
+    deadline expired outside of a fetch)
+    """
+    def __init__(self, result=None):
+        self.result = result
+        if result is None:
+            super().__init__("deadline exceeded")
+        else:
+            super().__init__(f"deadline exceeded with {len(result.failures)} of {len(result)} requests outstanding")
+
+
+def remaining(seconds: Optional[float] = None) -> Optional[float]:
+    """Seconds left before the active deadline (or `seconds` from now, if sooner)
+
+    None when there is no deadline at all
+    """
+    current = _deadline.get()
+    left = None if current is None else max(current[0] - time.monotonic(), 0.0)
+    if seconds is not None:
+        left = seconds if left is None else min(left, seconds)
+    return left
+
+
+def partial_results(default=False) -> bool:
+    """Whether the active deadline allows partial results (`default` without one)"""
+    current = _deadline.get()
+    return default if current is None else current[1]
+
+
+@contextlib.contextmanager
+def deadline(seconds: float, partial=False):
+    """Apply a deadline (and partial-results setting) to everything fetched inside"""
+    at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        at = min(at, current[0])
+        partial = partial or current[1]
+    token = _deadline.set((at, partial))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+async def with_deadline(coro, seconds: Optional[float] = None, partial=False):
+    """Await `coro` under a deadline of `seconds`
+
+    Without `partial`, the whole call is cancelled once the deadline passes
+    (as a backstop for work that isn't a fetch). With `partial`, fetches
+    stop at the deadline and the call finishes with what arrived.
+    """
+    if seconds is None:
+        return await coro
+    with deadline(seconds, partial):
+        if partial:
+            return await coro
+        try:
+            return await asyncio.wait_for(coro, remaining() + DEADLINE_GRACE)
+        except DeadlineExceeded:
+            raise
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded() from None
@@ -0,0 +1,213 @@
+"""Request lifecycle events for monitoring and profiling
+
+Subscribers are called synchronously with a `RequestEvent` after every
+request `fetch` handles (whether it was answered by the cache or by
+StatsAPI), and with a `StageEvent` after the parse and DataFrame build
+stages of the builders (`Team`, `Person`, `schedule`...):
+
+```
+from mlb.async_mlb import events
+
+@events.subscribe
+def to_apm(event):
+    if isinstance(event, events.RequestEvent):
+        apm.timing(f"mlb.{event.endpoint}.total", event.total, tags=[event.cache])
+
+mlb.Team(142, 2022)
+events.unsubscribe(to_apm)
+
+with events.subscribed(events.print_event):   # the old `_logtime` style output
+    mlb.Person(547989)
+
+mlb.Team(145, 2022, log=True)                  # the same, for a single call
+```
+
+Callbacks run on the library's event loop, so they should be quick and
+must not call the synchronous API. An exception raised by a callback is
+turned into a warning. Callers coalesced onto a request that is already in
+flight (see `mlb.singleflight`) don't produce an event of their own.
+"""
+import time
+import warnings
+import threading
+import contextlib
+import contextvars
+from typing import Callable, Optional
+
+from ..endpoints import endpoint_class, url_template
+
+# cache statuses of a `RequestEvent`
+HIT = 'hit'                     # fresh cache entry, no request sent
+MISS = 'miss'                   # fetched from StatsAPI
+REVALIDATED = 'revalidated'     # cache entry confirmed by a 304
+STALE = 'stale'                 # expired entry served while a circuit is open
+
+_subscribers: tuple = ()
+_lock = threading.Lock()
+
+# seconds the request of the running handler waited in the scheduler queue
+_queue_wait = contextvars.ContextVar('mlb_queue_wait', default=None)
+
+
+class RequestEvent:
+    """Timings and outcome of one request
+
+    All durations are in seconds; connection phases are None when they
+    didn't happen (cache hits, reused connections, non-aiohttp transports).
+
+    - `queue_wait`: time spent queued in the scheduler
+    - `dns`, `connect`: name resolution and TCP/TLS setup of a new connection
+    - `ttfb`: from sending the request to receiving the response headers
+    - `body`: reading the response body
+    - `decode`: decoding the JSON payload
+    - `total`: from the start of the first attempt to the result
+    """
+    __slots__ = ['url', 'template', 'endpoint', 'status', 'bytes', 'cache', 'attempts', 'error',
+                 'queue_wait', 'dns', 'connect', 'ttfb', 'body', 'decode', 'total']
+
+    def __init__(self, url: str):
+        self.url = url
+        self.template = url_template(url)
+        self.endpoint = endpoint_class(url)
+        self.status = None
+        self.bytes = 0
+        self.cache = MISS
+        self.attempts = 0
+        self.error = None
+        self.queue_wait = _queue_wait.get()
+        self.dns = None
+        self.connect = None
+        self.ttfb = None
+        self.body = None
+        self.decode = None
+        self.total = None
+
+    def __repr__(self):
+        return f"<RequestEvent [{self.status} {self.cache}] {self.template} ({self.total or 0:.3f}s)>"
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    def add_timings(self, timings: Optional[dict]):
+        """Take the connection phases of the last attempt (see `AiohttpTransport`)"""
+        if timings:
+            for key in ('dns', 'connect', 'ttfb', 'body'):
+                setattr(self, key, timings.get(key))
+
+    def to_dict(self) -> dict:
+        data = {key: getattr(self, key) for key in self.__slots__}
+        data['error'] = None if self.error is None else repr(self.error)
+        data['retries'] = self.retries
+        return data
+
+
+class StageEvent:
+    """Duration of one processing stage ('parse', 'frame', or 'total' for a whole call)
+
+    `label` says what was processed (usually the url). JSON decoding is
+    reported as `RequestEvent.decode`
+    """
+    __slots__ = ['stage', 'label', 'seconds']
+
+    def __init__(self, stage: str, label: str, seconds: float):
+        self.stage = stage
+        self.label = label
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"<StageEvent {self.stage} {self.label} ({self.seconds:.3f}s)>"
+
+    def to_dict(self) -> dict:
+        return {'stage': self.stage, 'label': self.label, 'seconds': self.seconds}
+
+
+def subscribe(callback: Callable) -> Callable:
+    """Call `callback(event)` for every event (returns `callback`, so it works as a decorator)"""
+    global _subscribers
+    with _lock:
+        if callback not in _subscribers:
+            _subscribers = _subscribers + (callback,)
+    return callback
+
+
+def unsubscribe(callback: Callable):
+    """Stop calling `callback` (no-op if it isn't subscribed)"""
+    global _subscribers
+    with _lock:
+        _subscribers = tuple(cb for cb in _subscribers if cb is not callback)
+
+
+@contextlib.contextmanager
+def subscribed(callback: Callable):
+    """Subscribe `callback` for the duration of a `with` block"""
+    subscribe(callback)
+    try:
+        yield callback
+    finally:
+        unsubscribe(callback)
+
+
+def enabled() -> bool:
+    """Whether anything is subscribed"""
+    return bool(_subscribers)
+
+
+def emit(event):
+    for callback in _subscribers:
+        try:
+            callback(event)
+        except Exception as e:
+            warnings.warn(f"event subscriber {callback!r} raised {e!r}", RuntimeWarning)
+
+
+@contextlib.contextmanager
+def stage(name: str, label: str = None):
+    """Time the block and emit a `StageEvent` (does nothing without subscribers)"""
+    if not _subscribers:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit(StageEvent(name, label, time.perf_counter() - start))
+
+
+@contextlib.contextmanager
+def queue_wait(seconds: float):
+    """Used by the scheduler to hand the queue time of a request to its handler"""
+    token = _queue_wait.set(seconds)
+    try:
+        yield
+    finally:
+        _queue_wait.reset(token)
+
+
+def _ms(value) -> str:
+    return '-' if value is None else f"{value * 1000:.1f}ms"
+
+
+@contextlib.contextmanager
+def printing(enabled=True):
+    """Print every event of the block (`subscribed(print_event)`; no-op when not `enabled`)
+
+    Backs the `log=True` keyword of the functions that used to print their own timings
+    """
+    if not enabled or print_event in _subscribers:
+        yield
+        return
+    with subscribed(print_event):
+        yield
+
+
+def print_event(event):
+    """Subscriber that prints every event"""
+    if isinstance(event, StageEvent):
+        print(f"\n{event.stage}: {event.label}")
+        print(f"--- {event.seconds} seconds ---\n")
+        return
+    print(f"[{event.status} {event.cache}] {event.template}  "
+          f"queue={_ms(event.queue_wait)} dns={_ms(event.dns)} connect={_ms(event.connect)} "
+          f"ttfb={_ms(event.ttfb)} body={_ms(event.body)} decode={_ms(event.decode)} "
+          f"total={_ms(event.total)} bytes={event.bytes} retries={event.retries}")
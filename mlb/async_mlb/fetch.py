@@ -1,9 +1,27 @@
 import asyncio
-import aiohttp
-import nest_asyncio
-nest_asyncio.apply()
 
 import time
+import copy
+import random
+import datetime as dt
+from email.utils import parsedate_to_datetime
+from requests import Request
+
+from .scheduler import get_scheduler
+from .runner import run_sync
+from .transport import request, api_url, TRANSPORT_ERRORS
+from .deadline import DeadlineExceeded, remaining, partial_results
+from .breaker import CircuitOpenError, stale_fallback
+from . import events
+from .. import cache
+from .. import decoders
+from ..singleflight import get_singleflight
+
+RETRIES = 3                             # extra attempts after the first one
+BACKOFF_BASE = 0.5                      # seconds; doubled on every attempt
+BACKOFF_MAX = 30.0                      # upper bound for a single wait
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 def _determine_loop():
     try:
         return asyncio.get_event_loop()
@@ -13,38 +31,372 @@ def _determine_loop():
         return asyncio.get_event_loop()
 
 class FetchedResponse:
-    def __init__(self,_url,_headers,_json) -> None:
+    def __init__(self,_url,_headers,_json,_status=200,_from_cache=False,_stale=False) -> None:
         self.url: str = _url
         self.headers: dict = _headers
         self.json: dict = _json
+        self.status: int = _status
+        self.from_cache: bool = _from_cache
+        self.stale: bool = _stale        # expired cache entry served during an outage
+        self.index: int = None
+
+    def __repr__(self):
+        return f"<FetchedResponse [{self.status}{' stale' if self.stale else ''}] {self.url}>"
+
+    def __getitem__(self, key):
+        return self.json[key]
+
+    def get(self, key, default=None):
+        return self.json.get(key, default)
+
+class FetchFailure:
+    """A url that could not be retrieved (after retries)
+
+    Instances are falsy, so `[r for r in result if r]` keeps only the
+    successful responses
+    """
+    def __init__(self,_url,_status=None,_error=None,_attempts=1) -> None:
+        self.url: str = _url
+        self.status: int = _status
+        self.error: Exception = _error
+        self.attempts: int = _attempts
+        self.index: int = None
+
+    def __repr__(self):
+        reason = self.status if self.error is None else repr(self.error)
+        return f"<FetchFailure [{reason}] {self.url} (attempts: {self.attempts})>"
+
+    def __bool__(self):
+        return False
+
+class FetchResult(list):
+    """Responses in the same order as the requested urls
+
+    Slots for urls that failed hold a `FetchFailure` instead of a
+    `FetchedResponse`. Use `retry()` to request only the failed urls again.
+    """
+    @property
+    def ok(self) -> bool:
+        return all(self)
+
+    @property
+    def responses(self) -> list[FetchedResponse]:
+        return [r for r in self if r]
+
+    @property
+    def failures(self) -> list[FetchFailure]:
+        return [r for r in self if not r]
+
+    @property
+    def failed_urls(self) -> list[str]:
+        return [r.url for r in self if not r]
+
+    def merge(self, retried:list) -> "FetchResult":
+        """Fill the failed slots with the results of re-requesting `failed_urls`"""
+        retried = iter(retried)
+        for idx, r in enumerate(self):
+            if not r:
+                self[idx] = next(retried)
+        return self
+
+    @property
+    def expired(self) -> bool:
+        """Whether any url was cut off by a deadline"""
+        return any(isinstance(r.error,DeadlineExceeded) for r in self.failures)
+
+    def raise_for_failures(self):
+        """Raise `FetchError` if any url failed (`DeadlineExceeded` if a deadline cut it off)"""
+        if self.ok:
+            return
+        if self.expired:
+            raise DeadlineExceeded(self)
+        raise FetchError(self)
+
+    def retry(self, **kwargs) -> "FetchResult":
+        """Request the failed urls again (synchronously) and merge the results"""
+        if self.ok:
+            return self
+        kwargs['partial'] = True
+        return self.merge(runit(self.failed_urls,**kwargs))
+
+class FetchError(Exception):
+    """Raised when one or more urls failed and partial results weren't allowed
+
+    The partial `FetchResult` is available as the `result` attribute
+    """
+    def __init__(self, result:FetchResult):
+        self.result = result
+        failures = result.failures
+        super().__init__(f"{len(failures)} of {len(result)} requests failed: {failures[:3]}")
+
+def _retry_after(value) -> float:
+    """Parse a 'Retry-After' header (delta-seconds or an HTTP-date)"""
+    if value is None:
+        return None
+    try:
+        return max(float(value),0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max((retry_at - dt.datetime.now(dt.timezone.utc)).total_seconds(),0.0)
+    except (TypeError, ValueError):
+        return None
+
+def _backoff_delay(attempt:int,backoff:float,retry_after:float=None) -> float:
+    if retry_after is not None:
+        return min(retry_after,BACKOFF_MAX)
+    # "full jitter" exponential backoff
+    return random.uniform(0,min(BACKOFF_MAX,backoff * 2 ** (attempt - 1)))
+
+async def _get_json(url:str,retries:int,backoff:float,use_cache:bool=True):
+    event = events.RequestEvent(url)
+    start = time.perf_counter()
+    try:
+        result = await _fetch_json(url,retries,backoff,event,use_cache)
+    except BaseException as e:
+        event.error = e     # cancelled (e.g. by a deadline)
+        raise
+    else:
+        event.status = result.status
+        event.error = getattr(result,'error',None)
+        return result
+    finally:
+        if events.enabled():
+            event.total = time.perf_counter() - start
+            events.emit(event)
+
+async def _fetch_json(url:str,retries:int,backoff:float,event:events.RequestEvent,use_cache:bool=True):
+    # without the cache, the response is still stored to refresh the entry
+    cached = await cache.alookup(url,allow_stale=True) if use_cache else None
+    if cached is not None and cached.fresh:
+        event.cache = events.HIT
+        return FetchedResponse(cached.url,cached.headers,cached.json(),cached.status,True)
+    validators = cache.conditional_headers(cached)
 
-async def fetch(urls:list):
-    retrieved_responses = []
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            tasks.append(session.get(url, ssl=True))
-
-        responses = await asyncio.gather(*tasks)
-        
-        for response in responses:
-            resp_url = str(response.url)
-            resp_headers = dict(response.headers)
-            resp_json = await response.json()
-            
-            sync_resp = FetchedResponse(resp_url,resp_headers,resp_json)
-            
-            retrieved_responses.append(sync_resp)
-        
-        await session.close()
-    
+    attempt = 0
+    while True:
+        attempt += 1
+        event.attempts = attempt
+        status, error, retry_after = None, None, None
+        try:
+            response = await request(url,validators or None)
+            status = response.status
+            event.bytes += len(response.body)
+            event.add_timings(response.timings)
+            if status == 304 and cached is not None:
+                event.cache = events.REVALIDATED
+                cached = await cache.arevalidated(cached,response.headers)
+                return FetchedResponse(cached.url,cached.headers,cached.json(),cached.status,True)
+            if status == 304:
+                # not modified, but there is nothing cached to reuse
+                return FetchFailure(url,status,None,attempt)
+            if status < 400:
+                decode_start = time.perf_counter()
+                try:
+                    resp_json = decoders.loads(response.body)
+                except decoders.DECODE_ERRORS as e:
+                    # e.g. an HTML error page from a proxy; fails this url only
+                    return FetchFailure(url,status,e,attempt)
+                event.decode = time.perf_counter() - decode_start
+                await cache.astore(url,response.body,response.headers,status,resp_json)
+                return FetchedResponse(response.url,response.headers,resp_json,status)
+            retry_after = _retry_after(response.headers.get('Retry-After'))
+        except CircuitOpenError as e:
+            # fail fast (no retries); the last good payload beats nothing
+            if cached is not None and stale_fallback():
+                event.cache = events.STALE
+                return FetchedResponse(cached.url,cached.headers,cached.json(),cached.status,True,True)
+            return FetchFailure(url,None,e,attempt)
+        except TRANSPORT_ERRORS as e:
+            error = e
+
+        retryable = error is not None or status in RETRY_STATUSES
+        if not retryable or attempt > retries:
+            return FetchFailure(url,status,error,attempt)
+        await asyncio.sleep(_backoff_delay(attempt,backoff,retry_after))
+
+async def _getter(retries:int=None,backoff:float=None,use_cache:bool=True):
+    retries = RETRIES if retries is None else retries
+    backoff = BACKOFF_BASE if backoff is None else backoff
+    flights = get_singleflight()
+
+    async def _get(url):
+        # resolved first so the cache never mixes responses from different servers
+        url = api_url(url)
+        # callers bypassing the cache only share requests that bypass it too
+        key = ('fetch',url) if use_cache else ('fetch',url,'fresh')
+        return await flights.ado(key,lambda: _get_json(url,retries,backoff,use_cache))
+    return _get
+
+def _expired(url) -> FetchFailure:
+    return FetchFailure(url,_error=DeadlineExceeded())
+
+async def fetch(urls:list,retries:int=None,backoff:float=None,partial=False,deadline:float=None,use_cache=True) -> FetchResult:
+    """Fetch JSON for every url
+
+    Parameters:
+    -----------
+    urls : list
+        urls to request
+
+    retries : int, default `RETRIES`
+        extra attempts for connection errors and 429/5xx responses. Waits
+        use jittered exponential backoff and honor 'Retry-After'
+
+    backoff : float, default `BACKOFF_BASE`
+        base delay (seconds) for the backoff
+
+    partial : bool, default False
+        if True, failed urls are returned as `FetchFailure` entries in the
+        result. Otherwise a `FetchError` (carrying the partial result) is
+        raised
+
+    deadline : float, optional
+        seconds to wait (the active call deadline applies as well, see
+        `mlb.async_mlb.deadline`). Requests still outstanding then are
+        cancelled and fail with `DeadlineExceeded`, which is raised unless
+        partial results are allowed (by the call deadline if there is one,
+        otherwise by `partial`)
+
+    use_cache : bool, default True
+        if False, every url is requested from StatsAPI even when the
+        response cache holds a fresh copy (the new response still replaces
+        the cached one). For refreshing data that must be current
+
+    Identical urls requested concurrently (by this call or any other thread
+    or coroutine) share a single request and the same decoded response.
+    """
+    _get = await _getter(retries,backoff,use_cache)
+    timeout = remaining(deadline)
+    retrieved_responses = FetchResult(await get_scheduler().map(urls,_get,timeout=timeout,expired=_expired))
+
+    if retrieved_responses.expired and not partial_results(partial):
+        raise DeadlineExceeded(retrieved_responses)
+    if not (partial or partial_results()):
+        retrieved_responses.raise_for_failures()
     return retrieved_responses
 
-def runit(urls:list,**kwargs) -> list[FetchedResponse]:
-    start = time.time()
-    loop = _determine_loop()
-    retrieved = loop.run_until_complete(fetch(urls))
-    if kwargs.get("log",kwargs.get("logtime")):
-        print(f"--- {time.time() - start } seconds ---")
+async def as_completed(urls,retries:int=None,backoff:float=None,partial=False,window:int=None,deadline:float=None,use_cache=True):
+    """Async generator yielding responses in the order they finish
+
+    Each yielded `FetchedResponse` (or `FetchFailure`, with `partial=True`)
+    carries the position of its url in `urls` as `index`.
+
+    Parameters:
+    -----------
+    urls : iterable
+        urls to request. Consumed lazily, so a generator works too
+
+    retries, backoff, partial, use_cache
+        same as `fetch()`. Without `partial`, the first failure raises a
+        `FetchError` and the remaining requests are cancelled
+
+    window : int, default scheduler's `max_in_flight`
+        maximum number of requests started but not yet consumed. Memory use
+        is bounded by this many undelivered responses
+
+    deadline : float, optional
+        seconds to wait (see `fetch()`). Once it passes, the outstanding
+        requests are cancelled and `DeadlineExceeded` is raised, or with
+        partial results allowed, a failure is yielded for every url that
+        didn't arrive
+
+    """
+    _get = await _getter(retries,backoff,use_cache)
+    allow_expired = partial_results(partial)
+    partial = partial or partial_results()
+    timeout = remaining(deadline)
+    loop = asyncio.get_running_loop()
+    expires = None if timeout is None else loop.time() + timeout
+    scheduler = get_scheduler()
+    window = window or scheduler.max_in_flight
+    job = object()
+    pending = {}
+    queued = iter(enumerate(urls))
+
+    def _fill():
+        while len(pending) < window:
+            try:
+                idx, url = next(queued)
+            except StopIteration:
+                return
+            pending[scheduler.submit(_get,url,job=job)] = (idx,url)
+
+    try:
+        _fill()
+        while pending:
+            left = None if expires is None else max(expires - loop.time(),0)
+            done, _ = await asyncio.wait(list(pending),timeout=left,return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                if not allow_expired:
+                    raise DeadlineExceeded()
+                for future in pending:
+                    future.cancel()
+                for idx, url in [*sorted(pending.values()),*queued]:
+                    result = _expired(url)
+                    result.index = idx
+                    yield result
+                pending.clear()
+                return
+            for future in done:
+                idx, _ = pending.pop(future)
+                # responses may be shared with concurrent callers; tag a copy
+                result = copy.copy(future.result())
+                result.index = idx
+                if not partial and not result:
+                    raise FetchError(FetchResult([result]))
+                _fill()
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+async def _anext(agen):
+    return await agen.__anext__()
+
+def runit_as_completed(urls,**kwargs):
+    """Synchronous iterator over `as_completed()`"""
+    agen = as_completed(
+        urls,
+        retries=kwargs.get("retries"),
+        backoff=kwargs.get("backoff"),
+        partial=kwargs.get("partial",False),
+        window=kwargs.get("window"),
+        deadline=kwargs.get("deadline"),
+        use_cache=kwargs.get("use_cache",True))
+    try:
+        while True:
+            try:
+                yield run_sync(_anext(agen))
+            except StopAsyncIteration:
+                return
+    finally:
+        run_sync(agen.aclose())
+
+def runit(urls:list,**kwargs) -> FetchResult:
+    # `log=True` prints an event for every request and the total time
+    with events.printing(kwargs.get("log",kwargs.get("logtime"))), events.stage('total',f"fetch {len(urls)} urls"):
+        retrieved = run_sync(fetch(
+            urls,
+            retries=kwargs.get("retries"),
+            backoff=kwargs.get("backoff"),
+            partial=kwargs.get("partial",False),
+            deadline=kwargs.get("deadline"),
+            use_cache=kwargs.get("use_cache",True)))
 
     return retrieved
+
+async def get_json_async(url:str,params:dict=None,**kwargs) -> FetchedResponse:
+    """Fetch JSON for a single url (query parameters can be given as `params`)
+
+    Takes the same keyword arguments as `fetch()`; raises `FetchError` on
+    failure unless `partial=True`
+    """
+    if params:
+        url = Request("GET",url,params=params).prepare().url
+    return (await fetch([url],**kwargs))[0]
+
+def get_json(url:str,params:dict=None,**kwargs) -> FetchedResponse:
+    """Synchronous `get_json_async()`"""
+    return run_sync(get_json_async(url,params,**kwargs))
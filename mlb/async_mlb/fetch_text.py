@@ -2,39 +2,37 @@ import lxml
 import asyncio
 import aiohttp
 from bs4 import BeautifulSoup as bs
-import nest_asyncio
-nest_asyncio.apply()
 
-import time
 # import pandas as pd
 
+from .runner import run_sync
+from .transport import request
+from .deadline import DeadlineExceeded, remaining
+from . import events
+
 async def fetch(urls:list):
     retrieved_responses = []
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            tasks.append(session.get(url, ssl=True))
+    tasks = []
+    for url in urls:
+        tasks.append(request(url))
 
-        responses = await asyncio.gather(*tasks)
+    try:
+        responses = await asyncio.wait_for(asyncio.gather(*tasks),remaining())
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded() from None
+    
+    for response in responses:
         
-        for response in responses:
-            
-            resp = await response.text()
+        resp = response.text
 
-            retrieved_responses.append(resp)
-        
-        await session.close()
+        retrieved_responses.append(resp)
     
     return retrieved_responses
 
 def runit(urls:list,_log=False):
-    start = time.time()
     # retrieved = asyncio.run(fetch(urls))
 
-    loop = asyncio.get_event_loop()
-    retrieved = loop.run_until_complete(fetch(urls))
-    
-    if _log is True:
-        print(f"--- {time.time() - start } seconds ---")
+    with events.printing(_log is True), events.stage('total',f"fetch_text {len(urls)} urls"):
+        retrieved = run_sync(fetch(urls))
 
     return retrieved
@@ -0,0 +1,235 @@
+"""Request planning: merge compatible StatsAPI urls into fewer requests
+
+Bulk builders like `Team` ask for the same resource many times with
+slightly different parameters (one roster request per stat type/group,
+one team-stats request per group, one schedule request per month). The
+planner merges such urls into a single request and splits the merged
+response back into the payload each original url would have returned, so
+the parsers downstream don't know the difference.
+
+Merge rules (urls only merge when everything else about them is equal):
+
+- roster `hydrate=person(stats(type=[...],group=[...],...))`: the type and
+  group lists are unioned; person stats are split back by (type, group)
+- `group=a` on `/stats` endpoints: groups are joined; `stats` entries are
+  split back by group
+- `startDate`/`endDate` on `/schedule`: contiguous ranges are joined;
+  `dates` are split back by range
+"""
+import re
+import datetime as dt
+from typing import Optional
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+# left unescaped in rebuilt queries, as in the urls the builders write by hand
+_SAFE = "(),[]=:"
+
+_ROSTER_STATS = re.compile(r'^person\(stats\(type=\[([^\]]*)\],group=\[([^\]]*)\](.*)\)\)$')
+
+
+class _Url:
+    __slots__ = ['url', 'base', 'params']
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.url = url
+        self.base = url.split('?', 1)[0]
+        self.params = parse_qsl(parts.query, keep_blank_values=True)
+
+    def get(self, key: str) -> Optional[str]:
+        for k, v in self.params:
+            if k == key:
+                return v
+        return None
+
+    def others(self, *keys) -> tuple:
+        return tuple((k, v) for k, v in self.params if k not in keys)
+
+    def replace(self, **values) -> str:
+        """The url with some parameter values swapped (values are re-encoded)"""
+        query = urlencode([(k, values.get(k, v)) for k, v in self.params], safe=_SAFE)
+        return f"{self.base}?{query}"
+
+
+def _union(lists) -> list:
+    merged = []
+    for items in lists:
+        for i in items:
+            if i not in merged:
+                merged.append(i)
+    return merged
+
+
+# --- roster stat hydrations -------------------------------------------------
+
+def _roster_key(u: _Url):
+    if '/roster/' not in u.base:
+        return None
+    m = _ROSTER_STATS.match(u.get('hydrate') or '')
+    if m is None:
+        return None
+    return ('roster', u.base, u.others('hydrate'), m.group(3))
+
+
+def _roster_merge(group: list) -> tuple:
+    matches = [_ROSTER_STATS.match(u.get('hydrate')) for u in group]
+    types = _union(m.group(1).split(',') for m in matches)
+    groups = _union(m.group(2).split(',') for m in matches)
+    hydrate = f"person(stats(type=[{','.join(types)}],group=[{','.join(groups)}]{matches[0].group(3)}))"
+    selectors = [(set(m.group(1).split(',')), set(m.group(2).split(','))) for m in matches]
+    return group[0].replace(hydrate=hydrate), selectors
+
+
+def _roster_split(data: dict, selector) -> dict:
+    types, groups = selector
+    roster = []
+    for entry in data.get('roster', []):
+        person = entry.get('person', {})
+        if 'stats' in person:
+            stats = [s for s in person['stats']
+                     if s.get('type', {}).get('displayName') in types and s.get('group', {}).get('displayName') in groups]
+            person = {**person, 'stats': stats}
+        roster.append({**entry, 'person': person})
+    return {**data, 'roster': roster}
+
+
+# --- stat groups -------------------------------------------------------------
+
+def _group_key(u: _Url):
+    if not u.base.endswith('/stats') or u.get('group') is None:
+        return None
+    return ('group', u.base, u.others('group'))
+
+
+def _group_merge(group: list) -> tuple:
+    groups = [u.get('group').split(',') for u in group]
+    return group[0].replace(group=','.join(_union(groups))), [set(g) for g in groups]
+
+
+def _group_split(data: dict, selector) -> dict:
+    if 'stats' not in data:
+        return data
+    return {**data, 'stats': [s for s in data['stats'] if s.get('group', {}).get('displayName') in selector]}
+
+
+# --- schedule date ranges ----------------------------------------------------
+
+def _date(value: str) -> dt.date:
+    return dt.datetime.strptime(value, r"%Y-%m-%d").date()
+
+
+def _schedule_key(u: _Url):
+    if not u.base.endswith('/schedule') or u.get('startDate') is None or u.get('endDate') is None:
+        return None
+    try:
+        _date(u.get('startDate')), _date(u.get('endDate'))
+    except ValueError:
+        return None
+    return ('schedule', u.base, u.others('startDate', 'endDate'))
+
+
+def _schedule_merge(group: list) -> tuple:
+    ranges = [(_date(u.get('startDate')), _date(u.get('endDate'))) for u in group]
+    start, end = min(r[0] for r in ranges), max(r[1] for r in ranges)
+    url = group[0].replace(startDate=start.strftime(r"%Y-%m-%d"), endDate=end.strftime(r"%Y-%m-%d"))
+    return url, ranges
+
+
+# top-level schedule counts; each is the sum of the same count over `dates`
+_SCHEDULE_TOTALS = ('totalItems', 'totalEvents', 'totalGames', 'totalGamesInProgress')
+
+
+def _schedule_split(data: dict, selector) -> dict:
+    start, end = selector
+    # dates are kept whole, so their own totals still hold
+    dates = [d for d in data.get('dates', []) if start <= _date(d['date']) <= end]
+    split = {k: v for k, v in data.items() if k not in _SCHEDULE_TOTALS}
+    split['dates'] = dates
+    for key in _SCHEDULE_TOTALS:
+        if key == 'totalGames':
+            split[key] = sum(len(d.get('games', [])) for d in dates)
+        elif key in data and all(key in d for d in dates):
+            split[key] = sum(d[key] for d in dates)
+    return split
+
+
+def _schedule_runs(members: list) -> list:
+    """Split (index, url) pairs into runs whose date ranges touch or overlap"""
+    ordered = sorted(members, key=lambda m: _date(m[1].get('startDate')))
+    runs, run_end = [], None
+    for i, u in ordered:
+        start, end = _date(u.get('startDate')), _date(u.get('endDate'))
+        if runs and start <= run_end + dt.timedelta(days=1):
+            runs[-1].append((i, u))
+            run_end = max(run_end, end)
+        else:
+            runs.append([(i, u)])
+            run_end = end
+    return runs
+
+
+def _single_run(members: list) -> list:
+    return [members]
+
+
+# (key, runs, merge, split) per rule; `runs` decides which grouped urls can share one request
+RULES = [
+    (_roster_key, _single_run, _roster_merge, _roster_split),
+    (_group_key, _single_run, _group_merge, _group_split),
+    (_schedule_key, _schedule_runs, _schedule_merge, _schedule_split),
+]
+
+
+class RequestPlan:
+    """Merged requests for a list of urls
+
+    `urls` are the requests to send; `split(payloads)` takes their decoded
+    payloads (same order, None for requests that failed) and returns one
+    payload per original url, in the original order.
+    """
+    def __init__(self, urls: list):
+        self.original = list(urls)
+        self.urls = []
+        self._parts = [None] * len(self.original)     # (request index, split, selector) per original url
+        groups = {}
+
+        for i, url in enumerate(self.original):
+            u = _Url(url)
+            for rule in RULES:
+                key = rule[0](u)
+                if key is not None:
+                    groups.setdefault(key, (rule, []))[1].append((i, u))
+                    break
+            else:
+                self._parts[i] = (self._add(url), None, None)
+
+        for (_, runs, merge, split), members in groups.values():
+            for run in runs(members):
+                if len(run) == 1:
+                    i, u = run[0]
+                    self._parts[i] = (self._add(u.url), None, None)
+                    continue
+                url, selectors = merge([u for _, u in run])
+                index = self._add(url)
+                for (i, _), selector in zip(run, selectors):
+                    self._parts[i] = (index, split, selector)
+
+    def __repr__(self):
+        return f"<RequestPlan {len(self.original)} urls -> {len(self.urls)} requests>"
+
+    def _add(self, url: str) -> int:
+        self.urls.append(url)
+        return len(self.urls) - 1
+
+    def split(self, payloads: list) -> list:
+        """One payload per original url (None where the merged payload is None)"""
+        results = []
+        for index, split, selector in self._parts:
+            data = payloads[index]
+            results.append(data if split is None or data is None else split(data, selector))
+        return results
+
+
+def plan_requests(urls) -> RequestPlan:
+    """Plan the fewest requests that cover `urls`"""
+    return RequestPlan(urls)
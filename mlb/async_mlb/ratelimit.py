@@ -0,0 +1,282 @@
+"""Token-bucket rate limiting for outgoing requests
+
+Every request that reaches the transport first takes a token from the
+active `RateLimiter` (cache hits never do). Buckets refill at `rate` tokens
+per second up to `burst`; a request that finds the bucket empty reserves
+the next token and sleeps until it's due, so waiting requests are served
+in order and the budget is never exceeded. A request cancelled while it
+waits (e.g. by a deadline) gives its token back.
+
+The default buckets live in memory and are shared by every thread and
+event loop of the process. `FileTokenBucket` keeps the bucket in a small
+file guarded by an OS file lock, so several processes pointed at the same
+path share one global budget:
+
+```
+mlb.configure_rate_limit(rate=10, burst=20, per_class={'live': 2}, path='/tmp/mlb-rate')
+```
+
+or, for worker processes, set MLB_RATE_LIMIT (requests/second),
+MLB_RATE_LIMIT_BURST and MLB_RATE_LIMIT_FILE in the environment.
+"""
+import os
+import time
+import struct
+import asyncio
+import threading
+from typing import Optional, Union
+
+from ..endpoints import endpoint_class
+
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenBucket:
+    """In-process token bucket (thread-safe)
+
+    Parameters:
+    -----------
+    rate : float
+        tokens added per second
+
+    burst : float, optional
+        bucket capacity (defaults to `rate`, i.e. one second worth)
+
+    """
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self.burst
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} rate={self.rate:g}/s burst={self.burst:g}>"
+
+    def reserve(self) -> float:
+        """Take a token; returns how many seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self):
+        """Give back a token reserved for a request that was never sent"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    async def _reserve(self) -> float:
+        return self.reserve()
+
+    async def acquire(self):
+        delay = await self._reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket shared across processes through a lock-guarded file
+
+    The file holds the token count and the time of the last update; every
+    reservation locks it, refills, takes a token and writes it back. On the
+    event loop the lock is only tried (never waited for), and retried after
+    a short sleep while another process holds it.
+
+    Parameters:
+    -----------
+    path : str
+        state file (created if missing); every process using the same path
+        shares the budget
+
+    rate : float
+
+    burst : float, optional
+
+    """
+    _STATE = struct.Struct('dd')
+    _RETRY = 0.001          # first wait for a busy lock file (doubled up to _RETRY_MAX)
+    _RETRY_MAX = 0.05
+
+    def __init__(self, path: str, rate: float, burst: Optional[float] = None):
+        super().__init__(rate, burst)
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._refunds = set()
+
+    def __repr__(self):
+        return f"<FileTokenBucket {self.path} rate={self.rate:g}/s burst={self.burst:g}>"
+
+    def _lock_file(self, blocking=True) -> bool:
+        """Lock the state file; without `blocking`, returns False if it's busy"""
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            if blocking:
+                raise
+            return False
+        return True
+
+    def _unlock_file(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def _update(self, change: float, blocking=True) -> Optional[float]:
+        """Refill, add `change` tokens and return the new count (None if the file was busy)"""
+        with self._lock:
+            if not self._lock_file(blocking):
+                return None
+            try:
+                now = time.time()
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                raw = os.read(self._fd, self._STATE.size)
+                if len(raw) == self._STATE.size:
+                    tokens, stamp = self._STATE.unpack(raw)
+                    tokens = min(self.burst, tokens + max(0.0, now - stamp) * self.rate)
+                else:
+                    tokens = self.burst
+                tokens = min(self.burst, tokens + change)
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, self._STATE.pack(tokens, now))
+            finally:
+                self._unlock_file()
+        return tokens
+
+    async def _update_async(self, change: float) -> float:
+        wait = self._RETRY
+        while True:
+            tokens = self._update(change, blocking=False)
+            if tokens is not None:
+                return tokens
+            await asyncio.sleep(wait)
+            wait = min(wait * 2, self._RETRY_MAX)
+
+    def reserve(self) -> float:
+        tokens = self._update(-1)
+        return 0.0 if tokens >= 0 else -tokens / self.rate
+
+    async def _reserve(self) -> float:
+        tokens = await self._update_async(-1)
+        return 0.0 if tokens >= 0 else -tokens / self.rate
+
+    def refund(self):
+        if self._update(1, blocking=False) is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._update(1)
+            return
+        # the file is busy; finish the refund in the background
+        task = loop.create_task(self._update_async(1))
+        self._refunds.add(task)
+        task.add_done_callback(self._refunds.discard)
+
+    def close(self):
+        os.close(self._fd)
+
+
+def _bucket(rate: Union[float, tuple], burst: Optional[float], path: Optional[str]) -> TokenBucket:
+    if isinstance(rate, tuple):
+        rate, burst = rate
+    if path is not None:
+        return FileTokenBucket(path, rate, burst)
+    return TokenBucket(rate, burst)
+
+
+class RateLimiter:
+    """Global token bucket plus optional per-endpoint-class buckets
+
+    Parameters:
+    -----------
+    rate : float, optional
+        requests/second for all requests combined (None for no global limit)
+
+    burst : float, optional
+        capacity of the global bucket
+
+    per_class : dict, optional
+        endpoint class (see `mlb.endpoints.ENDPOINT_CLASSES`) -> rate, or
+        (rate, burst). A request takes a token from its class bucket and
+        from the global one
+
+    path : str, optional
+        share the buckets across processes through files at `path` (class
+        buckets use `path.<class>`)
+
+    """
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None,
+                 per_class: Optional[dict] = None, path: Optional[str] = None):
+        self.path = path
+        self.bucket = _bucket(rate, burst, path) if rate else None
+        self.class_buckets = {}
+        for cls, cls_rate in (per_class or {}).items():
+            self.class_buckets[cls] = _bucket(cls_rate, None, f"{path}.{cls}" if path else None)
+
+    def __repr__(self):
+        return f"<RateLimiter global={self.bucket} classes={self.class_buckets}>"
+
+    async def acquire(self, url: str):
+        """Wait until a request to `url` fits in the budget"""
+        bucket = self.class_buckets.get(endpoint_class(url)) if self.class_buckets else None
+        if bucket is not None:
+            await bucket.acquire()
+        if self.bucket is not None:
+            try:
+                await self.bucket.acquire()
+            except asyncio.CancelledError:
+                if bucket is not None:
+                    bucket.refund()
+                raise
+
+    def close(self):
+        for bucket in [self.bucket, *self.class_buckets.values()]:
+            if isinstance(bucket, FileTokenBucket):
+                bucket.close()
+
+
+def _from_env() -> Optional[RateLimiter]:
+    rate = os.environ.get('MLB_RATE_LIMIT')
+    if not rate:
+        return None
+    burst = os.environ.get('MLB_RATE_LIMIT_BURST')
+    return RateLimiter(float(rate), float(burst) if burst else None, path=os.environ.get('MLB_RATE_LIMIT_FILE') or None)
+
+
+_limiter: Optional[RateLimiter] = _from_env()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """The active `RateLimiter` (None when requests aren't limited)"""
+    return _limiter
+
+
+def configure_rate_limit(rate: Optional[float] = None, burst: Optional[float] = None,
+                         per_class: Optional[dict] = None, path: Optional[str] = None) -> Optional[RateLimiter]:
+    """Limit outgoing requests (call without arguments to turn limiting off)
+
+    Takes the same parameters as `RateLimiter`
+    """
+    global _limiter
+    if _limiter is not None:
+        _limiter.close()
+    _limiter = RateLimiter(rate, burst, per_class, path) if (rate or per_class) else None
+    return _limiter
@@ -0,0 +1,225 @@
+"""Record/replay of HTTP traffic
+
+`record()` wraps the active transport and captures every request that goes
+through it (`fetch`, `fetch_text`, `get_json` and therefore the classes,
+the functions and `updatedb`) into a fixture archive. `replay()` serves
+those fixtures back without touching the network, optionally with
+artificial latency, so runs can be profiled offline and reproducibly:
+
+```
+import mlb
+
+with mlb.record_fixtures('fixtures/team.jsonl.gz'):
+    mlb.Team(145, 2022)
+
+with mlb.replay_fixtures('fixtures/team.jsonl.gz', latency=0.05):
+    mlb.Team(145, 2022)
+```
+
+The archive is gzipped JSON lines: a header line followed by one line per
+response (url, status, a handful of headers and the body). Both context
+managers turn the response cache off while they're active so that every
+request is captured/served by the archive.
+"""
+import gzip
+import json
+import time
+import zlib
+import base64
+import asyncio
+import contextlib
+from typing import Optional
+
+from .transport import Transport
+from .transport import RawResponse
+from .transport import get_transport
+from .transport import use_transport
+from .. import cache
+
+FORMAT_VERSION = 1
+
+# response headers worth keeping (the rest only bloats the archive)
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Age', 'Retry-After')
+
+
+class ReplayMiss(LookupError):
+    """Raised by a strict `ReplayTransport` for a url that was never recorded"""
+
+
+def _entry(response: RawResponse) -> dict:
+    headers = {k: v for k, v in response.headers.items() if k.title() in KEPT_HEADERS}
+    entry = {'url': response.url, 'status': response.status, 'headers': headers}
+    try:
+        entry['body'] = response.body.decode('utf-8')
+    except UnicodeDecodeError:
+        entry['body64'] = base64.b64encode(response.body).decode('ascii')
+    return entry
+
+
+def _response(url: str, entry: dict) -> RawResponse:
+    if 'body64' in entry:
+        body = base64.b64decode(entry['body64'])
+    else:
+        body = entry['body'].encode('utf-8')
+    return RawResponse(url, entry['status'], dict(entry['headers']), body)
+
+
+def save_archive(path: str, entries: list):
+    """Write recorded entries to a fixture archive"""
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps({'version': FORMAT_VERSION, 'created': time.time(), 'responses': len(entries)}) + '\n')
+        for entry in entries:
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+
+def load_archive(path: str) -> list:
+    """Read the entries of a fixture archive"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"unsupported fixture archive version: {header.get('version')}")
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class RecordingTransport(Transport):
+    """Pass requests through to another transport and keep the responses
+
+    Parameters:
+    -----------
+    inner : Transport, optional
+        transport that performs the requests (default: the active one)
+
+    """
+    def __init__(self, inner: Optional[Transport] = None):
+        self.inner = inner or get_transport()
+        self.entries = []
+
+    def __repr__(self):
+        return f"<RecordingTransport responses={len(self.entries)} inner={self.inner!r}>"
+
+    async def get(self, url: str, headers: Optional[dict] = None) -> RawResponse:
+        response = await self.inner.get(url, headers)
+        entry = _entry(response)
+        # index by the requested url (the final url may differ after redirects)
+        entry['url'] = url
+        self.entries.append(entry)
+        return response
+
+    async def close(self):
+        await self.inner.close()
+
+    def save(self, path: str):
+        save_archive(path, self.entries)
+
+
+class ReplayTransport(Transport):
+    """Serve responses from a fixture archive
+
+    A url recorded several times is replayed in the recorded order (the last
+    response repeats once they run out), so sequences like a live feed
+    being polled play back exactly as they happened.
+
+    Parameters:
+    -----------
+    source : str or list
+        path of a fixture archive, or a list of recorded entries
+
+    latency : float, default 0
+        seconds to wait before every response
+
+    jitter : float, default 0
+        extra random delay of up to `jitter` seconds. The delay is derived
+        from the url and `seed`, so it is the same on every run
+
+    seed : int, default 0
+
+    strict : bool, default True
+        raise `ReplayMiss` for urls missing from the archive (otherwise
+        they get a 404)
+
+    """
+    def __init__(self, source, latency: float = 0.0, jitter: float = 0.0, seed: int = 0, strict=True):
+        entries = load_archive(source) if isinstance(source, str) else source
+        self.responses = {}
+        for entry in entries:
+            self.responses.setdefault(entry['url'], []).append(entry)
+        self.latency = latency
+        self.jitter = jitter
+        self.seed = seed
+        self.strict = strict
+        self.requests = []
+        self._served = {}
+
+    def __repr__(self):
+        return f"<ReplayTransport urls={len(self.responses)} requests={len(self.requests)} latency={self.latency}>"
+
+    def _delay(self, url: str, n: int) -> float:
+        if not self.jitter:
+            return self.latency
+        fraction = zlib.crc32(f"{self.seed}:{n}:{url}".encode()) / 0xFFFFFFFF
+        return self.latency + self.jitter * fraction
+
+    async def get(self, url: str, headers: Optional[dict] = None) -> RawResponse:
+        self.requests.append((url, dict(headers or {})))
+        n = self._served.get(url, 0)
+        self._served[url] = n + 1
+        delay = self._delay(url, n)
+        await asyncio.sleep(delay)
+
+        recorded = self.responses.get(url)
+        if not recorded:
+            if self.strict:
+                raise ReplayMiss(f"no recorded response for {url}")
+            return RawResponse(url, 404, {}, b'{"message": "Object not found"}')
+        return _response(url, recorded[min(n, len(recorded) - 1)])
+
+    @property
+    def misses(self) -> list:
+        return [url for url, _ in self.requests if url not in self.responses]
+
+
+@contextlib.contextmanager
+def _cache_disabled(disable: bool):
+    previous = cache.configure()['enabled']
+    if disable:
+        cache.configure(enabled=False)
+    try:
+        yield
+    finally:
+        cache.configure(enabled=previous)
+
+
+@contextlib.contextmanager
+def record(path: str, transport: Optional[Transport] = None, use_cache=False):
+    """Record every request made inside the block to the archive at `path`
+
+    Parameters:
+    -----------
+    path : str
+        where to write the archive (written when the block exits)
+
+    transport : Transport, optional
+        transport that performs the requests (default: the active one)
+
+    use_cache : bool, default False
+        keep the response cache on (cache hits won't be recorded)
+
+    """
+    recorder = RecordingTransport(transport)
+    with _cache_disabled(not use_cache), use_transport(recorder):
+        try:
+            yield recorder
+        finally:
+            recorder.save(path)
+
+
+@contextlib.contextmanager
+def replay(path: str, latency: float = 0.0, jitter: float = 0.0, seed: int = 0, strict=True, use_cache=False):
+    """Serve every request made inside the block from the archive at `path`
+
+    Takes the same parameters as `ReplayTransport`; `use_cache` keeps the
+    response cache on
+    """
+    replayer = ReplayTransport(path, latency=latency, jitter=jitter, seed=seed, strict=strict)
+    with _cache_disabled(not use_cache), use_transport(replayer):
+        yield replayer
@@ -0,0 +1,85 @@
+"""Background event loop for the synchronous API
+
+The synchronous functions and classes are thin wrappers around coroutines.
+Rather than patching whatever loop the caller has (nest_asyncio) and driving
+it with `run_until_complete`, the coroutines are submitted to a single
+event loop that runs in a daemon thread. Callers on any thread simply block
+on the result, and the shared aiohttp session/scheduler of that loop is
+reused by every synchronous call in the process.
+
+Code that already runs inside an event loop should use `mlb.aio` instead,
+which runs the same coroutines natively on the caller's loop.
+"""
+import atexit
+import asyncio
+import functools
+import threading
+
+from .deadline import with_deadline
+
+_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop = None
+_thread: threading.Thread = None
+
+
+def _serve(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+    asyncio.set_event_loop(loop)
+    loop.call_soon(ready.set)
+    loop.run_forever()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """The background event loop (started on first use)"""
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed() or not _thread.is_alive():
+            ready = threading.Event()
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_serve, args=(_loop, ready), name="mlb-event-loop", daemon=True)
+            _thread.start()
+            ready.wait()
+        return _loop
+
+
+def run_sync(coro):
+    """Run a coroutine on the background loop and block until it's done"""
+    if _thread is not None and threading.current_thread() is _thread:
+        coro.close()
+        raise RuntimeError(
+            "a synchronous mlb function was called from inside the library's event loop; "
+            "await its `mlb.aio` counterpart instead")
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+def syncable(async_fn):
+    """Decorator turning a coroutine function into a blocking function
+
+    The coroutine function stays available as the `aio` attribute. Both
+    accept a `deadline` keyword (seconds for the whole call, see
+    `mlb.async_mlb.deadline`)
+    """
+    @functools.wraps(async_fn)
+    async def aio(*args, deadline=None, **kwargs):
+        return await with_deadline(async_fn(*args, **kwargs), deadline)
+
+    @functools.wraps(async_fn)
+    def wrapper(*args, deadline=None, **kwargs):
+        return run_sync(with_deadline(async_fn(*args, **kwargs), deadline))
+    wrapper.aio = aio
+    return wrapper
+
+
+def _shutdown():
+    from .session import close_session
+    loop = _loop
+    if loop is None or loop.is_closed() or not _thread.is_alive():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(close_session(), loop).result(timeout=5)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    _thread.join(timeout=5)
+
+
+atexit.register(_shutdown)
@@ -0,0 +1,257 @@
+"""Bounded-concurrency request scheduler
+
+Bulk paths (standings, yby records, coaching rosters, franchise history...)
+can generate hundreds or thousands of requests at once. Rather than handing
+them all to `asyncio.gather`, they're queued here and started only while
+there is room under both the global in-flight cap and the per-host cap.
+
+Queues are kept per job (one job per `RequestScheduler.map` call by default)
+and are served round-robin, so a 3000-request coaches update can't starve a
+20-request `Person` build that arrives while it's running.
+"""
+import time
+import asyncio
+import weakref
+from collections import OrderedDict, defaultdict, deque
+from urllib.parse import urlparse
+
+from .events import queue_wait
+
+_DEFAULTS = {
+    'max_in_flight': 64,    # requests in flight across all hosts
+    'per_host': 16,         # requests in flight to a single host
+}
+
+_config = dict(_DEFAULTS)
+
+# event loop -> RequestScheduler
+_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop,RequestScheduler]" = weakref.WeakKeyDictionary()
+
+
+class _QueuedRequest:
+    __slots__ = ['url','host','handler','future','task','queued_at']
+    def __init__(self, url, handler, future):
+        self.url = url
+        self.host = urlparse(str(url)).netloc
+        self.handler = handler
+        self.future: asyncio.Future = future
+        self.task = None
+        self.queued_at = time.perf_counter()
+
+
+class RequestScheduler:
+    """Fair, bounded-concurrency scheduler for a single event loop
+
+    Parameters:
+    -----------
+    max_in_flight : int, default 64
+        maximum number of requests running at once (all hosts combined)
+
+    per_host : int, default 16
+        maximum number of requests running at once against a single host
+
+    """
+    def __init__(self, max_in_flight=None, per_host=None):
+        self.max_in_flight = max_in_flight or _config['max_in_flight']
+        self.per_host = per_host or _config['per_host']
+        self._queues: "OrderedDict[object,deque[_QueuedRequest]]" = OrderedDict()
+        self._host_in_flight = defaultdict(int)
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._busy_seconds = 0.0
+        self._busy_since = None
+        self.last_run = None
+
+    def __repr__(self):
+        return f"<RequestScheduler in_flight={self._in_flight}/{self.max_in_flight} queued={self.queued}>"
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    def submit(self, handler, url, job=None) -> asyncio.Future:
+        """Queue `handler(url)` and return a future for its result
+
+        `handler` must be a coroutine function that performs the request AND
+        reads the response body, so that the slot isn't released while the
+        connection is still in use.
+        """
+        future = asyncio.get_running_loop().create_future()
+        item = _QueuedRequest(url, handler, future)
+        future.add_done_callback(lambda f, item=item: self._on_done(f, item))
+        self._queues.setdefault(job, deque()).append(item)
+        self._dispatch()
+        return future
+
+    async def map(self, urls, handler, job=None, timeout=None, expired=None) -> list:
+        """Run `handler(url)` for every url and return the results in order
+
+        Parameters:
+        -----------
+        urls : iterable
+            urls to request
+
+        handler : coroutine function
+            called with each url; its return value becomes the result
+
+        job : hashable, optional
+            queue to place the requests in. Requests in different jobs are
+            served round-robin. By default each call gets its own job
+
+        timeout : float, optional
+            seconds to wait; requests still queued or running after that are
+            cancelled and their results replaced by `expired(url)`
+
+        expired : callable, optional
+            called with the url of every cancelled request (default: None)
+
+        """
+        job = object() if job is None else job
+        start = time.time()
+        urls = list(urls)
+        futures = [self.submit(handler, url, job=job) for url in urls]
+        try:
+            if timeout is None:
+                results = await asyncio.gather(*futures)
+            else:
+                results = await self._gather_until(urls, futures, timeout, expired)
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
+
+        elapsed = time.time() - start
+        self.last_run = {
+            'requests': len(futures),
+            'seconds': elapsed,
+            'requests_per_second': len(futures) / elapsed if elapsed else 0.0,
+        }
+        return list(results)
+
+    async def _gather_until(self, urls, futures, timeout, expired) -> list:
+        if futures:
+            await asyncio.wait(futures, timeout=timeout)
+        results = []
+        for url, f in zip(urls, futures):
+            if f.done():
+                results.append(f.result())
+            else:
+                f.cancel()
+                results.append(expired(url) if expired is not None else None)
+        return results
+
+    def stats(self) -> dict:
+        """Counters and overall throughput (completed requests per busy second)"""
+        busy = self._busy_seconds
+        if self._busy_since is not None:
+            busy += time.time() - self._busy_since
+        return {
+            'in_flight': self._in_flight,
+            'queued': self.queued,
+            'completed': self._completed,
+            'failed': self._failed,
+            'busy_seconds': busy,
+            'requests_per_second': self._completed / busy if busy else 0.0,
+            'last_run': self.last_run,
+        }
+
+    def _dispatch(self):
+        while self._in_flight < self.max_in_flight and self._queues:
+            started = False
+            # one request per job per pass -> round-robin between jobs
+            for job in list(self._queues):
+                if self._in_flight >= self.max_in_flight:
+                    break
+                queue = self._queues[job]
+                while queue and queue[0].future.done():
+                    queue.popleft()
+                if not queue:
+                    del self._queues[job]
+                    continue
+                if self._host_in_flight[queue[0].host] >= self.per_host:
+                    continue
+                item = queue.popleft()
+                if queue:
+                    self._queues.move_to_end(job)
+                else:
+                    del self._queues[job]
+                self._start(item)
+                started = True
+            if not started:
+                break
+
+    def _start(self, item: _QueuedRequest):
+        if self._in_flight == 0:
+            self._busy_since = time.time()
+        self._in_flight += 1
+        self._host_in_flight[item.host] += 1
+        item.task = asyncio.ensure_future(self._run(item))
+
+    async def _run(self, item: _QueuedRequest):
+        try:
+            with queue_wait(time.perf_counter() - item.queued_at):
+                result = await item.handler(item.url)
+        except asyncio.CancelledError:
+            item.future.cancel()
+            raise
+        except Exception as e:
+            self._failed += 1
+            if not item.future.done():
+                item.future.set_exception(e)
+        else:
+            if not item.future.done():
+                item.future.set_result(result)
+        finally:
+            self._completed += 1
+            self._in_flight -= 1
+            self._host_in_flight[item.host] -= 1
+            if self._in_flight == 0 and self._busy_since is not None:
+                self._busy_seconds += time.time() - self._busy_since
+                self._busy_since = None
+            self._dispatch()
+
+    def _on_done(self, future: asyncio.Future, item: _QueuedRequest):
+        if future.cancelled() and item.task is not None and not item.task.done():
+            item.task.cancel()
+
+
+def configure_scheduler(**kwargs) -> dict:
+    """Set the limits used by the shared schedulers
+
+    Parameters:
+    -----------
+    max_in_flight : int, default 64
+        maximum number of requests running at once (all hosts combined)
+
+    per_host : int, default 16
+        maximum number of requests running at once against a single host
+
+    Returns the active configuration
+    """
+    for key, value in kwargs.items():
+        if key not in _DEFAULTS:
+            raise TypeError(f"configure_scheduler() got an unexpected keyword argument '{key}'")
+        _config[key] = value
+    for scheduler in _schedulers.values():
+        scheduler.max_in_flight = _config['max_in_flight']
+        scheduler.per_host = _config['per_host']
+    return dict(_config)
+
+
+def get_scheduler(loop=None) -> RequestScheduler:
+    """Get the shared scheduler for an event loop (defaults to the current one)"""
+    if loop is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = asyncio.get_event_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = RequestScheduler()
+        _schedulers[loop] = scheduler
+    return scheduler
@@ -1,8 +1,9 @@
-import asyncio
-import aiohttp
 import pandas as pd
 # import time
 
+from .runner import run_sync
+from .fetch import fetch
+
 BASE = "https://statsapi.mlb.com/api/v1"
 
 start = 1901
@@ -227,18 +228,15 @@ async def parse_schedule(response):
 async def update_game_logs(start,end,save_as):
     all_records = []
     hydrations = "decisions,gameInfo,venue,linescore,weather,series"
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for season in range(start,end+1):
-            url = BASE + f"/schedule?&hydrate={hydrations}&season={season}&sportId=1"
-            tasks.append(session.get(url, ssl=False))
+    urls = []
+    for season in range(start,end+1):
+        urls.append(BASE + f"/schedule?&hydrate={hydrations}&season={season}&sportId=1")
 
-        responses = await asyncio.gather(*tasks)
-        
-        for response in responses:
-            resp = await response.json()
-            parsed = await parse_schedule(resp)
-            all_records.append(parsed)
+    responses = await fetch(urls)
+    
+    for response in responses:
+        parsed = await parse_schedule(response.json)
+        all_records.append(parsed)
             
     updated_df = pd.concat(all_records)
     save_as = save_as.replace(".csv","")
@@ -247,9 +245,9 @@ async def update_game_logs(start,end,save_as):
 
 if __name__ == "__main__":
     # start = time.time()
-    df1 = asyncio.run(update_game_logs(1901,1950,save_as="schedules_1901-1950"))
-    df2 = asyncio.run(update_game_logs(1951,2000,save_as="schedules_1951-2000"))
-    df3 = asyncio.run(update_game_logs(2001,2021,save_as="schedules_2001-2021"))
+    df1 = run_sync(update_game_logs(1901,1950,save_as="schedules_1901-1950"))
+    df2 = run_sync(update_game_logs(1951,2000,save_as="schedules_1951-2000"))
+    df3 = run_sync(update_game_logs(2001,2021,save_as="schedules_2001-2021"))
     combined_df = pd.concat([df1,df2,df3])
     combined_df.to_csv("schedules.csv",index=False)
     print(combined_df)
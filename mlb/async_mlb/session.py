@@ -0,0 +1,127 @@
+"""Process-wide aiohttp session management
+
+Every async fetch path in the library borrows its `aiohttp.ClientSession` from
+here rather than opening (and throwing away) a new one per call. Sessions are
+bound to an event loop, so one long-lived session is kept per loop. Each one
+uses a keep-alive connection pool with DNS caching, which means repeated
+`Person`/`Team` builds reuse the same TLS connections to statsapi.mlb.com.
+"""
+import time
+import atexit
+import asyncio
+import weakref
+
+import aiohttp
+
+_DEFAULTS = {
+    'limit': 100,               # total simultaneous connections per session
+    'limit_per_host': 30,       # simultaneous connections to a single host
+    'ttl_dns_cache': 300,       # seconds to keep resolved addresses
+    'keepalive_timeout': 60,    # seconds an idle connection stays in the pool
+}
+
+_config = dict(_DEFAULTS)
+_config_version = 0
+
+# event loop -> ClientSession
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop,aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def configure_session(**kwargs) -> dict:
+    """Configure the shared connection pool
+
+    Sessions that are already open are replaced (and closed) the next time
+    they are requested.
+
+    Parameters:
+    -----------
+    limit : int, default 100
+        total number of simultaneous connections (0 for no limit)
+
+    limit_per_host : int, default 30
+        number of simultaneous connections to the same host (0 for no limit)
+
+    ttl_dns_cache : int, default 300
+        number of seconds that resolved DNS entries are cached
+
+    keepalive_timeout : int or float, default 60
+        number of seconds an idle connection is kept alive in the pool
+
+    Returns the active configuration
+    """
+    global _config_version
+    for key, value in kwargs.items():
+        if key not in _DEFAULTS:
+            raise TypeError(f"configure_session() got an unexpected keyword argument '{key}'")
+        _config[key] = value
+    _config_version += 1
+    return dict(_config)
+
+
+def _mark(name: str):
+    async def _hook(session, ctx, params):
+        # `trace_request_ctx` is the dict passed by `AiohttpTransport.get` (other callers pass nothing)
+        if isinstance(ctx.trace_request_ctx, dict):
+            ctx.trace_request_ctx.setdefault(name, time.perf_counter())
+    return _hook
+
+
+def _timing_trace() -> aiohttp.TraceConfig:
+    """Trace hooks recording when each phase of a request started/ended"""
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(_mark('request_start'))
+    trace.on_dns_resolvehost_start.append(_mark('dns_start'))
+    trace.on_dns_resolvehost_end.append(_mark('dns_end'))
+    trace.on_connection_create_start.append(_mark('connect_start'))
+    trace.on_connection_create_end.append(_mark('connect_end'))
+    trace.on_request_end.append(_mark('headers'))
+    return trace
+
+
+def _new_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=_config['limit'],
+        limit_per_host=_config['limit_per_host'],
+        use_dns_cache=True,
+        ttl_dns_cache=_config['ttl_dns_cache'],
+        keepalive_timeout=_config['keepalive_timeout'])
+    session = aiohttp.ClientSession(connector=connector, trace_configs=[_timing_trace()])
+    session._mlb_config_version = _config_version
+    return session
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get the shared session for the running event loop (created on first use)"""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is not None and not session.closed:
+        if session._mlb_config_version == _config_version:
+            return session
+        await session.close()
+    session = _new_session()
+    _sessions[loop] = session
+    return session
+
+
+async def close_session():
+    """Close the shared session for the running event loop"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def close_sessions():
+    """Close every shared session that is still open
+
+    Registered with `atexit`, but safe to call at any point (e.g. when a
+    worker process is shutting down). Sessions whose loop is currently
+    running are skipped; close those with `await close_session()` instead.
+    """
+    for loop, session in list(_sessions.items()):
+        if session.closed or loop.is_closed() or loop.is_running():
+            continue
+        loop.run_until_complete(session.close())
+        _sessions.pop(loop, None)
+
+
+atexit.register(close_sessions)
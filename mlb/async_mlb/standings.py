@@ -1,4 +1,3 @@
-import time
 import asyncio
 import aiohttp
 import datetime as dt
@@ -8,6 +7,12 @@ from requests import Request
 import pandas as pd
 import numpy as np
 
+from .. import decoders
+from .runner import run_sync
+from .scheduler import get_scheduler
+from .transport import request, RawResponse
+from . import events
+
 div_record_label = {200:'vs_west', 201:'vs_east', 202:'vs_central',
                     203:'vs_west', 204:'vs_east', 205:'vs_central'}
 
@@ -37,12 +42,12 @@ def get_league_label_name(league_mlbam:int, division_mlbam:int):
 
 
 
-async def parse_data(response:aiohttp.ClientResponse,**kwargs):
+async def parse_data(response:RawResponse,**kwargs):
     url_components = urlparse(str(response.url))
     params = parse_qs(url_components.query)
     season = params['season'][0]
 
-    standings_json: dict = await response.json()
+    standings_json: dict = decoders.loads(await response.read())
     
     data = []
     for record in standings_json.get('records',[{}]):
@@ -117,26 +122,22 @@ async def fetch_standings(**kwargs):
         'standingsType':'regularSeason'
     }
     
-    dfs = []
-    
-    async with aiohttp.ClientSession() as sesh:
-        tasks = []
-        for season in range(1876,dt.datetime.today().year + 1):
-            params['season'] = str(season)
-            url = Request("GET",base_url,params=params).prepare().url
-            if kwargs.get('log'):
-                print(url)
-            tasks.append(sesh.get(url))
-        client_responses = await asyncio.gather(*tasks)
-        for response in client_responses:
-            dfs.append(await parse_data(response,**kwargs))
+    urls = []
+    for season in range(1876,dt.datetime.today().year + 1):
+        params['season'] = str(season)
+        url = Request("GET",base_url,params=params).prepare().url
+        urls.append(url)
+
+    async def _get(url):
+        response = await request(url)
+        return await parse_data(response,**kwargs)
+
+    dfs = await get_scheduler().map(urls,_get)
     
     df = pd.concat(dfs)
     return df
 
 def runit(**kwargs):
-    start = time.time()
-    retrieved = asyncio.run(fetch_standings(**kwargs))
-    if kwargs.get("log"):
-        print(f'-- {time.time() - start} seconds --')
+    with events.printing(kwargs.get("log")), events.stage('total','standings'):
+        retrieved = run_sync(fetch_standings(**kwargs))
     return retrieved
\ No newline at end of file
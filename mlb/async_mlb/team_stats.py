@@ -1,5 +1,3 @@
-import asyncio
-import aiohttp
 import pandas as pd
 # import time
 # from pprint import pprint
@@ -16,6 +14,8 @@ from ..constants import FIELD_FIELDS
 from ..constants import STATDICT
 
 from ..constants import POSITION_DICT
+from .runner import run_sync
+from .fetch import fetch
 
 
 async def parse_data(response,idx,mlbam):
@@ -610,32 +610,25 @@ async def get_team_responses(mlbam,season):
     p_cats = ",".join(PITCHING_CATEGORIES)
     f_cats = ",".join(FIELDING_CATEGORIES)
 
-    async with aiohttp.ClientSession() as session:
-        
-        endpoints = {
-            "team stats":   f"/teams/{mlbam}/stats?stats={statTypes}&group={statGroups}&season={season}",
-            "roster stats": f"/teams/{mlbam}/roster?rosterType=fullSeason&hydrate={roster_hydrations}",
-            "game log":     f"/schedule?&hydrate={log_hydrations}&season={season}&sportId=1&teamId={mlbam}&gameType=R",
-            "game stats":   f"/teams/{mlbam}/stats?stats=gameLog&group={statGroups}&season={season}",
-            "hit_leaders": leader_ep + f"{h_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=hitting&limit=1000&playerPool=all",
-            "pitch_leaders": leader_ep + f"{p_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=pitching&limit=1000&playerPool=all",
-            "field_leaders": leader_ep + f"{f_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=fielding&limit=1000&playerPool=all",
-            "transactions": f"/transactions?teamId={mlbam}&startDate=1/1/{season}&endDate=12/1/{season}",
-            "draft":        f"/draft/{season}?teamId={mlbam}"
-            # "retired nums": f"/awards/RETIREDUNI_{mlbam}/recipients?sportId=1&hydrate=results",
-            
-            }
-        
-        tasks = []
-        for ep in endpoints.values():
-            tasks.append(session.get(BASE + ep, ssl=False))
+    endpoints = {
+        "team stats":   f"/teams/{mlbam}/stats?stats={statTypes}&group={statGroups}&season={season}",
+        "roster stats": f"/teams/{mlbam}/roster?rosterType=fullSeason&hydrate={roster_hydrations}",
+        "game log":     f"/schedule?&hydrate={log_hydrations}&season={season}&sportId=1&teamId={mlbam}&gameType=R",
+        "game stats":   f"/teams/{mlbam}/stats?stats=gameLog&group={statGroups}&season={season}",
+        "hit_leaders": leader_ep + f"{h_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=hitting&limit=1000&playerPool=all",
+        "pitch_leaders": leader_ep + f"{p_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=pitching&limit=1000&playerPool=all",
+        "field_leaders": leader_ep + f"{f_cats}&statType=season&teamId={mlbam}&gameType=R&season={season}&statGroup=fielding&limit=1000&playerPool=all",
+        "transactions": f"/transactions?teamId={mlbam}&startDate=1/1/{season}&endDate=12/1/{season}",
+        "draft":        f"/draft/{season}?teamId={mlbam}"
+        # "retired nums": f"/awards/RETIREDUNI_{mlbam}/recipients?sportId=1&hydrate=results",
 
-        responses = await asyncio.gather(*tasks)
-        
-        for idx, response in enumerate(responses):
-            resp = await response.json()
-            parsed = await parse_data(resp,idx,mlbam)
-            parsed_data.append(parsed)
+        }
+
+    responses = await fetch([BASE + ep for ep in endpoints.values()])
+
+    for idx, response in enumerate(responses):
+        parsed = await parse_data(response.json,idx,mlbam)
+        parsed_data.append(parsed)
 
     parsed_data_dict = {
         "team_stats":parsed_data[0],
@@ -651,15 +644,5 @@ async def get_team_responses(mlbam,season):
     return parsed_data_dict
 
 def runit(mlbam,season):
-    # start = time.time()
-    # loop = asyncio.get_event_loop()
-    # retrieved = asyncio.run_coroutine_threadsafe(get_team_responses(mlbam,season), loop)
-    # retrieved = loop.create_task(get_team_responses(mlbam,season))
-
-    # retrieved = asyncio.run(get_team_responses(mlbam,season))
-    # print("--- {} seconds ---".format(time.time()-start))
-    
-    # return retrieved.result()
-    # r =  asyncio.run_coroutine_threadsafe(get_team_responses(mlbam,season),loop=loop)
-    retrieved = asyncio.run(get_team_responses(mlbam,season))
+    retrieved = run_sync(get_team_responses(mlbam,season))
     return retrieved
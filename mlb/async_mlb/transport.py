@@ -0,0 +1,317 @@
+"""HTTP transport layer
+
+Every request the library makes (the async bulk paths, the synchronous
+functions and `Game`) ends up in `request()`, which hands it to the active
+`Transport`. Pooling, timeouts and compression are configured on the
+transport; caching, retries and coalescing sit on top of it in `fetch`.
+
+`MockTransport` is a drop-in test double:
+
+```
+from mlb.async_mlb.transport import MockTransport, use_transport
+
+mock = MockTransport()
+mock.add('/schedule', json={'dates': []})
+with use_transport(mock):
+    mlb.schedule(date='2022-06-01')
+print(mock.requests)
+```
+
+Responses served from the on-disk cache never reach the transport, so tests
+usually want `mlb.configure_cache(enabled=False)` as well.
+
+Urls are built against the official StatsAPI host; `set_api_root()` (or the
+MLB_API_ROOT environment variable) redirects them to another server, such
+as the local stand-in in `mlb.devserver`.
+"""
+import re
+import json
+import time
+import asyncio
+import contextlib
+from typing import Optional, Union, Callable
+
+import aiohttp
+
+from .session import get_session
+from .ratelimit import get_rate_limiter
+from .breaker import get_breaker
+from .. import constants
+
+# exceptions that count as a failed attempt (and are retried by `fetch`)
+TRANSPORT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+
+class RawResponse:
+    __slots__ = ['url', 'status', 'headers', 'body', 'timings']
+
+    def __init__(self, url: str, status: int, headers: dict, body: bytes, timings: Optional[dict] = None):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.timings = timings      # connection phases in seconds (see `AiohttpTransport.get`)
+
+    def __repr__(self):
+        return f"<RawResponse [{self.status}] {self.url}>"
+
+    @property
+    def text(self) -> str:
+        return self.body.decode('utf-8')
+
+    async def read(self) -> bytes:
+        # same call as on an aiohttp response, so parsers accept either
+        return self.body
+
+
+class Transport:
+    """Base class for transports
+
+    Subclasses implement `get`, which performs a single GET request and
+    returns a `RawResponse` with the whole body read. Connection problems
+    should be raised as one of `TRANSPORT_ERRORS`.
+    """
+    async def get(self, url: str, headers: Optional[dict] = None) -> RawResponse:
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class AiohttpTransport(Transport):
+    """Transport backed by the pooled aiohttp session of the running loop
+
+    Parameters:
+    -----------
+    timeout : float, default 30
+        total seconds allowed for a single request
+
+    connect : float, default 10
+        seconds allowed for opening a connection (including waiting for a
+        free one in the pool)
+
+    read : float, default 15
+        seconds allowed between two reads of the response, so a connection
+        that hangs mid-response fails (and is retried) long before `timeout`
+
+    headers : dict, optional
+        headers sent with every request (aiohttp already negotiates gzip/
+        deflate compression with 'Accept-Encoding')
+
+    """
+    def __init__(self, timeout: float = 30, connect: float = 10, read: float = 15, headers: Optional[dict] = None):
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect, sock_read=read)
+        self.headers = dict(headers or {})
+
+    def __repr__(self):
+        return f"<AiohttpTransport timeout={self.timeout.total} connect={self.timeout.connect} read={self.timeout.sock_read}>"
+
+    async def get(self, url: str, headers: Optional[dict] = None) -> RawResponse:
+        session = await get_session()
+        if self.headers:
+            headers = {**self.headers, **(headers or {})}
+        # filled in by the session's trace hooks (see `session._timing_trace`)
+        marks = {}
+        async with session.get(url, headers=headers or None, timeout=self.timeout, ssl=True,
+                               trace_request_ctx=marks) as response:
+            body = await response.read()
+            marks['body_end'] = time.perf_counter()
+            return RawResponse(str(response.url), response.status, dict(response.headers), body, _timings(marks))
+
+
+def _span(marks: dict, start: str, end: str) -> Optional[float]:
+    if start in marks and end in marks:
+        return marks[end] - marks[start]
+    return None
+
+
+def _timings(marks: dict) -> dict:
+    dns = _span(marks, 'dns_start', 'dns_end')
+    connect = _span(marks, 'connect_start', 'connect_end')
+    if connect is not None and dns is not None:
+        connect -= dns
+    sent = marks.get('connect_end', marks.get('request_start'))
+    return {
+        'dns': dns,
+        'connect': connect,
+        'ttfb': marks['headers'] - sent if 'headers' in marks and sent is not None else None,
+        'body': _span(marks, 'headers', 'body_end'),
+    }
+
+
+class MockTransport(Transport):
+    """Test double serving canned responses without touching the network
+
+    Routes are matched in the order they were added; a route matches when
+    its pattern is found anywhere in the url (plain substring) or, for
+    compiled regular expressions, when `pattern.search(url)` succeeds.
+    Unmatched urls get a 404. Every request is recorded in `requests` as a
+    (url, headers) tuple.
+
+    Parameters:
+    -----------
+    routes : dict, optional
+        pattern -> JSON-serializable payload
+
+    """
+    def __init__(self, routes: Optional[dict] = None):
+        self.routes = []
+        self.requests = []
+        for pattern, payload in (routes or {}).items():
+            self.add(pattern, json=payload)
+
+    def __repr__(self):
+        return f"<MockTransport routes={len(self.routes)} requests={len(self.requests)}>"
+
+    def add(self, pattern: Union[str, re.Pattern], json=None, body: Union[bytes, str, Callable] = None,
+            status: int = 200, headers: Optional[dict] = None, error: Exception = None):
+        """Register a canned response
+
+        Parameters:
+        -----------
+        pattern : str or compiled regex
+            what the url has to contain/match
+
+        json : optional
+            payload to serialize as the body
+
+        body : bytes, str or callable, optional
+            raw body, or a function `(url, headers) -> RawResponse` for
+            dynamic responses
+
+        status : int, default 200
+
+        headers : dict, optional
+
+        error : Exception, optional
+            raise this instead of responding (e.g. `aiohttp.ClientConnectionError()`)
+
+        """
+        if json is not None:
+            body = _dumps(json)
+            headers = {'Content-Type': 'application/json', **(headers or {})}
+        elif isinstance(body, str):
+            body = body.encode('utf-8')
+        self.routes.append((pattern, status, dict(headers or {}), body, error))
+        return self
+
+    def _match(self, url: str):
+        for route in self.routes:
+            pattern = route[0]
+            if isinstance(pattern, re.Pattern):
+                if pattern.search(url):
+                    return route
+            elif pattern in url:
+                return route
+        return None
+
+    async def get(self, url: str, headers: Optional[dict] = None) -> RawResponse:
+        self.requests.append((url, dict(headers or {})))
+        await asyncio.sleep(0)
+        route = self._match(url)
+        if route is None:
+            return RawResponse(url, 404, {}, b'{"message": "Object not found"}')
+        _, status, route_headers, body, error = route
+        if error is not None:
+            raise error
+        if callable(body):
+            return body(url, headers or {})
+        return RawResponse(url, status, dict(route_headers), body or b'')
+
+    @property
+    def urls(self) -> list:
+        return [url for url, _ in self.requests]
+
+
+def _dumps(payload) -> bytes:
+    return json.dumps(payload).encode('utf-8')
+
+
+_transport: Transport = AiohttpTransport()
+
+
+def get_transport() -> Transport:
+    """The transport currently in use"""
+    return _transport
+
+
+def set_transport(transport: Transport) -> Transport:
+    """Install a transport for every request; returns the previous one"""
+    global _transport
+    previous = _transport
+    _transport = transport
+    return previous
+
+
+def configure_transport(**kwargs) -> Transport:
+    """Replace the default transport with a new `AiohttpTransport(**kwargs)`"""
+    set_transport(AiohttpTransport(**kwargs))
+    return _transport
+
+
+@contextlib.contextmanager
+def use_transport(transport: Transport):
+    """Temporarily install a transport (e.g. a `MockTransport` in tests)"""
+    previous = set_transport(transport)
+    try:
+        yield transport
+    finally:
+        set_transport(previous)
+
+
+def api_url(url: str) -> str:
+    """`url` with the official StatsAPI root swapped for the configured one"""
+    root = constants.API_ROOT
+    if root == constants.STATSAPI_ROOT:
+        return url
+    for official in (constants.STATSAPI_ROOT, 'http' + constants.STATSAPI_ROOT[5:]):
+        if url.startswith(official):
+            return root + url[len(official):]
+    return url
+
+
+def set_api_root(root: Optional[str] = None) -> str:
+    """Send StatsAPI requests to another server (None restores the official one)
+
+    Updates `constants.BASE`/`constants.BASE_V11`; urls that were built
+    against the official host are rewritten on their way to the transport.
+    Returns the previous root
+    """
+    previous = constants.API_ROOT
+    root = (root or constants.STATSAPI_ROOT).rstrip('/')
+    constants.API_ROOT = root
+    constants.BASE = root + "/v1"
+    constants.BASE_V11 = root + "/v1.1"
+    return previous
+
+
+async def request(url: str, headers: Optional[dict] = None) -> RawResponse:
+    """Perform a GET request through the active transport
+
+    Fails fast with `CircuitOpenError` while the circuit for the url's
+    endpoint class is open, then waits for the rate limiter, if one is
+    configured. The outcome is recorded by the breaker
+    """
+    url = api_url(url)
+    breaker = get_breaker(url)
+    if breaker is None:
+        return await _limited_get(url, headers)
+
+    breaker.before()
+    try:
+        response = await _limited_get(url, headers)
+    except TRANSPORT_ERRORS:
+        breaker.failure()
+        raise
+    except BaseException:
+        breaker.release()
+        raise
+    breaker.record(response.status)
+    return response
+
+
+async def _limited_get(url: str, headers: Optional[dict] = None) -> RawResponse:
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        await limiter.acquire(url)
+    return await _transport.get(url, headers)
@@ -5,11 +5,16 @@ import pandas as pd
 
 from ..constants import BASE
 from .. import mlb_dataclasses as dclass
-from ..mlbdata import get_teams_df
+from .. import decoders
+from ..mlbdata import team_rows
 
 from ..utils import curr_year
+from .runner import run_sync
+from .scheduler import get_scheduler
+from .transport import request
 
-async def parse_data(response,teams_df):
+async def parse_data(response):
+    teams_by_season, _ = team_rows()
     all_records = []
     for league in response["records"]:
         lg_mlbam = league.get("league",{}).get("id","")
@@ -18,8 +23,9 @@ async def parse_data(response,teams_df):
         for team in league["teamRecords"]:
         # SEASON RECORDS FOR EACH TEAM
             tm_mlbam = team["team"]["id"]
-            tm_name = teams_df[(teams_df["mlbam"]==tm_mlbam) & (teams_df["season"]==year)].fullName.item()
-            tm_bbrefID = teams_df[(teams_df["mlbam"]==tm_mlbam) & (teams_df["season"]==year)].bbrefID.item()
+            team_row = teams_by_season.get((tm_mlbam,year),{})
+            tm_name = team_row.get("name_full")
+            tm_bbrefID = team_row.get("bbrefID")
             div_mlbam = team.get("team",{}).get("division",{}).get("id","")
             div_short = dclass.Leagues.get(div_mlbam).short_name
             v_mlbam = team.get("team",{}).get("venue",{}).get("id")
@@ -180,7 +186,6 @@ async def parse_data(response,teams_df):
     return all_records       
 
 async def get_updated_records(year=None,start=None,end=None):
-    teams_df = get_teams_df()
     leagueIDs = "103,104"
     standingsTypes = "byLeague"
     if year is not None:
@@ -190,17 +195,17 @@ async def get_updated_records(year=None,start=None,end=None):
         start = 1876
         end = curr_year
 
-    parsed_data_by_year = []
     all_records = []
-    async with aiohttp.ClientSession() as sesh:
-        tasks = []
-        for season in range(start,end+1):
-            url = BASE + f"/standings?leagueId={leagueIDs}&standingsTypes={standingsTypes}&season={season}&hydrate=league,team(division)"
-            tasks.append(sesh.get(url,ssl=False))
-        responses = await asyncio.gather(*tasks)
-        for response in responses:
-            resp = await response.json()
-            parsed_data_by_year.append(await parse_data(resp,teams_df))
+    urls = []
+    for season in range(start,end+1):
+        urls.append(BASE + f"/standings?leagueId={leagueIDs}&standingsTypes={standingsTypes}&season={season}&hydrate=league,team(division)")
+
+    async def _get(url):
+        response = await request(url)
+        resp = decoders.loads(response.body)
+        return await parse_data(resp)
+
+    parsed_data_by_year = await get_scheduler().map(urls,_get)
     for y in parsed_data_by_year:
         for r in y:
             all_records.append(r)
@@ -210,6 +215,6 @@ async def get_updated_records(year=None,start=None,end=None):
 
 def runit():
     # start = time.time()
-    retrieved = asyncio.run(get_updated_records())
+    retrieved = run_sync(get_updated_records())
     # print(f"--- {time.time()-start} seconds ---")
     return retrieved
@@ -0,0 +1,542 @@
+"""Persistent on-disk cache for StatsAPI responses
+
+Responses are stored in a SQLite database (see `paths.RESPONSE_CACHE_DB`,
+overridable with the MLB_CACHE_DIR environment variable) together with an
+expiry time that depends on the endpoint:
+
+    * completed seasons / past dates and Final game feeds never expire; a
+      past schedule/game date only once all of its games are Final (or
+      `SETTLE_DAYS` have gone by)
+    * live game feeds and current schedules expire after a few seconds
+    * everything else gets the TTL for its endpoint class (see `TTLS`)
+
+The database is bounded by `max_bytes`; once it grows past that, the least
+recently used entries are evicted.
+
+Expired entries are kept around for revalidation: if the stored response came
+with an ETag or Last-Modified header, the refresh request is sent with
+If-None-Match/If-Modified-Since and a 304 simply extends the entry. Decoded
+payloads of validated responses are kept in a small in-memory LRU so that an
+unchanged feed isn't parsed again either.
+
+The async fetch path uses `alookup`/`astore`/`arevalidated`, which run the
+SQLite reads and writes on a dedicated thread so that a large `fetch()`
+doesn't block the event loop on the database.
+
+Set MLB_CACHE=0 in the environment (or call `configure(enabled=False)`) to
+bypass the cache entirely.
+"""
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import functools
+import threading
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from urllib.parse import urlparse, parse_qsl, urlencode
+from typing import Optional
+
+import pandas as pd
+
+from .paths import RESPONSE_CACHE_DB
+from .endpoints import endpoint_class, is_historical, url_dates
+from . import decoders
+
+FOREVER = None
+
+# seconds, by endpoint class (see endpoints.ENDPOINT_CLASSES)
+TTLS = {
+    'live':         10,
+    'game':         60,
+    'schedule':     30,
+    'standings':    300,
+    'transactions': 900,
+    'stats':        900,
+    'people':       3600,
+    'teams':        3600,
+    'draft':        3600,
+    'awards':       86400,
+    'reference':    86400,
+    'other':        900,
+}
+
+# days after which a past schedule/game date is cached for good even if its
+# games aren't all Final (suspended games get resumed and postponed ones
+# rescheduled within that window; after it the payload no longer changes)
+SETTLE_DAYS = 7
+
+# detailed states of games that are Final but not finished
+_UNSETTLED_STATES = ('Postponed', 'Suspended')
+
+MAX_BYTES = 256 * 1024 * 1024
+
+# number of decoded payloads kept in memory (keyed by url + validator)
+DECODED_ENTRIES = 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key         TEXT PRIMARY KEY,
+    url         TEXT NOT NULL,
+    status      INTEGER NOT NULL,
+    headers     TEXT NOT NULL,
+    body        BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    stored_at   REAL NOT NULL,
+    expires_at  REAL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def _games_settled(payload) -> bool:
+    """Whether every game of a schedule (or game feed) payload is Final for good"""
+    if not isinstance(payload, dict):
+        return False
+    if 'gameData' in payload:
+        statuses = [payload['gameData'].get('status', {})]
+    else:
+        statuses = [g.get('status', {}) for d in payload.get('dates', []) for g in d.get('games', [])]
+    for status in statuses:
+        if status.get('abstractGameState') != 'Final':
+            return False
+        if str(status.get('detailedState', '')).startswith(_UNSETTLED_STATES):
+            return False
+    return True
+
+
+def _needs_payload(url: str) -> bool:
+    """Whether `ttl_for(url)` depends on the payload"""
+    ep_class = endpoint_class(url)
+    return ep_class == 'live' or (ep_class in ('schedule', 'game') and bool(url_dates(url)))
+
+
+def ttl_for(url: str, payload: Optional[dict] = None, today: Optional[dt.date] = None) -> Optional[float]:
+    """Seconds a response for `url` may be cached (None means forever)
+
+    `payload` is the decoded response, if available. It's used to recognize
+    game feeds and past schedule dates whose games are already Final.
+    """
+    today = today or dt.date.today()
+    ep_class = endpoint_class(url)
+    if ep_class == 'live':
+        if 'timecode=' in url:
+            return FOREVER
+        if isinstance(payload, dict):
+            state = payload.get('gameData', {}).get('status', {}).get('abstractGameState')
+            if state == 'Final':
+                return FOREVER
+        return TTLS['live']
+    if is_historical(url, today):
+        if _needs_payload(url) and not _games_settled(payload):
+            # late games run past midnight, suspended/postponed ones move
+            if max(url_dates(url)) > today - dt.timedelta(days=SETTLE_DAYS):
+                return TTLS[ep_class]
+        return FOREVER
+    return TTLS.get(ep_class, TTLS['other'])
+
+
+def _key(url: str) -> str:
+    """Cache key for a url (query parameters in a stable order)"""
+    components = urlparse(url)
+    query = urlencode(sorted(parse_qsl(components.query, keep_blank_values=True)))
+    return components._replace(query=query, fragment='').geturl()
+
+
+class CachedResponse:
+    __slots__ = ['url', 'status', 'headers', 'body', 'stored_at', 'expires_at']
+
+    def __init__(self, url, status, headers, body, stored_at, expires_at):
+        self.url: str = url
+        self.status: int = status
+        self.headers: dict = headers
+        self.body: bytes = body
+        self.stored_at: float = stored_at
+        self.expires_at: Optional[float] = expires_at
+
+    def __repr__(self):
+        return f"<CachedResponse [{self.status}] {self.url}>"
+
+    @property
+    def text(self) -> str:
+        return self.body.decode('utf-8')
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+    @property
+    def validator(self) -> Optional[str]:
+        """ETag (or Last-Modified) the response was stored with"""
+        return _header(self.headers, 'ETag') or _header(self.headers, 'Last-Modified')
+
+    def json(self):
+        """Decoded body
+
+        Responses with a validator are decoded once and then shared from
+        memory, so treat the returned object as read-only
+        """
+        return _decode(self)
+
+
+def _header(headers: dict, name: str) -> Optional[str]:
+    name = name.lower()
+    for k, v in headers.items():
+        if k.lower() == name:
+            return v
+    return None
+
+
+_decoded: "OrderedDict[tuple,object]" = OrderedDict()
+_decoded_lock = threading.Lock()
+
+
+def _decode(cached: CachedResponse):
+    validator = cached.validator
+    if validator is None:
+        return decoders.loads(cached.body)
+    key = (_key(cached.url), validator)
+    with _decoded_lock:
+        if key in _decoded:
+            _decoded.move_to_end(key)
+            return _decoded[key]
+    payload = decoders.loads(cached.body)
+    _remember(key, payload)
+    return payload
+
+
+def _remember(key: tuple, payload):
+    with _decoded_lock:
+        _decoded[key] = payload
+        _decoded.move_to_end(key)
+        while len(_decoded) > DECODED_ENTRIES:
+            _decoded.popitem(last=False)
+
+
+class ResponseCache:
+    """SQLite-backed response store
+
+    Parameters:
+    -----------
+    path : str, default `paths.RESPONSE_CACHE_DB`
+        location of the database file
+
+    max_bytes : int, default `MAX_BYTES`
+        size limit for stored bodies; least recently used entries are
+        evicted past this point
+
+    """
+    def __init__(self, path: str = RESPONSE_CACHE_DB, max_bytes: int = MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._total_bytes = None
+
+    def __repr__(self):
+        return f"<ResponseCache {self.path}>"
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed_at)")
+            conn.commit()
+            self._conn = conn
+            self._total_bytes = conn.execute("SELECT COALESCE(SUM(size),0) FROM responses").fetchone()[0]
+        return self._conn
+
+    def get(self, url: str, allow_stale=False) -> Optional[CachedResponse]:
+        """Get the stored response for `url` (None if missing or expired)"""
+        key = _key(url)
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT url,status,headers,body,stored_at,expires_at FROM responses WHERE key=?",
+                (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            cached = CachedResponse(row[0], row[1], json.loads(row[2]), row[3], row[4], row[5])
+            if not cached.fresh:
+                self.misses += 1
+                if not allow_stale:
+                    return None
+            else:
+                self.hits += 1
+            conn.execute("UPDATE responses SET accessed_at=? WHERE key=?", (time.time(), key))
+            conn.commit()
+        return cached
+
+    def set(self, url: str, body: bytes, headers: Optional[dict] = None, status=200, ttl: Optional[float] = FOREVER):
+        """Store a response body for `url` for `ttl` seconds (None = forever)"""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        key = _key(url)
+        with self._lock:
+            conn = self._connection()
+            old = conn.execute("SELECT size FROM responses WHERE key=?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?,?,?,?,?,?,?,?,?)",
+                (key, url, status, json.dumps(dict(headers or {})), body, len(body), now, expires_at, now))
+            conn.commit()
+            self._total_bytes += len(body) - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def refresh(self, cached: CachedResponse, headers: Optional[dict] = None, ttl: Optional[float] = FOREVER) -> CachedResponse:
+        """Extend a stored response that the server confirmed is unchanged (304)
+
+        Headers sent with the 304 are merged into the stored ones
+        """
+        merged = dict(cached.headers)
+        for k, v in (headers or {}).items():
+            for old in [o for o in merged if o.lower() == k.lower()]:
+                del merged[old]
+            merged[k] = v
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE responses SET headers=?, stored_at=?, expires_at=?, accessed_at=? WHERE key=?",
+                (json.dumps(merged), now, expires_at, now, _key(cached.url)))
+            conn.commit()
+        return CachedResponse(cached.url, cached.status, merged, cached.body, now, expires_at)
+
+    def delete(self, url: str):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses WHERE key=?", (_key(url),))
+            conn.commit()
+            self._recount()
+
+    def _evict(self):
+        # evict down to 90% of the limit so that we don't evict on every write
+        target = self.max_bytes * 0.9
+        conn = self._conn
+        doomed = []
+        total = self._total_bytes
+        for key, size in conn.execute("SELECT key,size FROM responses ORDER BY accessed_at ASC"):
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key=?", doomed)
+        conn.commit()
+        self._total_bytes = total
+
+    def _recount(self):
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size),0) FROM responses").fetchone()[0]
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed"""
+        with self._lock:
+            conn = self._connection()
+            removed = conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),)).rowcount
+            conn.commit()
+            self._recount()
+        return removed
+
+    def clear(self, pattern: Optional[str] = None) -> int:
+        """Delete every entry (or only those whose url contains `pattern`)
+
+        Returns the number of entries removed
+        """
+        with self._lock:
+            conn = self._connection()
+            if pattern is None:
+                removed = conn.execute("DELETE FROM responses").rowcount
+            else:
+                removed = conn.execute("DELETE FROM responses WHERE instr(url,?) > 0", (pattern,)).rowcount
+            conn.commit()
+            self._recount()
+        return removed
+
+    def inspect(self) -> pd.DataFrame:
+        """Dataframe of the stored entries (most recently used first)"""
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT url,status,size,stored_at,expires_at,accessed_at FROM responses ORDER BY accessed_at DESC"
+            ).fetchall()
+        df = pd.DataFrame(rows, columns=['url', 'status', 'size', 'stored_at', 'expires_at', 'accessed_at'])
+        for col in ('stored_at', 'expires_at', 'accessed_at'):
+            df[col] = pd.to_datetime(df[col], unit='s')
+        df.insert(1, 'endpoint', df['url'].map(endpoint_class))
+        return df
+
+    def info(self) -> dict:
+        with self._lock:
+            conn = self._connection()
+            entries, expired = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at IS NOT NULL AND expires_at <= ?),0) FROM responses",
+                (time.time(),)).fetchone()
+        return {
+            'path': self.path,
+            'entries': entries,
+            'expired': expired,
+            'bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_config = {
+    'enabled': os.environ.get('MLB_CACHE', '1') not in ('0', 'false', 'False', 'off'),
+    'path': RESPONSE_CACHE_DB,
+    'max_bytes': MAX_BYTES,
+}
+_cache: Optional[ResponseCache] = None
+
+
+def configure(enabled: Optional[bool] = None, path: Optional[str] = None, max_bytes: Optional[int] = None, ttls: Optional[dict] = None) -> dict:
+    """Configure the shared response cache
+
+    Parameters:
+    -----------
+    enabled : bool, optional
+        turn the cache on/off
+
+    path : str, optional
+        location of the SQLite database
+
+    max_bytes : int, optional
+        size limit for the stored responses
+
+    ttls : dict, optional
+        overrides for `TTLS` (endpoint class -> seconds)
+
+    """
+    global _cache
+    if enabled is not None:
+        _config['enabled'] = enabled
+    if path is not None and path != _config['path']:
+        _config['path'] = path
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+    if max_bytes is not None:
+        _config['max_bytes'] = max_bytes
+        if _cache is not None:
+            _cache.max_bytes = max_bytes
+    if ttls is not None:
+        TTLS.update(ttls)
+    return dict(_config)
+
+
+def get_cache() -> ResponseCache:
+    """The shared `ResponseCache` instance"""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(_config['path'], _config['max_bytes'])
+    return _cache
+
+
+def lookup(url: str, allow_stale=False) -> Optional[CachedResponse]:
+    """Fresh cached response for `url`, or None (always None when disabled)
+
+    With `allow_stale`, expired entries are returned as well (check `.fresh`)
+    so that they can be revalidated
+    """
+    if not _config['enabled']:
+        return None
+    return get_cache().get(url, allow_stale=allow_stale)
+
+
+def conditional_headers(cached: Optional[CachedResponse]) -> dict:
+    """If-None-Match/If-Modified-Since headers for refreshing `cached`"""
+    if cached is None:
+        return {}
+    headers = {}
+    etag = _header(cached.headers, 'ETag')
+    if etag is not None:
+        headers['If-None-Match'] = etag
+    last_modified = _header(cached.headers, 'Last-Modified')
+    if last_modified is not None:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def revalidated(cached: CachedResponse, headers: Optional[dict] = None) -> CachedResponse:
+    """Record a 304 for `cached` and return the refreshed entry"""
+    payload = cached.json() if _needs_payload(cached.url) else None
+    return get_cache().refresh(cached, headers, ttl_for(cached.url, payload))
+
+
+def store(url: str, body: bytes, headers: Optional[dict] = None, status=200, payload=None):
+    """Store a successful response, using the TTL policy for its url"""
+    if not _config['enabled'] or status != 200:
+        return
+    ttl = ttl_for(url, payload)
+    if ttl == 0:
+        return
+    get_cache().set(url, body, headers=headers, status=status, ttl=ttl)
+    validator = _header(headers or {}, 'ETag') or _header(headers or {}, 'Last-Modified')
+    if validator is not None and payload is not None:
+        _remember((_key(url), validator), payload)
+
+
+# one thread: the connection is shared and serialized by its lock anyway
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _in_thread(fn, *args, **kwargs):
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mlb-cache')
+    return asyncio.get_running_loop().run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+async def alookup(url: str, allow_stale=False) -> Optional[CachedResponse]:
+    """`lookup` without blocking the event loop"""
+    if not _config['enabled']:
+        return None
+    return await _in_thread(lookup, url, allow_stale=allow_stale)
+
+
+async def astore(url: str, body: bytes, headers: Optional[dict] = None, status=200, payload=None):
+    """`store` without blocking the event loop"""
+    if not _config['enabled'] or status != 200:
+        return
+    await _in_thread(store, url, body, headers, status, payload)
+
+
+async def arevalidated(cached: CachedResponse, headers: Optional[dict] = None) -> CachedResponse:
+    """`revalidated` without blocking the event loop"""
+    return await _in_thread(revalidated, cached, headers)
+
+
+def info() -> dict:
+    """Size, entry count and hit/miss counters of the response cache"""
+    return get_cache().info()
+
+
+def inspect() -> pd.DataFrame:
+    """Dataframe of every cached response"""
+    return get_cache().inspect()
+
+
+def clear(pattern: Optional[str] = None) -> int:
+    """Clear the response cache (optionally only urls containing `pattern`)"""
+    return get_cache().clear(pattern)
@@ -12,6 +12,9 @@ from . import parsing
 from . import functions as funcs
 from . import objects as objs
 
+from .async_mlb import run_sync
+from .async_mlb import with_deadline
+from .async_mlb import get_json
 from .constants import BASE
 from .utils import iso_format_ms
 from .utils import utc_zone
@@ -41,6 +44,10 @@ class Person:
     mlbam : int (required)
         Official "MLB Advanced Media" ID for a player
 
+    deadline : float, optional
+        seconds allowed for retrieving the data (raises
+        `mlb.DeadlineExceeded` when it runs out)
+
     ---------------------------------------------------------------------------
     
     Accessing the data
@@ -87,7 +94,9 @@ class Person:
     def __init__(self, mlbam: int, **kwargs):
         # self = object.__new__(cls)
         _pd_df = pd.DataFrame
-        data = funcs._player_data(mlbam)
+        data = kwargs.get("_data")
+        if data is None:
+            data = run_sync(with_deadline(funcs._player_data(mlbam), kwargs.get('deadline')))
 
         _bio: Union[list, None] = data["bio"]
         _info: dict = data["info"]
@@ -143,6 +152,7 @@ class Person:
                     club=team.get('clubName'),
                     location=team.get('locationName'),
                     franchise=team.get('franchiseName'),
+                    abbreviation=team.get('abbreviation'),
                 ),
                 "opponent": dclass.TeamName(
                     mlbam=opponent.get('id'),
@@ -151,10 +161,11 @@ class Person:
                     club=opponent.get('clubName'),
                     location=opponent.get('locationName'),
                     franchise=opponent.get('franchiseName'),
+                    abbreviation=opponent.get('abbreviation'),
                 ),
             }
         else:
-            _debut_data = {"date": md(data["first_game"])}
+            _debut_data = {"date": md(_info["first_game"])}
 
         # last game info
         _last_game_data = {
@@ -476,14 +487,24 @@ class Franchise:
     mlbam : int | str (required)
         Official "MLB Advanced Media" ID for franchise (team)
 
+    deadline : float, optional
+        seconds allowed for retrieving the data (raises
+        `mlb.DeadlineExceeded` when it runs out)
+
+    partial : bool, default False
+        with a `deadline`, leave out the seasons that didn't arrive in time
+        instead of raising
+
     ### See also:
     - 'mlb.Team()'
     - 'mlb.teams()'
 
     """
 
-    def __init__(self, mlbam: int):
-        data = funcs._franchise_data(int(mlbam))
+    def __init__(self, mlbam: int, **kwargs):
+        data = kwargs.get("_data")
+        if data is None:
+            data = run_sync(with_deadline(funcs._franchise_data(int(mlbam)), kwargs.get('deadline'), kwargs.get('partial', False)))
 
         records       = data["records"]
         record_splits = data["record_splits"]  # like standings splits
@@ -514,7 +535,7 @@ class Franchise:
         self.__league = Leagues.get(ti['league_mlbam'])
         self.__division = Leagues.get(ti['div_mlbam'])
         
-        self.__venue = helpers._Venue(ti['venue_mlbam'],ti['venue_name'])
+        self.__venue = dclass.Venue(ti['venue_mlbam'],ti['venue_name'])
         self.__standings = helpers._Standings(records_df,splits_df)
 
         self.__yby_data = data["yby_data"]
@@ -641,6 +662,14 @@ class Team:
         Retrieve data for a specific season. Default value (None) retrieves 
         data for the most recent season
 
+    deadline : float, optional
+        seconds allowed for retrieving the data (raises
+        `mlb.DeadlineExceeded` when it runs out)
+
+    partial : bool, default False
+        with a `deadline`, build the team from the sections that arrived in
+        time; the others are left empty and their urls listed in `missing`
+
     """
 
     def __init__(self, mlbam: int, season: Optional[int] = None, **kwargs):
@@ -652,13 +681,14 @@ class Team:
         self.mlbam = int(mlbam)
         self.season = int(season)
 
-        data: Union[dict, None] = funcs._team_data(self.mlbam, self.season)
+        data: Union[dict, None] = kwargs.get("_data")
+        if data is None:
+            data = run_sync(with_deadline(funcs._team_data(self.mlbam, self.season, log=kwargs.get('log')), kwargs.get('deadline'), kwargs.get('partial', False)))
         self.raw_data = data
+        self.missing: list = data.get('missing', [])
 
         ti: dict = data["team_info"]
-        if kwargs.get('log'):
-            print(ti.keys())
-            
+
         self.name = dclass.TeamName(
             mlbam=self.mlbam,
             full=ti["full_name"],
@@ -681,14 +711,14 @@ class Team:
             players=dclass.StatTypeCollection(
                 hitting=data['hitting_reg'],
                 pitching=data['pitching_reg'],
-                fielding=data['fielding_reg'],
+                _fielding=data['fielding_reg'],
                 hitting_adv=data['hitting_adv'],
                 pitching_adv=data['pitching_adv'],
             ),
             totals=dclass.StatTypeCollection(
                 hitting=data['total_hitting_reg'],
                 pitching=data['total_pitching_reg'],
-                fielding=data['total_fielding_reg'],
+                _fielding=data['total_fielding_reg'],
                 hitting_adv=data['total_hitting_adv'],
                 pitching_adv=data['total_pitching_adv'],
                 )
@@ -844,10 +874,10 @@ class api:
                 teamIds = ",".join(teamIds).replace(", ", ",")
             params["teamIds"] = teamIds
 
-        resp = requests.get(url, params=params)
+        resp = get_json(url, params=params)
 
         parsed_data = []
-        for p_dict in resp.json()["people"]:
+        for p_dict in resp.json["people"]:
             parsed_data.append(
                 pd.Series(parsing._parse_person(_obj=p_dict)))
 
@@ -871,9 +901,9 @@ class api:
             hydrations = f"&hydrate={hydrations}"
         else:
             hydrations = ""
-        resp = requests.get(f"{BASE}/teams?sportId=1&season={season}{hydrations}")
+        resp = get_json(f"{BASE}/teams?sportId=1&season={season}{hydrations}")
 
-        for t in resp.json()["teams"]:
+        for t in resp.json["teams"]:
             if query.lower() in t.get("name").lower():
                 return objs.MlbTeam(raw_data=t, **parsing._parse_team(t))
 
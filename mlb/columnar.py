@@ -0,0 +1,227 @@
+"""Columnar copies of the bundled reference tables
+
+Parsing the csvs in `mlb/data` (and converting their date columns) is the
+slowest part of loading a reference table. Every csv has a typed, columnar
+twin next to it (`people.csv` -> `people.cols`) that `mlbdata` loads instead
+whenever it is current.
+
+The format is deliberately simple so it needs nothing beyond numpy and
+loads the same with any pandas version: a JSON header followed by one
+aligned buffer per column, read with a single `read()` and mapped with
+`np.frombuffer`.
+
+- numeric, bool and datetime columns are stored as arrays with the dtype
+  the csv reader gives them (int32 ids, datetime64 season dates...)
+- text columns are dictionary encoded: the distinct values as one utf-8
+  blob, plus an int32 code per row (-1 for missing values)
+
+A twin is current when it was built from a csv with the same content as the
+one on disk (the header records the csv's size and a hash of its bytes);
+otherwise the csv is read. `mlbdata.build_columnar()` rebuilds every
+twin and the `update_*` functions rebuild the ones they touch. The twins
+only help where they sit next to their csvs, so a packaged install has to
+ship both.
+"""
+import os
+import json
+import mmap
+import struct
+import hashlib
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+SUFFIX = '.cols'
+FORMAT_VERSION = 1
+
+_MAGIC = b'MLBCOLS\n'
+_ALIGN = 64
+_SEP = '\x00'
+_NATIVE = 'a'       # column stored as a plain numpy array
+_TEXT = 's'         # dictionary encoded text column
+
+
+def columnar_path(csv_path: str) -> str:
+    """Path of the columnar twin of a csv"""
+    return os.path.splitext(csv_path)[0] + SUFFIX
+
+
+# csv path -> ((mtime_ns, size), digest), so an unchanged csv is hashed once
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+def source_digest(csv_path: str) -> str:
+    """Hash of the bytes of a csv (recomputed only when its mtime or size changes)"""
+    st = os.stat(csv_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _digests.get(csv_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    h = hashlib.blake2b(digest_size=16)
+    with open(csv_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    with _digests_lock:
+        _digests[csv_path] = (stamp, h.hexdigest())
+    return h.hexdigest()
+
+
+def source_meta(csv_path: str) -> dict:
+    """Header fields identifying the csv a file is built from"""
+    return {'source_size': os.path.getsize(csv_path), 'source_hash': source_digest(csv_path)}
+
+
+def _pad(n: int) -> int:
+    return -n % _ALIGN
+
+
+def _encode_text(values: np.ndarray) -> Optional[tuple]:
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    uniques = list(uniques)
+    if not all(isinstance(v, str) and _SEP not in v for v in uniques):
+        return None
+    return codes.astype(np.int32), _SEP.join(uniques).encode('utf-8'), len(uniques)
+
+
+def _decode_text(codes: np.ndarray, blob: bytes, n: int) -> np.ndarray:
+    uniques = np.empty(n + 1, dtype=object)
+    if n:
+        uniques[:n] = blob.decode('utf-8').split(_SEP)
+    uniques[n] = np.nan
+    # code -1 (missing) picks the trailing nan
+    return uniques[codes]
+
+
+def write_frame(df: pd.DataFrame, path: str, source: Optional[str] = None):
+    """Write `df` (numeric/bool/datetime or text columns, default index) to `path`
+
+    `source` is the path of the csv the frame was read from
+    """
+    columns, buffers = [], []
+    offset = 0
+
+    def _add(data: bytes) -> dict:
+        nonlocal offset
+        entry = {'offset': offset, 'nbytes': len(data)}
+        buffers.append(data + b'\0' * _pad(len(data)))
+        offset += len(data) + _pad(len(data))
+        return entry
+
+    for col in df.columns:
+        series = df[col]
+        if series.dtype.kind in 'biufcmM':
+            array = np.ascontiguousarray(series.to_numpy())
+            columns.append({'name': str(col), 'kind': _NATIVE, 'dtype': array.dtype.str, **_add(array.tobytes())})
+            continue
+        encoded = _encode_text(series.to_numpy(dtype=object))
+        if encoded is None:
+            raise TypeError(f"column '{col}' holds values that are neither numbers, dates nor text")
+        codes, blob, n = encoded
+        columns.append({'name': str(col), 'kind': _TEXT, 'uniques': n,
+                        'codes': _add(codes.tobytes()), 'text': _add(blob)})
+
+    meta = source_meta(source) if source is not None else {}
+    header = json.dumps({'version': FORMAT_VERSION, **meta,
+                         'rows': len(df), 'columns': columns}).encode('utf-8')
+    start = len(_MAGIC) + 8 + len(header)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_MAGIC + struct.pack('<Q', len(header)) + header + b'\0' * _pad(start))
+        for data in buffers:
+            f.write(data)
+    os.replace(tmp, path)
+
+
+def _read_header(f) -> tuple:
+    if f.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError(f"{f.name} is not a columnar table")
+    size, = struct.unpack('<Q', f.read(8))
+    header = json.loads(f.read(size))
+    start = len(_MAGIC) + 8 + size
+    return header, start + _pad(start)
+
+
+def read_frame(path: str) -> pd.DataFrame:
+    """Read a frame written by `write_frame`"""
+    with open(path, 'rb') as f:
+        header, start = _read_header(f)
+        f.seek(start)
+        data = f.read()
+
+    rows = header['rows']
+    frame = {}
+    for col in header['columns']:
+        if col['kind'] == _NATIVE:
+            frame[col['name']] = np.frombuffer(data, dtype=col['dtype'], count=rows, offset=col['offset'])
+        else:
+            codes = np.frombuffer(data, dtype=np.int32, count=rows, offset=col['codes']['offset'])
+            text = col['text']
+            frame[col['name']] = _decode_text(codes, data[text['offset']:text['offset'] + text['nbytes']], col['uniques'])
+    return pd.DataFrame(frame, index=pd.RangeIndex(rows))
+
+
+def write_arrays(path: str, arrays: dict, **meta):
+    """Write named 1-d numpy arrays (numbers or fixed-width text) to `path`
+
+    Extra keyword arguments are stored in the header and returned by
+    `map_arrays`
+    """
+    entries, offset = [], 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        entries.append({'name': name, 'dtype': array.dtype.str, 'count': len(array), 'offset': offset})
+        offset += array.nbytes + _pad(array.nbytes)
+    header = json.dumps({'version': FORMAT_VERSION, 'arrays': entries, **meta}).encode('utf-8')
+    start = len(_MAGIC) + 8 + len(header)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_MAGIC + struct.pack('<Q', len(header)) + header + b'\0' * _pad(start))
+        for array in arrays.values():
+            data = np.ascontiguousarray(array).tobytes()
+            f.write(data + b'\0' * _pad(len(data)))
+    os.replace(tmp, path)
+
+
+def map_arrays(path: str) -> tuple:
+    """Memory-map the arrays written by `write_arrays` -> (header, {name: array}, mmap)
+
+    Pages are only read from disk when an array element is touched. The
+    mmap can only be closed once the arrays are no longer referenced
+    """
+    with open(path, 'rb') as f:
+        header, start = _read_header(f)
+        if header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"{path} was written by an incompatible version")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    arrays = {}
+    for entry in header['arrays']:
+        arrays[entry['name']] = np.frombuffer(mapped, dtype=entry['dtype'], count=entry['count'], offset=start + entry['offset'])
+    return header, arrays, mapped
+
+
+def _source(path: str) -> Optional[dict]:
+    try:
+        with open(path, 'rb') as f:
+            header, _ = _read_header(f)
+    except (OSError, ValueError):
+        return None
+    return header if header.get('version') == FORMAT_VERSION else None
+
+
+def built_from(path: str, csv_path: str) -> bool:
+    """Whether the file at `path` was built from the current content of `csv_path`"""
+    header = _source(path)
+    if header is None or header.get('source_size') != os.path.getsize(csv_path):
+        return False
+    return header.get('source_hash') == source_digest(csv_path)
+
+
+def is_current(csv_path: str) -> bool:
+    """Whether the columnar twin of `csv_path` exists and matches it"""
+    path = columnar_path(csv_path)
+    if not os.path.exists(path):
+        return False
+    return built_from(path, csv_path)
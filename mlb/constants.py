@@ -1,4 +1,12 @@
-BASE = "https://statsapi.mlb.com/api/v1"
+import os
+
+STATSAPI_ROOT = "https://statsapi.mlb.com/api"
+
+# MLB_API_ROOT points the library at another StatsAPI-compatible server
+# (e.g. `python -m mlb.devserver`); see `mlb.set_api_root`
+API_ROOT = os.environ.get('MLB_API_ROOT', STATSAPI_ROOT).rstrip('/')
+BASE     = API_ROOT + "/v1"
+BASE_V11 = API_ROOT + "/v1.1"
 
 CLIP_BASE_TEMP = "https://mlb-cuts-diamond.mlb.com/FORGE/{year}/{year}-{month}/{clip_idx}/{playbackID}_1280x720_59_4000K.mp4"
 
@@ -0,0 +1,99 @@
+"""Pluggable JSON decoding
+
+Every StatsAPI response the library decodes goes through `loads()`. The
+backend is picked from whatever is installed, fastest first:
+
+    orjson -> msgspec -> simdjson -> json (stdlib)
+
+Set the MLB_JSON_DECODER environment variable or call `set_decoder()` to
+force a specific one.
+"""
+import os
+import json
+from typing import Callable, Optional, Union
+
+
+def _stdlib() -> Callable:
+    return json.loads
+
+
+def _orjson() -> Callable:
+    import orjson
+    return orjson.loads
+
+
+def _msgspec() -> Callable:
+    import msgspec
+    return msgspec.json.decode
+
+
+def _simdjson() -> Callable:
+    import simdjson
+    return simdjson.loads
+
+
+BACKENDS = {
+    'orjson':   _orjson,
+    'msgspec':  _msgspec,
+    'simdjson': _simdjson,
+    'json':     _stdlib,
+}
+
+_name: str = None
+_loads: Callable = None
+
+# what `loads` raises for a document that isn't valid JSON
+DECODE_ERRORS: tuple = (ValueError,)
+
+
+def available() -> list:
+    """Names of the backends that can be imported (in order of preference)"""
+    names = []
+    for name, factory in BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend(name: str) -> Callable:
+    """The `loads` function of a specific backend"""
+    if name not in BACKENDS:
+        raise ValueError(f"unknown JSON decoder '{name}' (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+
+def _decode_errors(name: str) -> tuple:
+    if name == 'msgspec':
+        import msgspec
+        return (ValueError, msgspec.DecodeError)
+    return (ValueError,)
+
+
+def set_decoder(name: Optional[str] = None) -> str:
+    """Select the JSON backend (None picks the fastest one installed)
+
+    Returns the name of the backend in use
+    """
+    global _name, _loads, DECODE_ERRORS
+    if name is None:
+        name = available()[0]
+    _loads = get_backend(name)
+    DECODE_ERRORS = _decode_errors(name)
+    _name = name
+    return name
+
+
+def get_decoder() -> str:
+    """Name of the JSON backend in use"""
+    return _name
+
+
+def loads(data: Union[bytes, str]):
+    """Decode a JSON document (bytes or str)"""
+    return _loads(data)
+
+
+set_decoder(os.environ.get('MLB_JSON_DECODER') or None)
@@ -0,0 +1,406 @@
+"""Local StatsAPI stand-in for load testing
+
+Implements the StatsAPI routes the library uses (`/people`, `/teams`,
+`/schedule`, `/standings`, `/game/{pk}/feed/live`, `/stats`,
+`/transactions`, `/awards`) and answers them from a fixture archive
+recorded with `mlb.record_fixtures`, or with synthetic payloads shaped like
+the real ones. Any other `/api/...` path gets a small generic payload, so
+fan-out code like `Franchise` can be pointed at it wholesale.
+
+Run it as a script and point the library at it with MLB_API_ROOT:
+
+```
+python -m mlb.devserver --port 8900 --latency 0.05 --error-rate 0.01 --scale 10
+MLB_CACHE=0 MLB_API_ROOT=http://127.0.0.1:8900/api python my_load_test.py
+```
+
+(MLB_CACHE=0 keeps the response cache from answering repeated requests
+before they reach the server.)
+
+or in-process:
+
+```
+from mlb.devserver import serve
+
+with serve(latency=0.02, error_rate=0.05) as server:
+    mlb.Franchise(145)      # every request goes to the local server
+    print(server.stats)
+```
+
+`serve()` turns the response cache off for the block (`use_cache=True`
+keeps it on), so load tests measure the requests rather than cache hits.
+"""
+import re
+import json
+import time
+import random
+import asyncio
+import argparse
+import threading
+import contextlib
+from typing import Optional
+from urllib.parse import urlsplit, unquote
+
+from aiohttp import web
+
+from .constants import STATSAPI_ROOT
+from .projections import apply_fields
+
+COPYRIGHT = "Copyright 2022 MLB Advanced Media, L.P.  (local stand-in data)"
+
+ERROR_STATUSES = (500, 502, 503)
+
+_FIELDS_PARAM = re.compile(r'(?<=[?&])fields=[^&]*&?')
+
+
+def _team(rnd: random.Random, mlbam: int, season) -> dict:
+    return {
+        "id": mlbam, "name": f"Team {mlbam}", "teamName": f"T{mlbam}", "abbreviation": f"T{mlbam % 1000:02d}",
+        "locationName": f"City {mlbam}", "franchiseName": f"City {mlbam}", "clubName": f"T{mlbam}", "shortName": f"City {mlbam}",
+        "season": int(season), "venue": {"id": mlbam + 1000, "name": f"Park {mlbam}"},
+        "league": {"id": 103 + mlbam % 2}, "division": {"id": 200 + mlbam % 6},
+        "firstYearOfPlay": "1901", "active": True,
+        "record": {"wins": rnd.randint(50, 110), "losses": rnd.randint(50, 110)},
+    }
+
+
+def _person(rnd: random.Random, mlbam: int) -> dict:
+    return {
+        "id": mlbam, "fullName": f"Player {mlbam}", "fullFMLName": f"Player {mlbam}", "firstName": "Player", "lastName": str(mlbam),
+        "primaryNumber": str(rnd.randint(1, 99)), "birthDate": f"19{rnd.randint(80, 99)}-0{rnd.randint(1, 9)}-1{rnd.randint(0, 9)}",
+        "currentAge": rnd.randint(20, 40), "height": "6' 1\"", "weight": rnd.randint(170, 250), "active": True,
+        "primaryPosition": {"code": str(rnd.randint(1, 9)), "abbreviation": rnd.choice(["P", "C", "1B", "SS", "CF"])},
+        "batSide": {"code": rnd.choice("LRS")}, "pitchHand": {"code": rnd.choice("LR")},
+        "mlbDebutDate": "2015-04-06", "strikeZoneTop": 3.4, "strikeZoneBottom": 1.6,
+        "rosterEntries": [{"jerseyNumber": "1", "position": {"abbreviation": "SS"}, "status": {"description": "Active"},
+                           "team": _team(rnd, 108 + mlbam % 30, 2022), "startDate": "2022-04-07", "isActive": True}],
+    }
+
+
+def _stat(rnd: random.Random) -> dict:
+    ab = rnd.randint(0, 600)
+    hits = rnd.randint(0, ab // 3 + 1)
+    return {"gamesPlayed": rnd.randint(0, 162), "atBats": ab, "hits": hits, "homeRuns": rnd.randint(0, 40),
+            "avg": f"{hits / ab if ab else 0:.3f}"[1:], "era": f"{rnd.uniform(1, 7):.2f}", "strikeOuts": rnd.randint(0, 250)}
+
+
+def _splits(rnd: random.Random, n: int, season) -> list:
+    return [{"season": str(season), "stat": _stat(rnd), "team": {"id": 108 + i % 30},
+             "opponent": {"id": 108 + (i + 1) % 30}, "game": {"gamePk": 660000 + i}, "date": f"{season}-06-01",
+             "player": {"id": 400000 + i, "fullName": f"Player {400000 + i}"}} for i in range(n)]
+
+
+def _game(rnd: random.Random, game_pk: int, date: str) -> dict:
+    return {
+        "gamePk": game_pk, "gameType": "R", "season": date[:4], "gameDate": f"{date}T23:05:00Z", "officialDate": date,
+        "status": {"abstractGameState": "Final", "detailedState": "Final", "statusCode": "F"},
+        "teams": {side: {"team": {"id": rnd.randint(108, 147)}, "score": rnd.randint(0, 12), "isWinner": side == "home"}
+                  for side in ("away", "home")},
+        "venue": {"id": rnd.randint(1, 5000)},
+    }
+
+
+class Synthetic:
+    """Generators for synthetic StatsAPI payloads
+
+    `scale` multiplies the length of every list in a payload (roster sizes,
+    games per schedule, plays per feed, ...)
+    """
+    def __init__(self, scale: float = 1.0, seed: int = 0):
+        self.scale = scale
+        self.seed = seed
+
+    def _n(self, base: int) -> int:
+        return max(1, int(base * self.scale))
+
+    def _rnd(self, request: web.Request) -> random.Random:
+        # same url -> same payload (with or without a `fields=` projection)
+        return random.Random(f"{self.seed}:{_FIELDS_PARAM.sub('', request.raw_path).rstrip('?&')}")
+
+    def people(self, request, rnd):
+        ids = request.match_info.get('id') or request.query.get('personIds', '660271')
+        return {"people": [_person(rnd, int(i)) for i in ids.split(',') if i.isdigit()]}
+
+    def people_stats(self, request, rnd):
+        season = request.query.get('season', 2022)
+        return {"stats": [{"type": {"displayName": t}, "group": {"displayName": g}, "splits": _splits(rnd, self._n(5), season)}
+                          for t in request.query.get('stats', 'season').split(',')
+                          for g in request.query.get('group', 'hitting').split(',')]}
+
+    def teams(self, request, rnd):
+        season = request.query.get('season', 2022)
+        if 'id' in request.match_info:
+            team = _team(rnd, int(request.match_info['id']), season)
+            hydrate = request.query.get('hydrate', '')
+            for hydration, key, day in (('previousSchedule', 'previousGameSchedule', '2022-06-01'),
+                                        ('nextSchedule', 'nextGameSchedule', '2022-06-02')):
+                if hydration in hydrate:
+                    games = [_game(rnd, 660000 + rnd.randint(0, 99999), day) for _ in range(self._n(1))]
+                    team[key] = {"totalGames": len(games), "dates": [{"date": day, "games": games}]}
+            return {"teams": [team]}
+        return {"teams": [_team(rnd, 108 + i, season) for i in range(self._n(30))]}
+
+    def roster(self, request, rnd):
+        size = {'40Man': 40, 'active': 26, 'allTime': 1500, 'coach': 12}.get(request.match_info.get('roster_type', 'active'), 40)
+        return {"roster": [{"person": _person(rnd, 400000 + i), "jerseyNumber": str(i % 99),
+                            "position": {"abbreviation": rnd.choice(["P", "C", "1B", "SS", "CF"])},
+                            "status": {"code": "A"}} for i in range(self._n(size))]}
+
+    def team_stats(self, request, rnd):
+        season = request.query.get('season', 2022)
+        return {"stats": [{"type": {"displayName": t}, "group": {"displayName": g}, "splits": _splits(rnd, self._n(1), season)}
+                          for t in request.query.get('stats', 'season').split(',')
+                          for g in request.query.get('group', 'hitting').split(',')]}
+
+    def schedule(self, request, rnd):
+        date = request.query.get('date') or request.query.get('startDate') or '2022-06-01'
+        date = re.sub(r'(\d+)/(\d+)/(\d{4})', r'\3-\1-\2', date)
+        games = [_game(rnd, 660000 + rnd.randint(0, 99999), date) for _ in range(self._n(15))]
+        return {"totalGames": len(games), "dates": [{"date": date, "totalGames": len(games), "games": games}]}
+
+    def standings(self, request, rnd):
+        season = request.query.get('season', 2022)
+        return {"records": [{"standingsType": "regularSeason", "league": {"id": 103 + d // 3}, "division": {"id": 200 + d},
+                             "teamRecords": [{"team": {"id": 108 + d * 5 + i}, "season": str(season), "wins": rnd.randint(50, 110),
+                                              "losses": rnd.randint(50, 110), "divisionRank": str(i + 1),
+                                              "gamesBack": "-" if i == 0 else str(rnd.randint(1, 30))}
+                                             for i in range(self._n(5))]} for d in range(6)]}
+
+    def feed(self, request, rnd):
+        game_pk = int(request.match_info['pk'])
+        plays = [{"result": {"type": "atBat", "event": rnd.choice(["Single", "Strikeout", "Groundout", "Walk"]),
+                             "description": "synthetic play", "rbi": rnd.randint(0, 2)},
+                  "about": {"atBatIndex": i, "halfInning": ("top", "bottom")[i % 2], "inning": i // 8 + 1},
+                  "matchup": {"batter": {"id": 400000 + i % 9}, "pitcher": {"id": 500000 + i // 30}},
+                  "playEvents": [{"pitchData": {"startSpeed": rnd.uniform(70, 100)},
+                                  "details": {"call": {"code": "B", "description": "Ball"}}}
+                                 for _ in range(rnd.randint(1, 7))]}
+                 for i in range(self._n(75))]
+        return {"gamePk": game_pk, "metaData": {"timeStamp": "20220601_230500"},
+                "gameData": {"game": {"pk": game_pk}, "status": {"abstractGameState": "Final"},
+                             "teams": {"away": _team(rnd, 145, 2022), "home": _team(rnd, 147, 2022)}},
+                "liveData": {"plays": {"allPlays": plays}, "linescore": {}, "boxscore": {}}}
+
+    def stats(self, request, rnd):
+        season = request.query.get('season', 2022)
+        return {"stats": [{"group": {"displayName": g}, "splits": _splits(rnd, self._n(50), season)}
+                          for g in request.query.get('group', 'hitting').split(',')]}
+
+    def leaders(self, request, rnd):
+        return {"leagueLeaders": [{"leaderCategory": cat, "leaders": [
+                    {"rank": i + 1, "value": str(100 - i), "person": {"id": 400000 + i}} for i in range(self._n(10))]}
+                    for cat in request.query.get('leaderCategories', 'homeRuns').split(',')]}
+
+    def transactions(self, request, rnd):
+        return {"transactions": [{"id": i, "person": {"id": 400000 + i}, "toTeam": {"id": 108 + i % 30},
+                                  "date": request.query.get('startDate', '2022-06-01'), "typeCode": "SC",
+                                  "description": "synthetic transaction"} for i in range(self._n(50))]}
+
+    def awards(self, request, rnd):
+        return {"awards": [{"id": request.match_info['award'], "name": "Award", "season": str(1936 + i),
+                            "player": {"id": 400000 + i, "nameFirstLast": f"Player {400000 + i}"},
+                            "team": {"id": 108 + i % 30}} for i in range(self._n(40))]}
+
+    def person_awards(self, request, rnd):
+        return {"awards": [{"id": f"AWARD{i}", "name": "Award", "date": f"{2015 + i}-11-01", "season": str(2015 + i),
+                            "team": {"id": 108 + i % 30, "teamName": f"Team {108 + i % 30}"}} for i in range(self._n(3))]}
+
+    def other(self, request, rnd):
+        return {}
+
+
+class StatsAPIServer:
+    """Local StatsAPI stand-in
+
+    Parameters:
+    -----------
+    host : str, default '127.0.0.1'
+
+    port : int, default 0
+        0 picks a free port (see `root` once started)
+
+    fixtures : str, optional
+        fixture archive (from `mlb.record_fixtures`). Recorded urls are
+        served as recorded; everything else is synthetic
+
+    latency : float, default 0
+        seconds added to every response
+
+    jitter : float, default 0
+        extra random delay of up to `jitter` seconds
+
+    error_rate : float, default 0
+        fraction of requests answered with a 500/502/503
+
+    scale : float, default 1
+        multiplier for the size of synthetic payloads
+
+    seed : int, default 0
+
+    """
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, fixtures: Optional[str] = None, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, scale: float = 1.0, seed: int = 0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.synthetic = Synthetic(scale, seed)
+        self.recorded = _load_fixtures(fixtures) if fixtures else {}
+        self.stats = {'requests': 0, 'recorded': 0, 'synthetic': 0, 'errors': 0}
+        self._rnd = random.Random(seed)
+        self._loop = None
+        self._thread = None
+        self._runner = None
+
+    def __repr__(self):
+        return f"<StatsAPIServer {self.root} requests={self.stats['requests']}>"
+
+    @property
+    def root(self) -> str:
+        """Value for `mlb.set_api_root`/MLB_API_ROOT"""
+        return f"http://{self.host}:{self.port}/api"
+
+    def app(self) -> web.Application:
+        s = self.synthetic
+        routes = [
+            ('/api/v1/people', s.people),
+            ('/api/v1/people/{id:\\d+}', s.people),
+            ('/api/v1/people/{id:\\d+}/stats', s.people_stats),
+            ('/api/v1/people/{id:\\d+}/awards', s.person_awards),
+            ('/api/v1/teams', s.teams),
+            ('/api/v1/teams/{id:\\d+}', s.teams),
+            ('/api/v1/teams/{id:\\d+}/roster/{roster_type}', s.roster),
+            ('/api/v1/teams/{id:\\d+}/roster', s.roster),
+            ('/api/v1/teams/{id:\\d+}/stats', s.team_stats),
+            ('/api/v1/teams/stats', s.stats),
+            ('/api/v1/schedule', s.schedule),
+            ('/api/v1/standings', s.standings),
+            ('/api/{version:v1(\\.1)?}/game/{pk:\\d+}/feed/live', s.feed),
+            ('/api/v1/stats', s.stats),
+            ('/api/v1/stats/leaders', s.leaders),
+            ('/api/v1/teams/stats/leaders', s.leaders),
+            ('/api/v1/transactions', s.transactions),
+            ('/api/v1/awards/{award}/recipients', s.awards),
+            ('/api/{tail:.*}', s.other),
+        ]
+        app = web.Application()
+        for path, generator in routes:
+            app.router.add_get(path, self._handler(generator))
+        return app
+
+    def _handler(self, generator):
+        async def handle(request: web.Request) -> web.Response:
+            self.stats['requests'] += 1
+            delay = self.latency + (self._rnd.uniform(0, self.jitter) if self.jitter else 0)
+            if delay:
+                await asyncio.sleep(delay)
+            if self.error_rate and self._rnd.random() < self.error_rate:
+                self.stats['errors'] += 1
+                return web.json_response({"message": "injected error"}, status=self._rnd.choice(ERROR_STATUSES))
+            fields = request.query.get('fields')
+            path = unquote(request.raw_path)
+            recorded = self.recorded.get(path)
+            if recorded is None and fields:
+                # the unprojected recording, trimmed like StatsAPI would
+                recorded = self.recorded.get(_FIELDS_PARAM.sub('', path).rstrip('?&'))
+            if recorded is not None:
+                self.stats['recorded'] += 1
+                body = recorded['body'].encode('utf-8')
+                if fields and recorded['status'] == 200:
+                    body = json.dumps(apply_fields(json.loads(body), fields)).encode('utf-8')
+                return web.Response(body=body, status=recorded['status'], content_type='application/json')
+            self.stats['synthetic'] += 1
+            payload = {"copyright": COPYRIGHT, **generator(request, self.synthetic._rnd(request))}
+            if fields:
+                payload = apply_fields(payload, fields)
+            return web.json_response(payload)
+        return handle
+
+    async def _start(self):
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    def start(self) -> str:
+        """Start serving in a background thread; returns `root`"""
+        ready = threading.Event()
+
+        def _serve():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._start())
+            self._loop.call_soon(ready.set)
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=_serve, name="mlb-devserver", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.root
+
+    def stop(self):
+        if self._loop is not None and self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+
+def _load_fixtures(path: str) -> dict:
+    from .async_mlb.replay import load_archive
+    recorded = {}
+    for entry in load_archive(path):
+        if 'body' not in entry:
+            continue
+        parts = urlsplit(entry['url'])
+        recorded[unquote(parts.path + (f"?{parts.query}" if parts.query else ''))] = entry
+    return recorded
+
+
+@contextlib.contextmanager
+def serve(use_cache=False, **kwargs):
+    """Run a `StatsAPIServer(**kwargs)` and point the library at it for the block
+
+    The response cache is turned off inside the block unless `use_cache` is
+    True, so every request reaches the server
+    """
+    from .async_mlb.transport import set_api_root
+    from .async_mlb.replay import _cache_disabled
+    server = StatsAPIServer(**kwargs)
+    previous = set_api_root(server.start())
+    try:
+        with _cache_disabled(not use_cache):
+            yield server
+    finally:
+        set_api_root(previous)
+        server.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local StatsAPI stand-in (replaces " + STATSAPI_ROOT + ")")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--fixtures', help='fixture archive recorded with mlb.record_fixtures')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = StatsAPIServer(args.host, args.port, args.fixtures, args.latency, args.jitter,
+                            args.error_rate, args.scale, args.seed)
+    server.start()
+    print(f"serving on {server.root}  (export MLB_API_ROOT={server.root})")
+    try:
+        while True:
+            time.sleep(60)
+            print(json.dumps(server.stats))
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
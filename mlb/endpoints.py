@@ -0,0 +1,97 @@
+"""Classification helpers for StatsAPI urls
+
+Used to decide how long a response can be cached and to group requests by
+the kind of endpoint they hit.
+"""
+import re
+import datetime as dt
+from urllib.parse import urlparse, parse_qs, parse_qsl
+
+# (endpoint class, path pattern) -- first match wins
+ENDPOINT_CLASSES = [
+    ('live',         re.compile(r'/game/\d+/feed/live')),
+    ('game',         re.compile(r'/game/\d+')),
+    ('schedule',     re.compile(r'/schedule')),
+    ('standings',    re.compile(r'/standings')),
+    ('transactions', re.compile(r'/transactions')),
+    ('awards',       re.compile(r'/awards')),
+    ('draft',        re.compile(r'/draft')),
+    ('stats',        re.compile(r'/stats')),
+    ('people',       re.compile(r'/people')),
+    ('teams',        re.compile(r'/teams')),
+    ('reference',    re.compile(r'/(venues|seasons|leagues|divisions|sports|pitchTypes|pitchCodes|eventTypes|gameTypes|positions)')),
+]
+
+_SEASON_PATH = re.compile(r'/draft/(\d{4})')
+DATE_KEYS = ('date', 'startDate', 'endDate')
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+def endpoint_class(url: str) -> str:
+    """Name of the endpoint class a url belongs to ('other' if unknown)"""
+    path = urlparse(url).path
+    for name, pattern in ENDPOINT_CLASSES:
+        if pattern.search(path):
+            return name
+    return 'other'
+
+
+def url_template(url: str) -> str:
+    """Url with ids and query values left out, for grouping requests in metrics
+
+    `https://statsapi.mlb.com/api/v1/teams/142/roster?season=2022` ->
+    `/api/v1/teams/{id}/roster?season`
+    """
+    components = urlparse(url)
+    path = _ID_SEGMENT.sub('/{id}', components.path)
+    keys = sorted({k for k, _ in parse_qsl(components.query, keep_blank_values=True)})
+    return f"{path}?{'&'.join(keys)}" if keys else path
+
+
+def _parse_date(value: str):
+    for fmt in (r"%Y-%m-%d", r"%m/%d/%Y"):
+        try:
+            return dt.datetime.strptime(value, fmt).date()
+        except ValueError:
+            pass
+    return None
+
+
+def url_dates(url: str) -> list:
+    """Dates a url asks for ('date', 'startDate', 'endDate'; None where unparseable)"""
+    params = parse_qs(urlparse(url).query)
+    return [_parse_date(d) for key in DATE_KEYS for d in params.get(key, [])]
+
+
+def is_historical(url: str, today: dt.date = None) -> bool:
+    """True if every season/date a url asks for is already in the past
+
+    Season values count as historical when they're earlier than the current
+    calendar year; date values ('date', 'startDate', 'endDate') when they're
+    earlier than today. A url with neither is never historical.
+    """
+    today = today or dt.date.today()
+    components = urlparse(url)
+    params = parse_qs(components.query)
+
+    seasons = []
+    for key in ('season', 'seasons'):
+        for value in params.get(key, []):
+            seasons.extend(value.split(','))
+    m = _SEASON_PATH.search(components.path)
+    if m:
+        seasons.append(m.group(1))
+
+    dates = url_dates(url)
+
+    if not seasons and not dates:
+        return False
+    for s in seasons:
+        if not s.strip().isdigit() or int(s) >= today.year:
+            return False
+    if 'startDate' in params and 'endDate' not in params:
+        return False
+    for d in dates:
+        if d is None or d >= today:
+            return False
+    return True
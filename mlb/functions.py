@@ -1,21 +1,25 @@
-import time
 import datetime as dt
 import platform, requests
-from urllib.parse import unquote
+from urllib.parse import unquote, parse_qsl
 from typing import Union, Optional, List
 
 import pandas as pd
-import asyncio, aiohttp, nest_asyncio
+import asyncio
 from bs4 import BeautifulSoup as bs, SoupStrainer
 
 from . import mlb_dataclasses as dclass
 from . import constants as c
-from . import parsing, helpers, mlbdata
-from .async_mlb import fetch, _determine_loop
+from . import parsing, helpers, mlbdata, projections
+from .async_mlb import fetch, fetch_async, fetch_text_async, syncable, FetchError
+from .async_mlb import get_json_async as _get_json
+from .async_mlb.transport import request
+from .async_mlb.planner import plan_requests
+from .async_mlb import events
+from .async_mlb.events import stage
+from .people_index import get_people_index
 from .utils import curr_date, default_season, get_tzinfo
 from .helpers import ExtendedDict
 
-nest_asyncio.apply()
 
 if platform.system() == "Windows":
     standard_time_fmt = r"%I:%M %p"
@@ -28,23 +32,22 @@ else:
 
 async def _parse_player_data(
     data,
-    session:aiohttp.ClientSession,
     _url,
     _mlbam=None):
     if "hydrate=currentTeam" in _url:
         data = data["people"][0]
         debut = data["mlbDebutDate"]
         query = f"stats=gameLog&startDate={debut}&endDate={debut}&hydrate=team"
-        resp = await session.get(f"{c.BASE}/people/{_mlbam}/stats?{query}")
-        data["debut_data"] = await resp.json()
+        resp = await _get_json(f"{c.BASE}/people/{_mlbam}/stats?{query}")
+        data["debut_data"] = resp.json
         return data
     elif type(data) is dict:
         return data
     else:
         soup = bs(data,'lxml',parse_only=SoupStrainer("a"))
         href_url = soup.find("a",text="View Player Info")["href"]
-        resp = await session.get(href_url)
-        bio_page = await resp.text()
+        resp = await request(href_url)
+        bio_page = resp.text
         soup = bs(bio_page,'lxml',parse_only=SoupStrainer(['div','h2','p']))
 
         all_ps = soup.find(id="mw-content-text").find("div",class_="mw-parser-output").find("h2").find_all_next("p")
@@ -58,34 +61,33 @@ async def _fetch_player_data(
     _get_bio=None,
     _mlbam=None):
     retrieved_responses = []
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            tasks.append(session.get(url, ssl=False))
+    urls = list(urls)
+    # the bio page is HTML; everything else is StatsAPI JSON
+    bio_url = urls.pop(0) if _get_bio is True else None
+    tasks = [fetch_async(urls)]
+    if bio_url is not None:
+        tasks.append(request(bio_url))
+
+    results = await asyncio.gather(*tasks)
+    
+    if bio_url is not None:
+        bio_resp = results[1]
+        parsed_data = await _parse_player_data(data=bio_resp.text,_url=bio_resp.url,_mlbam=_mlbam)
+        retrieved_responses.append(parsed_data)
 
-        responses = await asyncio.gather(*tasks)
-        
-        for resp_idx, response in enumerate(responses):
-            if resp_idx == 0 and _get_bio is True:
-                resp = await response.text()
-            else:
-                resp = await response.json()
-            
-            parsed_data = await _parse_player_data(data=resp,session=session,_url=str(response.url),_mlbam=_mlbam)
+    for response in results[0]:
+        parsed_data = await _parse_player_data(data=response.json,_url=response.url,_mlbam=_mlbam)
 
-            retrieved_responses.append(parsed_data)
-        
-        await session.close()
+        retrieved_responses.append(parsed_data)
     
     return retrieved_responses
 
 async def _parse_team_data(
-    data,session:aiohttp.ClientSession,
+    data,
     _url,
     lgs_df:pd.DataFrame,
     _mlbam,
     **kwargs):
-    start = time.time()
     if f"/teams/{_mlbam}?season=" in _url:
         team_info_parsed = {}
         teams : dict = data["teams"][0]
@@ -282,9 +284,6 @@ async def _parse_team_data(
                                          'recap_avail',
                                          ])
 
-        if kwargs.get('_logtime') is True:
-            print(f"\n{unquote(_url).replace(c.BASE,'')}")
-            print(f'--- {time.time() - start} seconds ---\n')
         return sched_df
     
     elif "statSplits" in _url and "/roster/" in _url:
@@ -344,9 +343,6 @@ async def _parse_team_data(
             combined_df = pd.DataFrame(stat_data).rename(columns=c.STATDICT)
             # print(pd.DataFrame(stat_data).rename(columns=c.STATDICT).columns)
 
-        if kwargs.get('_logtime') is True:
-            print(f"\n{unquote(_url).replace(c.BASE,'')}")
-            print(f'--- {time.time() - start} seconds ---\n')
 
         return combined_df
 
@@ -378,9 +374,6 @@ async def _parse_team_data(
             data=coach_data,
             columns=['job','job_title','job_id','jersey_number_coach','jersey_number_primary','name','birth_date','age','pos','mlb_debut','last_played'])
 
-        if kwargs.get('_logtime') is True:
-            print(f"\n{unquote(_url).replace(c.BASE,'')}")
-            print(f'--- {time.time() - start} seconds ---\n')
 
         return df
 
@@ -449,9 +442,6 @@ async def _parse_team_data(
             combined_df = pd.DataFrame(stat_data).rename(columns=c.STATDICT)
             # print(pd.DataFrame(stat_data).rename(columns=c.STATDICT).columns)
             
-        if kwargs.get('_logtime') is True:
-            print(f"\n{unquote(_url).replace(c.BASE,'')}")
-            print(f'--- {time.time() - start} seconds ---\n')
         return combined_df
 
     elif f"/teams/{_mlbam}/stats?stats=season,seasonAdvanced" in _url:
@@ -500,9 +490,6 @@ async def _parse_team_data(
 
                 stat_dict[add_to] = df
             
-            if kwargs.get('_logtime') is True:
-                print(f"\n{unquote(_url).replace(c.BASE,'')}")
-                print(f'--- {time.time() - start} seconds ---\n')
 
             return stat_dict
         else:
@@ -598,66 +585,61 @@ async def _parse_team_data(
             df = pd.DataFrame()
 
 
-        if kwargs.get('_logtime') is True:
-            print(f"\n{unquote(_url).replace(c.BASE,'')}")
-            print(f'--- {time.time() - start} seconds ---\n')
 
         return df
 
-    if kwargs.get('_logtime') is True:
-        print(f"\n{unquote(_url).replace(c.BASE,'')}")
-        print(f'--- {time.time() - start} seconds ---\n')
 
     return data
 
+def _missing_team_section(_url,_mlbam):
+    """Empty stand-in for a `_team_urls` section that didn't arrive"""
+    if f"/teams/{_mlbam}/stats?stats=season,seasonAdvanced" in _url:
+        return {'regular':pd.DataFrame(),'advanced':pd.DataFrame()}
+    return pd.DataFrame()
+
 async def _fetch_team_data(
     urls:list,
     lgs_df:pd.DataFrame,
-    _mlbam,
-    _logtime=None):
-    retrieved_responses = []
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            tasks.append(session.get(url, ssl=False))
-
-        responses = await asyncio.gather(*tasks)
+    _mlbam):
+    retrieved_responses, missing = [], []
+    plan = plan_requests(urls)
+    responses = await fetch_async(plan.urls)
+    payloads = plan.split([response.json if response else None for response in responses])
+    
+    for _url, resp in zip(plan.original, payloads):
+        if resp is None:
+            # only with partial results allowed; a `Team` can't do without its team info
+            if f"/teams/{_mlbam}?season=" in _url:
+                responses.raise_for_failures()
+            retrieved_responses.append(_missing_team_section(_url,_mlbam))
+            missing.append(_url)
+            continue
         
-        for response in responses:
-            resp = await response.json()
-            
+        with stage('parse',_url):
             parsed_data = await _parse_team_data(
                 data=resp,
-                session=session,
-                _url=str(response.url),
+                _url=_url,
                 lgs_df=lgs_df,
-                _mlbam=_mlbam,
-                _logtime=_logtime)
+                _mlbam=_mlbam)
 
-            retrieved_responses.append(parsed_data)
-        
-        await session.close()
+        retrieved_responses.append(parsed_data)
     
-    return retrieved_responses
+    return retrieved_responses, missing
 
 # ===============================================================
 # Bulk Retrieval
 # ===============================================================
 
-def _team_data(_mlbam,_season,**kwargs) -> Union[dict,list]:
-    start = time.time()
-    lgs_df = mlbdata.get_leagues_df().set_index('mlbam')
-    tms_df = mlbdata.mlbdata.get_teams_df()
-    ssn_df = mlbdata.get_seasons_df().set_index('season')
-    ssn_row = ssn_df.loc[int(_season)]
+def _season_range(_season) -> tuple:
+    """First and last day of the season ('YYYY-MM-DD' strings)"""
+    ssn_row = mlbdata.get_seasons_df().set_index('season').loc[int(_season)]
 
-    tms_df = tms_df[tms_df['season']==int(_season)]
-    
     ssn_start : pd.Timestamp = ssn_row['seasonStartDate']
     ssn_end   : pd.Timestamp = ssn_row['seasonEndDate']
-    ssn_start = ssn_start.strftime(r"%Y-%m-%d")
-    ssn_end   = ssn_end.strftime(r"%Y-%m-%d")
+    return ssn_start.strftime(r"%Y-%m-%d"), ssn_end.strftime(r"%Y-%m-%d")
 
+def _team_urls(_mlbam,_season,ssn_start,ssn_end) -> list:
+    """Every url a `Team` is built from, in `team_data_dict` order"""
     # Retrieves 'fullSeason' roster
     # -----------------------------
     # url_list = [
@@ -729,15 +711,11 @@ def _team_data(_mlbam,_season,**kwargs) -> Union[dict,list]:
         url_to_add = f"{c.BASE}/schedule?sportId=1&teamId={_mlbam}&season={_season}&{date_range_query}&gameType={c.GAME_TYPES_ALL}&hydrate={sched_hydrations}"
 
         url_list.append(url_to_add)
-    _logtime = kwargs.get('_logtime')
-    
-    # Generator comprehension
-    url_list = (url for url in url_list)
-    
-    loop = _determine_loop()
-    
-    team_data_dict = loop.run_until_complete(_fetch_team_data(urls=url_list,lgs_df=lgs_df,_mlbam=_mlbam,_logtime=_logtime))
-    
+
+    return url_list
+
+def _build_team_data(team_data_dict:list) -> dict:
+    """Assemble the parsed responses of `_team_urls` into the dict `Team` is built from"""
     total_hitting_S  = team_data_dict[8]
     total_pitching_S = team_data_dict[9]
     total_fielding_S = team_data_dict[10]
@@ -784,13 +762,27 @@ def _team_data(_mlbam,_season,**kwargs) -> Union[dict,list]:
         'schedule'     : pd.concat(team_data_dict[-12:]),
     }
 
-    if kwargs.get('_logtime') is True:
-        print("\n\nTOTAL:")
-        print(f"--- {time.time() - start} seconds ---")
+    return fetched_data
+
+async def _team_data(_mlbam,_season,**kwargs) -> Union[dict,list]:
+    # `log=True` prints the request and stage events of this call
+    with events.printing(kwargs.get('log',kwargs.get('_logtime'))), stage('total',f"team {_mlbam} {_season}"):
+        lgs_df = mlbdata.get_leagues_df().set_index('mlbam')
+        ssn_start, ssn_end = _season_range(_season)
+
+        url_list = _team_urls(_mlbam,_season,ssn_start,ssn_end)
+        
+        # Generator comprehension
+        url_list = (url for url in url_list)
+        
+        team_data_dict, missing = await _fetch_team_data(urls=url_list,lgs_df=lgs_df,_mlbam=_mlbam)
+        with stage('frame',f"team {_mlbam} {_season}"):
+            fetched_data = _build_team_data(team_data_dict)
+        fetched_data['missing'] = missing
 
     return fetched_data
 
-def _player_data(_mlbam,**kwargs) -> dict:
+async def _player_data(_mlbam,**kwargs) -> dict:
     """Fetch a variety of player information/stats in one API call
 
     Parameters
@@ -800,8 +792,8 @@ def _player_data(_mlbam,**kwargs) -> dict:
     
     """
     
-    pdf = mlbdata.get_people_df().set_index("mlbam").loc[_mlbam]
-    tdf = mlbdata.mlbdata.get_teams_df()
+    person_row = mlbdata.get_person_row(_mlbam) or {}
+    tdf = mlbdata.get_teams_df()
     lg_df = mlbdata.get_leagues_df().set_index("mlbam")
 
     url_list = []
@@ -821,8 +813,7 @@ def _player_data(_mlbam,**kwargs) -> dict:
     
     # Generator attempt
     url_list = (url for url in url_list)
-    loop = _determine_loop()
-    responses = loop.run_until_complete(_fetch_player_data(url_list,_get_bio=kwargs.get("_get_bio"),_mlbam=_mlbam))
+    responses = await _fetch_player_data(url_list,_get_bio=kwargs.get("_get_bio"),_mlbam=_mlbam)
     if kwargs.get("_get_bio") is True:
         _player_bio     = responses[-5]
     else:
@@ -832,6 +823,25 @@ def _player_data(_mlbam,**kwargs) -> dict:
     player_transactions = responses[-2]["transactions"]
     player_info         = responses[-1]
 
+    with stage('parse',f"person {_mlbam}"):
+        return _build_player_data(_mlbam,person_row.get('bbrefID') or "--",player_info,player_stats,player_awards,player_transactions,_player_bio,tdf,lg_df)
+
+def _build_player_data(
+    _mlbam,
+    bbrefID,
+    player_info:dict,
+    player_stats:list,
+    player_awards:list,
+    player_transactions:list,
+    _player_bio,
+    tdf:pd.DataFrame,
+    lg_df:pd.DataFrame) -> dict:
+    """Parse the StatsAPI data of one player into the dict `Person` is built from
+
+    `player_info` is the person record (with 'debut_data' attached); the
+    stats, awards and transactions are the lists from their endpoints (or
+    the matching hydrations of the person record)
+    """
     education           = player_info.get("education",{})
     roster_entries      = player_info.get("rosterEntries",[{}])
     draft               = player_info.get("drafts",[{}])
@@ -1250,7 +1260,7 @@ def _player_data(_mlbam,**kwargs) -> dict:
     
     _player_info = {
         'mlbam':                int(_mlbam),
-        'bbrefID':              pdf['bbrefID'],
+        'bbrefID':              bbrefID,
         'primary_position':     player_info.get('primaryPosition',{}),
         'givenName':            player_info['fullFMLName'],
         'fullName':             player_info['fullName'],
@@ -1529,7 +1539,7 @@ def _parse_franchise_standings(data:dict,lgs_df:pd.DataFrame) -> list[pd.DataFra
     
     return records_df, splits_df
         
-def _franchise_data(mlbam,**kwargs) -> dict:
+async def _franchise_data(mlbam,**kwargs) -> dict:
     """Fetch various team season data & information for a team in one API call
 
     Parameters
@@ -1569,37 +1579,41 @@ def _franchise_data(mlbam,**kwargs) -> dict:
     records = mlbdata.get_yby_records()
     records = records[records['tm_mlbam']==int(mlbam)]
     standings = mlbdata.get_standings_df()
-    standings = standings[standings['mlbam']==int(mlbam)]
+    standings = standings[standings['team_mlbam']==int(mlbam)]
 
     # == ASYNC STARTS HERE ===============================================
     lgs_df = mlbdata.get_leagues_df().set_index('mlbam')
-    team_df = mlbdata.mlbdata.get_teams_df()
+    team_df = mlbdata.get_teams_df()
     team_df = team_df[team_df['mlbam']==int(mlbam)]
     firstYear = team_df.iloc[0]["first_year"]
     years = range(firstYear,int(default_season())+1)
 
+    # the five required urls go first so a deadline can only cut off seasons
     urls = []
-    for year in years:
-        urls.append(f"https://statsapi.mlb.com/api/v1/teams/{mlbam}?hydrate=standings&season={year}")                   # yby_data
-
     hydrations = f"nextSchedule(limit=5),previousSchedule(limit=1,season={default_season()}),league,division"           # ---- (hydrations for 'team_info') ----
     urls.append(c.BASE + f"/teams/{mlbam}?hydrate={hydrations}")                                                          # team_info
     urls.append((c.BASE + f"/teams/{mlbam}/stats?stats=yearByYear,yearByYearAdvanced&group=hitting,pitching,fielding"))   # team_stats
     urls.append(f"https://statsapi.mlb.com/api/v1/teams/{mlbam}/roster/allTime")                                        # all_players
     urls.append(f"https://statsapi.mlb.com/api/v1/awards/MLBHOF/recipients")                                            # hof_players
     urls.append(f"https://statsapi.mlb.com/api/v1/awards/RETIREDUNI_{mlbam}/recipients")                                # retired_numbers
+    for year in reversed(years):
+        urls.append(f"https://statsapi.mlb.com/api/v1/teams/{mlbam}?hydrate=standings&season={year}")                   # yby_data (most recent first)
 
     # https://statsapi.mlb.com/api/v1/teams/stats/leaders?season=2021&leaderCategories=wins,losses
     # https://statsapi.mlb.com/api/v1/teams/145/roster/coach?season=1904
 
-    resps = fetch(urls)
+    # Seasons that still fail after retries are left out of the year-by-year
+    # data rather than failing the whole franchise
+    resps = await fetch_async(urls,partial=True)
+    if not all(resps[:5]):
+        resps.raise_for_failures()
     
-    yby_data = resps[:-5]
-    team_info = resps[-5]
-    team_stats = resps[-4]
-    all_players = resps[-3]
-    hof_players = resps[-2]
-    retired_numbers = resps[-1]
+    team_info = resps[0]
+    team_stats = resps[1]
+    all_players = resps[2]
+    hof_players = resps[3]
+    retired_numbers = resps[4]
+    yby_data = [r for r in reversed(resps[5:]) if r]
 
     records_df, splits_df = _parse_franchise_standings(data=yby_data,lgs_df=lgs_df)
     # ---- Parsing 'team_info' ---------
@@ -1843,7 +1857,197 @@ def _franchise_data(mlbam,**kwargs) -> dict:
 # PLAYER Functions
 # ===============================================================
 
-def player_stats(mlbam,**kwargs):
+# hydrations that give `/people` everything `Person` needs in one response
+PERSON_HYDRATE = "currentTeam,rosterEntries(team),education,draft,awards,transactions,stats(type=[career,careerAdvanced,yearByYear,yearByYearAdvanced],group=[hitting,pitching,fielding],gameType=[R,P])"
+PEOPLE_PER_REQUEST = 100
+MAX_URL_LENGTH = 4000
+
+def _people_chunks(ids:list,url_len:int) -> list:
+    """Split ids into the fewest `personIds=` lists that fit in a url"""
+    chunks, chunk, length = [], [], url_len
+    for i in ids:
+        i = str(i)
+        if chunk and (len(chunk) == PEOPLE_PER_REQUEST or length + len(i) + 1 > MAX_URL_LENGTH):
+            chunks.append(chunk)
+            chunk, length = [], url_len
+        chunk.append(i)
+        length += len(i) + 1
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+@syncable
+async def people_bulk(mlbams:list,hydrate:Optional[str]=None,as_df=False,debut=True) -> Union[dict,pd.DataFrame]:
+    """Look up many people at once with batched `/people?personIds=` requests
+
+    Ids are packed into as few requests as possible (up to
+    `PEOPLE_PER_REQUEST` per url), the batches are fetched concurrently and
+    the responses are split back up per person. Building a 40-man roster of
+    `Person` objects this way takes 1 request (+40 small debut lookups)
+    instead of ~200.
+
+    Parameters:
+    -----------
+    mlbams : list
+        people's official "MLB Advanced Media" IDs
+
+    hydrate : str, optional
+        StatsAPI hydrations for every person. By default everything `Person`
+        needs is hydrated and `Person` objects are returned
+
+    as_df : bool, default False
+        return one combined DataFrame (one row per person, nested records
+        flattened, list hydrations left out) instead
+
+    debut : bool, default True
+        also fetch each player's debut game (`Person.debut`); only applies to
+        the default hydrations
+
+    Returns:
+    --------
+    dict of mlbam -> `Person` (default hydrations) or mlbam -> person record
+    (custom hydrations), in the order given; or a DataFrame with `as_df`
+
+    """
+    from .classes import Person
+
+    ids = list(dict.fromkeys(int(i) for i in mlbams))
+    full = hydrate is None
+    hydrate = PERSON_HYDRATE if full else hydrate
+    url_base = f"{c.BASE}/people?hydrate={hydrate}&personIds="
+    urls = [url_base + ",".join(chunk) for chunk in _people_chunks(ids,len(url_base))]
+
+    people = {}
+    for resp in await fetch_async(urls):
+        for person in resp.json.get("people",[]):
+            people[person["id"]] = person
+    people = [people[i] for i in ids if i in people]
+
+    if as_df:
+        return pd.json_normalize([{k:v for k,v in p.items() if type(v) is not list} for p in people])
+    if not full:
+        return {p["id"]:p for p in people}
+
+    debuts = [{}] * len(people)
+    if debut:
+        debut_urls = []
+        for p in people:
+            d = p.get("mlbDebutDate")
+            if d is not None:
+                debut_urls.append(f"{c.BASE}/people/{p['id']}/stats?stats=gameLog&startDate={d}&endDate={d}&hydrate=team")
+        debut_resps = iter(await fetch_async(debut_urls))
+        debuts = [next(debut_resps).json if p.get("mlbDebutDate") is not None else {} for p in people]
+
+    people_ids = get_people_index()
+    tdf = mlbdata.get_teams_df()
+    lg_df = mlbdata.get_leagues_df().set_index("mlbam")
+
+    bulk = {}
+    for p, debut_data in zip(people,debuts):
+        info = {**p,"debut_data":debut_data}
+        with stage('parse',f"person {p['id']}"):
+            data = _build_player_data(p["id"],people_ids.convert(p["id"],"mlbam","bbrefID") or "--",info,p.get("stats",[]),p.get("awards",[]),
+                                      p.get("transactions",[]),[""],tdf,lg_df)
+        bulk[p["id"]] = Person(p["id"],_data=data)
+    return bulk
+
+def _team_schedule(data:dict,_mlbam:int,start:str,end:str) -> dict:
+    """The games of one team between `start` and `end` from a league-wide schedule"""
+    dates = []
+    for d in data.get("dates",[]):
+        if not start <= d["date"] <= end:
+            continue
+        games = [gm for gm in d.get("games",[])
+                 if _mlbam in (gm["teams"]["away"]["team"].get("id"),gm["teams"]["home"]["team"].get("id"))]
+        if games:
+            dates.append({**d,"games":games})
+    return {**data,"dates":dates,"totalGames":sum(len(d["games"]) for d in dates)}
+
+def _league_payload(url:str,_mlbam:int,league:dict) -> Optional[dict]:
+    """What a per-team url of `_team_urls` returns, cut out of the league-wide responses
+
+    None for urls that have to be requested for the team itself (rosters,
+    coaches, transactions)
+    """
+    path = url.split("?",1)[0]
+    params = dict(parse_qsl(url.split("?",1)[1]))
+    if path.endswith(f"/teams/{_mlbam}"):
+        return {**league["teams"],"teams":[t for t in league["teams"].get("teams",[]) if t["id"] == _mlbam]}
+    elif path.endswith(f"/teams/{_mlbam}/stats"):
+        data = league[params["gameType"]]
+        if "stats" not in data:
+            return data
+        stats = [{**item,"splits":[s for s in item.get("splits",[]) if s.get("team",{}).get("id") == _mlbam]}
+                 for item in data["stats"] if item.get("group",{}).get("displayName") == params["group"]]
+        return {**data,"stats":stats}
+    elif path.endswith("/schedule"):
+        return _team_schedule(league["schedule"],_mlbam,params["startDate"],params["endDate"])
+    elif "/draft/" in path:
+        drafts = league["draft"].get("drafts",{})
+        rounds = [{**r,"picks":[pk for pk in r.get("picks",[]) if pk.get("team",{}).get("id") == _mlbam]}
+                  for r in drafts.get("rounds",[])]
+        return {**league["draft"],"drafts":{**drafts,"rounds":rounds}}
+    return None
+
+@syncable
+async def teams_bulk(season:Optional[int]=None) -> dict:
+    """Build a `Team` for every MLB club of a season in one pass
+
+    League-wide data is requested once and cut up per club: team info
+    (`/teams?sportId=1`), team stats (`/teams/stats`, one request per game
+    type), the full season schedule and the draft. Only rosters, coaches
+    and transactions are requested per club, so all 30 teams take ~125
+    requests instead of 30 separate `Team` builds (~300). The league,
+    season and team tables are read once.
+
+    Parameters:
+    -----------
+    season : int, optional
+        Default value (None) retrieves data for the most recent season
+
+    Returns:
+    --------
+    dict of team mlbam -> `Team`
+
+    """
+    from .classes import Team
+
+    season = int(season or default_season())
+    lgs_df = mlbdata.get_leagues_df().set_index("mlbam")
+    ssn_start, ssn_end = _season_range(season)
+
+    stats_url = f"{c.BASE}/teams/stats?stats=season,seasonAdvanced&group=hitting,pitching,fielding&season={season}&sportIds=1&gameType="
+    league_urls = {
+        "teams"    : f"{c.BASE}/teams?sportId=1&season={season}",
+        "S"        : stats_url + "S",
+        "R"        : stats_url + "R",
+        "P"        : stats_url + "P",
+        "schedule" : f"{c.BASE}/schedule?sportId=1&season={season}&startDate={season}-01-01&endDate={season}-12-31&gameType={c.GAME_TYPES_ALL}&hydrate=game(content(media(epg))),team",
+        "draft"    : f"{c.BASE}/draft/{season}?sportId=1",
+    }
+    resps = await fetch_async(list(league_urls.values()))
+    league = dict(zip(league_urls,[resp.json for resp in resps]))
+
+    team_urls = {t["id"]:_team_urls(t["id"],season,ssn_start,ssn_end) for t in league["teams"].get("teams",[])}
+    payloads = {mlbam:[_league_payload(url,mlbam,league) for url in urls] for mlbam, urls in team_urls.items()}
+
+    own_urls = [url for mlbam, urls in team_urls.items() for url, data in zip(urls,payloads[mlbam]) if data is None]
+    plan = plan_requests(own_urls)
+    own = iter(plan.split([resp.json for resp in await fetch_async(plan.urls)]))
+
+    bulk = {}
+    for mlbam, urls in team_urls.items():
+        team_data_dict = []
+        for url, data in zip(urls,payloads[mlbam]):
+            if data is None:
+                data = next(own)
+            team_data_dict.append(await _parse_team_data(data=data,_url=url,lgs_df=lgs_df,_mlbam=mlbam))
+        bulk[mlbam] = Team(mlbam,season,_data=_build_team_data(team_data_dict))
+    return bulk
+
+
+@syncable
+async def player_stats(mlbam,**kwargs):
     """Get various types of player stats, game logs, and pitch logs
 
     Parameters
@@ -1930,11 +2134,11 @@ def player_stats(mlbam,**kwargs):
         params['group'] = statGroup
         
     url = c.BASE + f"/people/{mlbam}/stats"
-    resp = requests.get(url,params=params)
+    resp = await _get_json(url,params=params)
     
     dfs = {}
     
-    for s in resp.json().get('stats',[{}]):
+    for s in resp.json.get('stats',[{}]):
         if 'advanced' not in s.get('type',{}).get('displayName','').lower():
             if s.get('group',{}).get('displayName') == "hitting":
                 dfs['hitting'] = parsing._parse_player_stats(s.get('splits',[{}]))
@@ -1953,7 +2157,8 @@ def player_stats(mlbam,**kwargs):
         dfs['hitting_adv'],dfs['pitching_adv']
     )
     
-def player_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) -> pd.DataFrame:
+@syncable
+async def player_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) -> pd.DataFrame:
     """Get a player's game log stats for a specific season
 
     Parameters
@@ -2010,12 +2215,12 @@ def player_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) ->
         params["endDate"] = kwargs["endDate"]
 
     url = c.BASE + f"/people/{mlbam}/stats?"
-    resp = requests.get(url,params=params)
+    resp = await _get_json(url,params=params)
 
     data = []
 
     # "sg" referes to each stat group in the results
-    for sg in resp.json()["stats"]:
+    for sg in resp.json["stats"]:
         if sg["group"]["displayName"] == "hitting":
             # "g" refers to each game
             for g in sg.get("splits"):
@@ -2056,7 +2261,8 @@ def player_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) ->
 
     return df
 
-def player_date_range(mlbam,statGroup,startDate,endDate,gameType=None) -> pd.DataFrame:
+@syncable
+async def player_date_range(mlbam,statGroup,startDate,endDate,gameType=None) -> pd.DataFrame:
     """Get a player's stats for a specified date range
 
     Parameters
@@ -2092,8 +2298,8 @@ def player_date_range(mlbam,statGroup,startDate,endDate,gameType=None) -> pd.Dat
 
     url = c.BASE + f"/people/{mlbam}/stats?"
 
-    resp = requests.get(url,params=params)
-    resp_json = resp.json()
+    resp = await _get_json(url,params=params)
+    resp_json = resp.json
 
     data = []
 
@@ -2109,7 +2315,8 @@ def player_date_range(mlbam,statGroup,startDate,endDate,gameType=None) -> pd.Dat
 
     return df
 
-def player_date_range_advanced(mlbam,statGroup,startDate,endDate,gameType=None) -> pd.DataFrame:
+@syncable
+async def player_date_range_advanced(mlbam,statGroup,startDate,endDate,gameType=None) -> pd.DataFrame:
     """Get a player's stats for a specified date range
 
     Parameters
@@ -2145,8 +2352,8 @@ def player_date_range_advanced(mlbam,statGroup,startDate,endDate,gameType=None)
 
     url = c.BASE + f"/people/{mlbam}/stats?"
 
-    resp = requests.get(url,params=params)
-    resp_json = resp.json()
+    resp = await _get_json(url,params=params)
+    resp_json = resp.json
 
     data = []
 
@@ -2163,7 +2370,8 @@ def player_date_range_advanced(mlbam,statGroup,startDate,endDate,gameType=None)
 
     return df
 
-def player_splits(mlbam,statGroup,sitCodes,season=None,gameType=None) -> pd.DataFrame:
+@syncable
+async def player_splits(mlbam,statGroup,sitCodes,season=None,gameType=None) -> pd.DataFrame:
     """Get a player's stats for a specified date range
 
     Parameters
@@ -2199,8 +2407,8 @@ def player_splits(mlbam,statGroup,sitCodes,season=None,gameType=None) -> pd.Data
 
     url = c.BASE + f"/people/{mlbam}/stats?"
 
-    resp = requests.get(url,params=params)
-    resp_json = resp.json()
+    resp = await _get_json(url,params=params)
+    resp_json = resp.json
 
     data = []
 
@@ -2219,7 +2427,8 @@ def player_splits(mlbam,statGroup,sitCodes,season=None,gameType=None) -> pd.Data
     df = pd.DataFrame(data).rename(columns=c.STATDICT)
     return df
 
-def player_splits_advanced(mlbam,statGroup,sitCodes,season=None,gameType=None) -> pd.DataFrame:
+@syncable
+async def player_splits_advanced(mlbam,statGroup,sitCodes,season=None,gameType=None) -> pd.DataFrame:
     """Get a player's stats for a specified date range
 
     Parameters
@@ -2255,8 +2464,8 @@ def player_splits_advanced(mlbam,statGroup,sitCodes,season=None,gameType=None) -
 
     url = c.BASE + f"/people/{mlbam}/stats?"
 
-    resp = requests.get(url,params=params)
-    resp_json = resp.json()
+    resp = await _get_json(url,params=params)
+    resp_json = resp.json
 
     data = []
 
@@ -2279,7 +2488,8 @@ def player_splits_advanced(mlbam,statGroup,sitCodes,season=None,gameType=None) -
 # TEAM Functions
 # ===============================================================
 
-def team_stats(mlbam,**kwargs) -> pd.DataFrame:
+@syncable
+async def team_stats(mlbam,**kwargs) -> pd.DataFrame:
     kwargs = ExtendedDict(kwargs)
     params = {
         'group':'hitting,pitching,fielding',
@@ -2299,11 +2509,11 @@ def team_stats(mlbam,**kwargs) -> pd.DataFrame:
         params['group'] = statGroup
     
     url = c.BASE + f"/teams/{mlbam}/stats"
-    resp = requests.get(url,params=params)
+    resp = await _get_json(url,params=params)
     
     dfs = {}
     
-    for s in resp.json().get('stats',[{}]):
+    for s in resp.json.get('stats',[{}]):
         if s.get('type',{}).get('displayName').lower().find('advanced') == -1:
             if s.get('group',{}).get('displayName') == "hitting":
                 dfs['hitting'] = parsing._parse_team_stats(s.get('splits',[{}]),True)
@@ -2323,7 +2533,8 @@ def team_stats(mlbam,**kwargs) -> pd.DataFrame:
     )
     # return StatTypeCollection(**dfs)
 
-def team_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) -> pd.DataFrame:
+@syncable
+async def team_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) -> pd.DataFrame:
     """Get a team's game log stats for a specific season
 
     Parameters
@@ -2380,13 +2591,13 @@ def team_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) -> p
         params["endDate"] = kwargs["endDate"]
 
     url = c.BASE + f"/teams/{mlbam}/stats?"
-    resp = requests.get(url,params=params)
+    resp = await _get_json(url,params=params)
 
     data = []
     tms_df = mlbdata.get_teams_df(year=season).set_index("mlbam")
 
     # "sg" referes to each stat group in the results
-    for sg in resp.json()["stats"]:
+    for sg in resp.json["stats"]:
         if sg["group"]["displayName"] == "hitting":
             # "g" refers to each game
             for g in sg.get("splits"):
@@ -2413,7 +2624,8 @@ def team_game_logs(mlbam,season=None,statGroup=None,gameType=None,**kwargs) -> p
 
     return df
 
-def team_roster(mlbam,season=None,rosterType=None,**kwargs) -> pd.DataFrame:
+@syncable
+async def team_roster(mlbam,season=None,rosterType=None,**kwargs) -> pd.DataFrame:
     """Get team rosters by season
 
     Parameters
@@ -2466,8 +2678,8 @@ def team_roster(mlbam,season=None,rosterType=None,**kwargs) -> pd.DataFrame:
     # hydrate=person(rosterEntries)
     url = c.BASE + f"/teams/{mlbam}/roster"
 
-    resp = requests.get(url,params=params)
-    roster = resp.json()["roster"]
+    resp = await _get_json(url,params=params)
+    roster = resp.json["roster"]
     
     columns = [
         'mlbam',
@@ -2510,41 +2722,41 @@ def team_roster(mlbam,season=None,rosterType=None,**kwargs) -> pd.DataFrame:
 
     return df
 
-def team_appearances(mlbam):
+@syncable
+async def team_appearances(mlbam):
     gt_types = {'F':'wild_card_series','D':'division_series','L':'league_series','W':'world_series','P':'playoffs'}
     sort_orders = {'F':1,'D':2,'L':3,'W':4}
-    with requests.session() as sesh:
-        data = []
-        for gt in ('F','D','L','W'):
-            url = f"https://statsapi.mlb.com/api/v1/teams/{mlbam}/stats?stats=yearByYearPlayoffs&group=pitching&gameType={gt}&fields=stats,splits,stat,wins,losses,season"
-            resp = sesh.get(url)
-            game_type = gt_types[gt]
-            years = resp.json()["stats"][0]["splits"]
-            for y in years:
-                season = y.get("season","")
-                wins = y.get("stat",{}).get("wins",0)
-                losses = y.get("stat",{}).get("losses",0)
-                if wins > losses:
-                    title_winner = True
-                else:
-                    title_winner = False
-                sort_order = sort_orders[gt]
-                
-                data.append([
-                    season,gt,game_type,wins,losses,title_winner,sort_order
-                ])
-                
-
-                
-        df = pd.DataFrame(data=data,columns=['season','gt','game_type','wins','losses','title_winner','sort_order']).sort_values(by=["season","sort_order"],ascending=[True,True]).reset_index(drop=True)
-        
-        return df
+    gts = ('F','D','L','W')
+    urls = [f"{c.BASE}/teams/{mlbam}/stats?stats=yearByYearPlayoffs&group=pitching&gameType={gt}&fields=stats,splits,stat,wins,losses,season" for gt in gts]
+    resps = await fetch_async(urls)
+    data = []
+    for gt, resp in zip(gts,resps):
+        game_type = gt_types[gt]
+        years = resp.json["stats"][0]["splits"]
+        for y in years:
+            season = y.get("season","")
+            wins = y.get("stat",{}).get("wins",0)
+            losses = y.get("stat",{}).get("losses",0)
+            if wins > losses:
+                title_winner = True
+            else:
+                title_winner = False
+            sort_order = sort_orders[gt]
+            
+            data.append([
+                season,gt,game_type,wins,losses,title_winner,sort_order
+            ])
+    
+    df = pd.DataFrame(data=data,columns=['season','gt','game_type','wins','losses','title_winner','sort_order']).sort_values(by=["season","sort_order"],ascending=[True,True]).reset_index(drop=True)
+    
+    return df
 
 # ===============================================================
 # LEAGUE Functions
 # ===============================================================
 
-def league_stats(league="all",season=None,hydrate:Optional[str]=None,**kwargs) -> dclass.StatTypeCollection:
+@syncable
+async def league_stats(league="all",season=None,hydrate:Optional[str]=None,**kwargs) -> dclass.StatTypeCollection:
     params = {
         'group':'hitting,pitching,fielding',
         'stats':'season,seasonAdvanced',
@@ -2574,18 +2786,16 @@ def league_stats(league="all",season=None,hydrate:Optional[str]=None,**kwargs) -
     if kwargs.get('url_only'):
         req = requests.Request("GET",url,params=params)
         prepared_url = req.prepare().url
-        if kwargs.get("log"):
-            print(prepared_url)
         return prepared_url
     
-    resp = requests.get(url,params=params)
-    if kwargs.get("log"):
-        print(resp.url)
+    with events.printing(kwargs.get("log")):
+        resp = await _get_json(url,params=params)
     
-    # return parsing._new_stat_collection(response=resp.json())
-    return dclass.StatTypeCollection.from_json(resp.json())
+    # return parsing._new_stat_collection(response=resp.json)
+    return dclass.StatTypeCollection.from_json(resp.json)
 
-def league_leaders(season=None,statGroup=None,playerPool="Qualified"):
+@syncable
+async def league_leaders(season=None,statGroup=None,playerPool="Qualified"):
     """Get league leaders for hitting & pitching
 
     season : int or str
@@ -2610,9 +2820,9 @@ def league_leaders(season=None,statGroup=None,playerPool="Qualified"):
 
     url = c.BASE + f"/stats?stats=season&season={season}&group={statGroup}&playerPool={playerPool}"
 
-    resp = requests.get(url)
+    resp = await _get_json(url)
 
-    resp_json = resp.json()
+    resp_json = resp.json
 
     hit_cols = ['rank','season','position','player_mlbam','player_name','team_mlbam','team_name','league_mlbam','league_name','G','GO','AO','R','2B','3B','HR','SO','BB','IBB','H','HBP','AVG','AB','OBP','SLG','OPS','CS','SB','SB%','GIDP','P','PA','TB','RBI','LOB','sB','sF','BABIP','GO/AO','CI','AB/HR']
     pit_cols = ['rank','season','position','player_mlbam','player_name','team_mlbam','team_name','league_mlbam','league_name','G','GS','GO','AO','R','2B','3B','HR','SO','BB','IBB','H','HBP','AVG','AB','OBP','SLG','OPS','CS','SB','SB%','GIDP','P','ERA','IP','W','L','SV','SVO','HLD','BS','ER','WHIP','BF','O','GP','CG','ShO','K','K%','HB','BK','WP','PK','TB','GO/AO','W%','P/Inn','GF','SO:BB','SO/9','BB/9','H/9','R/9','HR/9','IR','IRS','CI','sB','sF']
@@ -2686,7 +2896,8 @@ def league_leaders(season=None,statGroup=None,playerPool="Qualified"):
 
     return {"hitting":hit_df,"pitching":pitch_df}
 
-def season_standings(season=None,standingsType=None,**kwargs):
+@syncable
+async def season_standings(season=None,standingsType=None,**kwargs):
     if season is None:
         season = default_season()
     if standingsType is None:
@@ -2702,9 +2913,9 @@ def season_standings(season=None,standingsType=None,**kwargs):
         req = requests.Request("GET",url,params=params)
         return req.prepare().url
     
-    resp = requests.get(url,params=params)
+    resp = await _get_json(url,params=params)
     
-    parsed_data = parsing._parse_season_standings_data(resp.json())
+    parsed_data = parsing._parse_season_standings_data(resp.json)
     
     return pd.DataFrame(parsed_data)
     
@@ -2743,13 +2954,9 @@ def find_team(query,season=None):
     else:
         df = df[df["season"]==int(season)]
 
-    query = query.lower()
-    rows = []
-    for idx,row in df.iterrows():
-        if query in row['name_full'].lower():
-            rows.append(row)
+    found = df['name_full'].str.contains(query,case=False,regex=False,na=False)
 
-    return pd.DataFrame(rows).reset_index(drop=True)
+    return df[found].reset_index(drop=True)
 
 def find_venue(query):
     """Search for venues by name
@@ -2763,15 +2970,10 @@ def find_venue(query):
 
     df = mlbdata.get_venues_df()
 
-    query = query.lower()
-
-    df['vname'] = df['name'].str.lower()
-
-    df = df[df['vname'].str.contains(query,case=False,regex=False)]
-
-    return df.drop(columns="vname")
+    return df[df['name'].str.contains(query,case=False,regex=False,na=False)]
   
-def play_search(
+@syncable
+async def play_search(
     mlbam,
     season=None,
     statGroup=None,
@@ -2848,8 +3050,8 @@ def play_search(
     teams_df = mlbdata.get_teams_df(year=season).set_index('mlbam')
 
     url = c.BASE + f'/people/{mlbam}/stats'
-    response = requests.get(url,params=params)
-    resp = response.json()
+    response = await _get_json(url,params=params)
+    resp = response.json
 
     if kwargs.get('_log') is True:
         print('SEASON:\n')
@@ -3117,7 +3319,8 @@ def play_search(
     
     return df
 
-def pitch_search(mlbam,seasons=None,statGroup=None,opposingTeamId=None,eventTypes=None,pitchTypes=None):
+@syncable
+async def pitch_search(mlbam,seasons=None,statGroup=None,opposingTeamId=None,eventTypes=None,pitchTypes=None):
     """Search for any individual pitch 2008 and later
 
     Parameters
@@ -3172,9 +3375,9 @@ def pitch_search(mlbam,seasons=None,statGroup=None,opposingTeamId=None,eventType
     url = c.BASE + f"/people/{mlbam}/stats?stats=pitchLog&{queryString}"
 
 
-    response = requests.get(url)
+    response = await _get_json(url)
     
-    log = response.json()["stats"][0]
+    log = response.json["stats"][0]
     
     if statGroup == "hitting":
         pitches = []
@@ -3396,7 +3599,8 @@ def pitch_search(mlbam,seasons=None,statGroup=None,opposingTeamId=None,eventType
     
     return df
 
-def game_search(
+@syncable
+async def game_search(
     mlbam:int=None,
     date=None,
     startDate=None,
@@ -3430,10 +3634,10 @@ def game_search(
               }
     
     url = c.BASE + f"/schedule"
-    response = requests.get(url,params=params)
+    response = await _get_json(url,params=params)
     all_results = []
 
-    for d in response.json()["dates"]:
+    for d in response.json["dates"]:
         for g in d["games"]:
             away_name   = g.get("teams",{}).get("away",{}).get("team",{}).get("name","-")
             away_mlbam  = g.get("teams",{}).get("away",{}).get("team",{}).get("id","-")
@@ -3473,7 +3677,8 @@ def game_search(
         return pd.DataFrame()
     return df
 
-def last_game(mlbam):
+@syncable
+async def last_game(mlbam):
     """Get basic game information for a team's last game
     
     Parameters:
@@ -3499,9 +3704,9 @@ def last_game(mlbam):
 
     url = c.BASE + f"/teams/{teamID}?hydrate=previousSchedule(date={m}/{d}/{y},inclusive=True,limit=1,season={season},gameType=[S,R,D,W,F,C,L])"
 
-    resp = requests.get(url)
+    resp = await _get_json(url)
 
-    result = resp.json()["teams"][0]["previousGameSchedule"]["dates"][0]["games"][0]
+    result = resp.json["teams"][0]["previousGameSchedule"]["dates"][0]["games"][0]
     gamePk = result.get("gamePk","")
     gameType = result.get("gameType","")
     gameDate = result.get("gameDate","")[:10]
@@ -3521,7 +3726,8 @@ def last_game(mlbam):
 
     return df
 
-def next_game(mlbam):
+@syncable
+async def next_game(mlbam):
     """Get basic game information for a team's next game
     
     Parameters:
@@ -3538,12 +3744,12 @@ def next_game(mlbam):
 
     try:
         url = c.BASE + f"/teams/{teamID}?hydrate=nextSchedule(date={m}/{d}/{y},inclusive=True,limit=1,season={y},gameType=[S,R,P])"
-        response = requests.get(url)
-        results = response.json()["teams"][0]["nextGameSchedule"]["dates"][0]["games"]
+        response = await _get_json(url)
+        results = response.json["teams"][0]["nextGameSchedule"]["dates"][0]["games"]
     except:
         url = c.BASE + f"/teams/{teamID}?hydrate=nextSchedule(date={m}/{d}/{y},inclusive=True,limit=1,season={y+1},gameType=[S,R,P])"
-        response = requests.get(url)
-        results = response.json()["teams"][0]["nextGameSchedule"]["dates"][0]["games"]
+        response = await _get_json(url)
+        results = response.json["teams"][0]["nextGameSchedule"]["dates"][0]["games"]
 
     result = results[0]
     gamePk = result.get("gamePk","")
@@ -3565,7 +3771,8 @@ def next_game(mlbam):
     
     return df
 
-def schedule(mlbam=None,season=None,date=None,startDate=None,endDate=None,gameType=None,opponentId=None,**kwargs) -> pd.DataFrame:
+@syncable
+async def schedule(mlbam=None,season=None,date=None,startDate=None,endDate=None,gameType=None,opponentId=None,**kwargs) -> pd.DataFrame:
     """Get game schedule data.
 
     Parameters
@@ -3661,28 +3868,30 @@ def schedule(mlbam=None,season=None,date=None,startDate=None,endDate=None,gameTy
         req = requests.Request("GET",url,params=params)
         prepared_url = req.prepare().url
         return prepared_url
-    resp = requests.get(url,params=params)
-
-    if kwargs.get('log') is True:
-        print("\n================")
-        print(resp.url)
-        print("================\n")
-
-    parsed_data = parsing._parse_schedule_data(json_response=resp.json(),selected_timezone=tz)
-    df = pd.DataFrame(data=parsed_data)
-    official_dt_col = pd.to_datetime(df["date_official"] + " " + df["game_start"],format=r"%Y-%m-%d %I:%M %p")
-    df.insert(0,"official_dt",official_dt_col)
+    # only request the keys the parser reads ('lineups' is indexed with a variable)
+    params.update(projections.fields_param(parsing._parse_schedule_data,extra=("awayPlayers","homePlayers")))
+    with events.printing(kwargs.get('log') is True):
+        resp = await _get_json(url,params=params)
+
+        with stage('parse',resp.url):
+            parsed_data = parsing._parse_schedule_data(json_response=resp.json,selected_timezone=tz)
+        with stage('frame',resp.url):
+            df = pd.DataFrame(data=parsed_data)
+            official_dt_col = pd.to_datetime(df["date_official"] + " " + df["game_start"],format=r"%Y-%m-%d %I:%M %p")
+            df.insert(0,"official_dt",official_dt_col)
     return df
 
-def games_today():
+@syncable
+async def games_today():
     date_str = dt.datetime.today().strftime(r'%Y-%m-%d')
-    sched = schedule(date=date_str)
+    sched = await schedule.aio(date=date_str)
     return sched
 
-def scores(return_list=False):
+@syncable
+async def scores(return_list=False):
     today = dt.datetime.today()
     date_str = today.strftime(r'%Y-%m-%d')
-    games = schedule(date=date_str,hydrate='linescore')
+    games = await schedule.aio(date=date_str,hydrate='linescore')
     tms = mlbdata.get_teams_df(year=today.year).set_index('mlbam')
     score_list = []
     gm_str = '{:3} {:>2}  vs  {:2} {:3} | {:6} | {:12}'
@@ -3718,7 +3927,8 @@ def scores(return_list=False):
     else:
         print('\n'.join(score_list))
 
-def game_highlights(
+@syncable
+async def game_highlights(
     mlbam=None,
     date=None,
     startDate=None,
@@ -3747,7 +3957,7 @@ def game_highlights(
         Search games by season
     """
 
-    hydrations = "game(content(media(all),summary,gamenotes,highlights(highlights)))"
+    hydrations = "game(content(highlights(highlights)))"
     if date is not None:
         url = c.BASE + f"/schedule?sportId=1&teamId={mlbam}&date={date}&hydrate={hydrations}"
     elif month is not None:
@@ -3793,10 +4003,11 @@ def game_highlights(
         print("One of params, 'date' or 'season' must be utilized")
         return None
 
-    resp = requests.get(url)
+    resp = await _get_json(projections.with_fields(url,_parse_highlights))
 
-    sched = resp.json()
+    return _parse_highlights(resp.json)
 
+def _parse_highlights(sched:dict) -> pd.DataFrame:
     data = []
     columns = [
         "date",
@@ -3866,19 +4077,21 @@ def game_highlights(
 
     return df
 
-def get_video_link(playID:str,broadcast=None) -> str:
+@syncable
+async def get_video_link(playID:str,broadcast=None) -> str:
     if broadcast is not None:
         broadcast = str(broadcast).upper()
         url = f"https://baseballsavant.mlb.com/sporty-videos?playId={playID}&videoType={broadcast}"
     else:
         url = f"https://baseballsavant.mlb.com/sporty-videos?playId={playID}"
-    resp = requests.get(url)
-    soup = bs(resp.text,'lxml')
+    resp_text = (await fetch_text_async([url]))[0]
+    soup = bs(resp_text,'lxml')
     video_tag = soup.find("video",id="sporty")
     video_source = video_tag.find("source")["src"]
     return video_source
 
-def player_bio(mlbam:int):
+@syncable
+async def player_bio(mlbam:int):
     """Get short biography of player from Baseball-Reference.com's Player Bullpen pages.
 
     Parameters
@@ -3888,26 +4101,26 @@ def player_bio(mlbam:int):
     
     """
     # URL to Player's Baseball-Reference page
-    with requests.session() as sesh:
-        url = f"https://www.baseball-reference.com/redirect.fcgi?player=1&mlb_ID={mlbam}"
+    url = f"https://www.baseball-reference.com/redirect.fcgi?player=1&mlb_ID={mlbam}"
 
-        resp = sesh.get(url)
+    resp_text = (await fetch_text_async([url]))[0]
 
-        soup = bs(resp.text,'lxml')
+    soup = bs(resp_text,'lxml')
 
-        # URL to Player's "Bullpen" page
-        url = soup.find('a',text='View Player Info')['href']
+    # URL to Player's "Bullpen" page
+    url = soup.find('a',text='View Player Info')['href']
 
-        resp = sesh.get(url)
+    resp_text = (await fetch_text_async([url]))[0]
 
-        soup = bs(resp.text,'lxml')
+    soup = bs(resp_text,'lxml')
 
-        bio_p_tags = soup.find("span",id="Biographical_Information"
-                               ).findParent('h2').find_next_siblings('p')
+    bio_p_tags = soup.find("span",id="Biographical_Information"
+                           ).findParent('h2').find_next_siblings('p')
 
-        return bio_p_tags
+    return bio_p_tags
 
-def free_agents(
+@syncable
+async def free_agents(
     season:Optional[int]=None,
     hydrate_person:Optional[bool]=None,
     sort_by=None,
@@ -3937,10 +4150,10 @@ def free_agents(
         params['hydrate'] = 'person'
     
     url = f"{c.BASE}/people/freeAgents"
-    resp = requests.get(url,params=params)
+    resp = await _get_json(url,params=params)
     
     data = []
-    for fa in resp.json()['freeAgents']:
+    for fa in resp.json['freeAgents']:
         og_team = fa.get('originalTeam',{})
         new_team = fa.get('newTeam',{})
         notes = fa.get('notes','-')
@@ -9,10 +9,23 @@ from . import helpers
 from . import objects as objs
 from . import constants as c
 from . import mlb_dataclasses as dclass
+from .async_mlb import get_json
 
 md = objs.MlbDate
 mdt = objs.MlbDatetime
 
+def _feed_url(game_pk,timecode=None) -> str:
+    """Url for the live feed of a game (optionally at a specific timecode)"""
+    if timecode == '':
+        timecode = None
+    if timecode is not None and timecode.find('_') == -1:
+        timecode = parse(timecode).strftime(r'%Y%m%d_%H%M%S')
+
+    game_url = f'{c.BASE_V11}/game/{game_pk}/feed/live?'
+    params = {'hydrate':'venue,flags,preState',
+              'timecode':timecode}
+    return requests.Request('GET',game_url,params=params).prepare().url
+
 class Game:
     """# Game
 
@@ -32,6 +45,10 @@ class Game:
     tz : str
         preferred timezone to view datetime values ("ct","et","mt", or "pt")
 
+    deadline : float, optional
+        seconds allowed for retrieving the game feed (raises
+        `mlb.DeadlineExceeded` when it runs out)
+
     Methods:
     --------
 
@@ -88,25 +105,17 @@ class Game:
         returns a dictionary of notable attributes about the game
     """
 
-    def __init__(self,game_pk, timecode=None, tz='et'):
+    def __init__(self,game_pk, timecode=None, tz='et', **kwargs):
         self.last_updated = dt.datetime.now()
-        if timecode == '':
-            timecode = None
-        if timecode is not None and timecode.find('_') == -1:
-            timecode = parse(timecode).strftime(r'%Y%m%d_%H%M%S')
         
         tz_obj = objs.get_tz(tz)
         self._tz = tz
         
         self.__game_pk = game_pk
 
-        c.BASE = 'https://statsapi.mlb.com/api'
-        
-        game_url = f'{c.BASE}/v1.1/game/{game_pk}/feed/live?'
-        params = {'hydrate':'venue,flags,preState',
-                  'timecode':timecode}
-
-        gm = requests.get(game_url,params=params).json()
+        gm = kwargs.get('_data')
+        if gm is None:
+            gm = get_json(_feed_url(game_pk,timecode),deadline=kwargs.get('deadline')).json
         self._raw_game_data = gm
 
         self.meta = gm['metaData']
@@ -1924,8 +1933,8 @@ class Game:
 
     def get_content(self):
         url = c.BASE + f'/game/{self.gamePk}/content'
-        resp = requests.get(url)
-        return resp.json()
+        resp = get_json(url)
+        return resp.json
 
     def raw_feed_data(self):
         """Return the raw JSON data"""
@@ -1933,11 +1942,11 @@ class Game:
 
     def get_feed_data(self, timecode=None):
         if timecode is not None:
-            url = f'https://statsapi.mlb.com/api/v1.1/game/{self.gamePk}/feed/live?timecode={timecode}'
+            url = f'{c.BASE_V11}/game/{self.gamePk}/feed/live?timecode={timecode}'
         else:
-            url = f'https://statsapi.mlb.com/api/v1.1/game/{self.gamePk}/feed/live'
-        resp = requests.get(url)
-        return resp.json()
+            url = f'{c.BASE_V11}/game/{self.gamePk}/feed/live'
+        resp = get_json(url)
+        return resp.json
 
     def context_splits(self, batterID, pitcherID):  
         #  applicable DYNAMIC splits for the current matchup
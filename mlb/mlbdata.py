@@ -1,14 +1,198 @@
 import os
 import json
+import threading
+from types import MappingProxyType
 import datetime as dt
 
 import pandas as pd
 # from sqlalchemy import create_engine
 
 from .paths import *
+from . import columnar
+from . import people_index
+
+# Reference tables are parsed once and shared. A table is reloaded when its
+# file's mtime or size changes (e.g. after one of the `update_*` functions).
+# Callers get a shallow copy: with pandas' Copy-on-Write (always on since
+# pandas 3) that is a read-only view of the shared frame, since writing to it
+# copies the touched columns first. Older pandas gets a full copy instead,
+# which is still much cheaper than re-parsing the csv.
+# When a csv has a current columnar twin (see `mlb.columnar`), that is loaded
+# instead of parsing the csv.
+_COW = int(pd.__version__.split('.')[0]) >= 3 or bool(getattr(pd.options.mode,'copy_on_write',False))
+
+def _read_csv(path) -> pd.DataFrame:
+    return pd.read_csv(path,index_col=False)
+
+def _read_teams(path) -> pd.DataFrame:
+    return pd.read_csv(path,index_col=False,dtype={'mlbam':'int32','season':'int32','venue_mlbam':'int32'})
+
+def _read_people(path) -> pd.DataFrame:
+    return pd.read_csv(path,index_col=False,dtype={'mlbam':'int32','year_debut':'int32','year_recent':'int32'})
+
+def _read_seasons(path) -> pd.DataFrame:
+    cols = ['preSeasonStartDate','preSeasonEndDate','seasonStartDate','seasonEndDate','springStartDate','springEndDate','regularSeasonStartDate','regularSeasonEndDate','allStarDate','postSeasonStartDate','postSeasonEndDate','offSeasonStartDate','offSeasonEndDate']
+    df = pd.read_csv(path,index_col=False)
+    df[cols] = df[cols].apply(pd.to_datetime,format=r"%Y-%m-%d")
+    return df
+
+def _read_venues(path) -> pd.DataFrame:
+    return pd.read_csv(path,index_col=False,dtype={'mlbam':'int32','tz_offset':'int32'})
+
+def _read_bbref_data(path) -> pd.DataFrame:
+    return pd.read_csv(path,index_col=False,dtype={'mlb_ID':'int32'})
+
+# csv -> reader giving the table its dtypes (other csvs use `_read_csv`)
+_READERS = {
+    TEAMS_CSV               : _read_teams,
+    PEOPLE_CSV              : _read_people,
+    SEASONS_CSV             : _read_seasons,
+    VENUES_CSV              : _read_venues,
+    BBREF_DATA_CSV          : _read_bbref_data,
+    BBREF_BATTING_DATA_CSV  : pd.read_csv,
+    BBREF_PITCHING_DATA_CSV : pd.read_csv,
+}
+
+class _Table:
+    __slots__ = ['frame','stamp','indexes']
+    def __init__(self,frame,stamp):
+        self.frame = frame
+        self.stamp = stamp
+        self.indexes = {}       # name -> lookup structure built from `frame`
+
+# (path, reader) -> _Table
+_tables: "dict[tuple,_Table]" = {}
+_tables_lock = threading.Lock()
+
+def _stamp(path) -> tuple:
+    st = os.stat(path)
+    return (st.st_mtime_ns,st.st_size)
+
+def _stamps(path) -> tuple:
+    twin = columnar.columnar_path(path)
+    return (_stamp(path),_stamp(twin) if os.path.exists(twin) else None)
+
+def _view(df:pd.DataFrame) -> pd.DataFrame:
+    return df.copy(deep=not _COW)
+
+def _read_table(path,reader) -> pd.DataFrame:
+    if reader is None:
+        if columnar.is_current(path):
+            return columnar.read_frame(columnar.columnar_path(path))
+        reader = _READERS.get(path,_read_csv)
+    return reader(path)
+
+def _get_table(path,reader=None) -> _Table:
+    key = (path,reader)
+    stamp = _stamps(path)
+    table = _tables.get(key)
+    if table is None or table.stamp != stamp:
+        with _tables_lock:
+            table = _tables.get(key)
+            if table is None or table.stamp != stamp:
+                table = _tables[key] = _Table(_read_table(path,reader),stamp)
+    return table
+
+def load_table(path,reader=None) -> pd.DataFrame:
+    """Shared copy of a reference csv
+
+    By default the table is loaded from its columnar twin when that is
+    current, otherwise from the csv (with the table's dtypes). A custom
+    `reader(path)` always reads the csv. The table is only loaded again when
+    one of the files changes
+    """
+    return _view(_get_table(path,reader).frame)
+
+def table_index(path,name,build):
+    """`build(frame)` for a reference table, kept until the table is reloaded
+
+    For lookup structures (dicts keyed on ids...) that parsers would
+    otherwise rebuild, or replace with a full scan, on every call
+    """
+    table = _get_table(path)
+    index = table.indexes.get(name)
+    if index is None:
+        index = table.indexes[name] = build(table.frame)
+    return index
+
+def _team_rows(df:pd.DataFrame) -> tuple:
+    by_season, latest = {}, {}
+    for row in df.to_dict('records'):
+        row = MappingProxyType(row)
+        mlbam = int(row['mlbam'])
+        by_season[(mlbam,int(row['season']))] = row
+        if mlbam not in latest or row['season'] > latest[mlbam]['season']:
+            latest[mlbam] = row
+    return by_season, latest
+
+def team_rows() -> tuple:
+    """teams.csv rows as read-only dicts: ({(mlbam, season): row}, {mlbam: row of the latest season})
+
+    Parsers that look up many teams should fetch these once and index
+    them directly
+    """
+    return table_index(TEAMS_CSV,'team_rows',_team_rows)
+
+def get_team_row(mlbam,season=None):
+    """A row of teams.csv as a read-only dict (None if there is none)
+
+    Parameters:
+    -----------
+    mlbam : int
+        team id
+
+    season : int, optional
+        season of the row; by default the team's latest season
+
+    """
+    by_season, latest = team_rows()
+    if season is None:
+        return latest.get(int(mlbam))
+    return by_season.get((int(mlbam),int(season)))
+
+def save_table(df:pd.DataFrame,path):
+    """Write a reference table to its csv and rebuild the columnar twin"""
+    if path == PEOPLE_CSV:
+        # the shared id index maps both files
+        people_index.close_people_index()
+    df.to_csv(path,index=False)
+    if path == PEOPLE_CSV:
+        people_index.build(path)
+    try:
+        build_columnar([path])
+    except TypeError:
+        # not representable (mixed-type column); the csv is read instead
+        twin = columnar.columnar_path(path)
+        if os.path.exists(twin):
+            os.remove(twin)
+
+def build_columnar(paths=None) -> list:
+    """(Re)build the columnar twin of every csv in `paths` (default: all of `mlb/data`)
+
+    Returns the paths of the files written
+    """
+    if paths is None:
+        paths = sorted(os.path.join(DATA_DIR,f) for f in os.listdir(DATA_DIR) if f.endswith('.csv'))
+    written = []
+    for path in paths:
+        df = _READERS.get(path,_read_csv)(path)
+        twin = columnar.columnar_path(path)
+        columnar.write_frame(df,twin,path)
+        written.append(twin)
+    return written
+
+def clear_tables():
+    """Drop every loaded reference table (they're read again on next use)"""
+    with _tables_lock:
+        _tables.clear()
+
+def tables_info() -> list:
+    """Loaded reference tables (path, rows, memory in bytes)"""
+    return [{'path':path,'rows':len(t.frame),'bytes':int(t.frame.memory_usage(deep=True).sum())}
+            for (path,_), t in list(_tables.items())]
 
 def get(df_title) -> pd.DataFrame:
-    return pd.read_csv(DATA_DIR + f"{df_title}.csv",index_col=False)
+    return load_table(DATA_DIR + f"{df_title}.csv")
 
 def get_teams_df(year=None) -> pd.DataFrame:
     """Get reference dataframe of all teams in the MLB history
@@ -17,10 +201,7 @@ def get_teams_df(year=None) -> pd.DataFrame:
     franchise can be identified by the 'mlbam' or 'franchID' keys.
     
     """
-    teams_df = pd.read_csv(
-        TEAMS_CSV,
-        index_col=False,
-        dtype={'mlbam':'int32','season':'int32','venue_mlbam':'int32'})
+    teams_df = load_table(TEAMS_CSV)
     if year is None:
         return teams_df
     else:
@@ -31,7 +212,7 @@ def get_teams_df(year=None) -> pd.DataFrame:
 def get_standings_df() -> pd.DataFrame:
     """Yearly standings data for each team (dates back to 1876)"""
     try:
-        df = pd.read_csv(STANDINGS_CSV,index_col=False)
+        df = load_table(STANDINGS_CSV)
         return df
     except Exception as e:
         print(e)
@@ -42,26 +223,44 @@ def get_yby_records(raw=False) -> pd.DataFrame:
     """
     
     try:
-        df = pd.read_csv(YBY_RECORDS_CSV,index_col=False)
+        df = load_table(YBY_RECORDS_CSV)
         return df
 
     except Exception as e:
         print(e)
 
 def get_people_df() -> pd.DataFrame:
-    df = pd.read_csv(
-        PEOPLE_CSV,
-        index_col=False,
-        dtype={'mlbam':'int32','year_debut':'int32','year_recent':'int32'})
+    df = load_table(PEOPLE_CSV)
     return df
 
-def get_seasons_df() -> pd.DataFrame:
-    try:
-        cols = ['preSeasonStartDate','preSeasonEndDate','seasonStartDate','seasonEndDate','springStartDate','springEndDate','regularSeasonStartDate','regularSeasonEndDate','allStarDate','postSeasonStartDate','postSeasonEndDate','offSeasonStartDate','offSeasonEndDate']
+def get_person_row(mlbam) -> dict:
+    """The people.csv row of a single person (None if unknown)
+
+    Served from the memory-mapped id index, so people.csv isn't loaded
+    """
+    return people_index.get_people_index().row(mlbam)
+
+def convert_person_id(value,source='bbrefID',target='mlbam'):
+    """Translate a person id between 'mlbam', 'bbrefID' and 'retroID'
+
+    Parameters:
+    -----------
+    value : str or int
+        the id to translate
+
+    source : str, default 'bbrefID'
+        the kind of id `value` is ('mlbam', 'bbrefID' or 'retroID')
+
+    target : str, default 'mlbam'
+        the people.csv column to return (e.g. 'retroID', 'name_given')
 
-        df = pd.read_csv(SEASONS_CSV,index_col=False)
+    Returns None if the id is unknown
+    """
+    return people_index.get_people_index().convert(value,source,target)
 
-        df[cols] = df[cols].apply(pd.to_datetime,format=r"%Y-%m-%d")
+def get_seasons_df() -> pd.DataFrame:
+    try:
+        df = load_table(SEASONS_CSV)
         return df
     except Exception as e:
         print(e)
@@ -76,10 +275,7 @@ def get_venues_df(active_only=False) -> pd.DataFrame:
     
     """
 
-    df = pd.read_csv(
-        VENUES_CSV,
-        index_col=False,
-        dtype={'mlbam':'int32','tz_offset':'int32'})
+    df = load_table(VENUES_CSV)
 
     if active_only is True:
         df = df[df["active"]==True].reset_index(drop=True)
@@ -150,16 +346,24 @@ def get_season_info(date=None) -> tuple:
                     print("Hmm...didn't work. Here is the dataframe again\n")
                     return df_dates
 
+        # seasons.csv doesn't reach `current_date` yet (see `update_seasons`);
+        # assume a regular season running from April through October
+        if current_date.month < 4:
+            return {'in_progress':None,'last_completed':current_date.year - 1}
+        if current_date.month > 10:
+            return {'in_progress':None,'last_completed':current_date.year}
+        return {'in_progress':current_date.year,'last_completed':current_date.year - 1}
+
     except Exception as e:
         print(e)
 
 def get_hall_of_fame() -> pd.DataFrame:
     """Get Hall of Fame Data"""
-    return pd.read_csv(HALL_OF_FAME_CSV,index_col=False)
+    return load_table(HALL_OF_FAME_CSV)
 
 def get_broadcasts_df() -> pd.DataFrame:
     """Get Broadcasts data (types, names, ids...)"""
-    return pd.read_csv(BROADCASTS_CSV,index_col=False)
+    return load_table(BROADCASTS_CSV)
 
 def get_bbref_data() -> pd.DataFrame:
     """Reference dataframe for all player "Baseball-Reference" (bbref) and 
@@ -170,19 +374,19 @@ def get_bbref_data() -> pd.DataFrame:
     
     """
     
-    return pd.read_csv(BBREF_DATA_CSV,index_col=False,dtype={'mlb_ID':'int32'})
+    return load_table(BBREF_DATA_CSV)
 
 def get_bbref_hitting_war_df() -> pd.DataFrame:
-    df = pd.read_csv(BBREF_BATTING_DATA_CSV)
+    df = load_table(BBREF_BATTING_DATA_CSV)
     return df
 
 def get_bbref_pitching_war_df() -> pd.DataFrame:
-    df = pd.read_csv(BBREF_PITCHING_DATA_CSV)
+    df = load_table(BBREF_PITCHING_DATA_CSV)
     return df
 
 def get_leagues_df() -> pd.DataFrame:
     """Get reference dataframe of all leagues and divisions in the MLB"""
-    df = pd.read_csv(LEAGUES_CSV,index_col=False)
+    df = load_table(LEAGUES_CSV)
     return df
         
 def get_teams_from_register_df(match_columns=False) -> pd.DataFrame:
@@ -211,7 +415,7 @@ def get_pitch_types_df() -> pd.DataFrame:
     
     NOTE: Not to be confused with 'pitch_codes()'
     """
-    df = pd.read_csv(PITCH_TYPES_CSV,index_col=False)
+    df = load_table(PITCH_TYPES_CSV)
     return df
 
 def get_pitch_codes_df() -> pd.DataFrame:
@@ -219,17 +423,17 @@ def get_pitch_codes_df() -> pd.DataFrame:
     
     NOTE: Not to be confused with 'pitch_types()'
     """
-    df = pd.read_csv(PITCH_CODES_CSV,index_col=False)
+    df = load_table(PITCH_CODES_CSV)
     return df
   
 def get_event_types_df() -> pd.DataFrame:
     """Event types and their descriptions
     
     """
-    df = pd.read_csv(EVENT_TYPES_CSV,index_col=False)
+    df = load_table(EVENT_TYPES_CSV)
     return df
   
 def get_coaches():
     """Get a year-by-year dataframe of all coaching staff for each team"""
-    df = pd.read_csv(COACHES_MASTER_CSV,index_col=False)
+    df = load_table(COACHES_MASTER_CSV)
     return df
\ No newline at end of file
@@ -0,0 +1,272 @@
+"""Name search over people, teams and venues
+
+`find_team` and `find_venue` scan a whole table per call for a literal,
+case-insensitive substring. For autocomplete-style lookups, `search` ranks
+matches from in-memory indexes instead, built the first time each kind is
+searched:
+
+```
+import mlb
+
+mlb.search('abreu')                     # people, teams and venues
+mlb.search('jose ab', kind='people')    # prefixes of each word
+mlb.search('wrigly', kind='venues')     # typos still match
+```
+
+Names and queries are compared case- and accent-insensitively
+('jose' finds 'José'). Results are ranked by how the query matches:
+
+- `exact`: the whole name
+- `prefix`: the start of the name
+- `word`: every query word starts a word of the name ('ab jos')
+- `substring`: anywhere in the name
+- `fuzzy`: most of the query's trigrams appear in the name (typos)
+
+Ties go to the more recent player/team and to active venues. An index is
+kept with its reference table in `mlbdata`, so it's rebuilt when the csv
+changes.
+"""
+import bisect
+import unicodedata
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from . import mlbdata
+from .paths import PEOPLE_CSV, TEAMS_CSV, VENUES_CSV
+
+KINDS = ('people', 'teams', 'venues')
+
+# match types, best first, and the score they start from
+EXACT = 'exact'
+PREFIX = 'prefix'
+WORD = 'word'
+SUBSTRING = 'substring'
+FUZZY = 'fuzzy'
+_SCORES = {EXACT: 1.0, PREFIX: 0.9, WORD: 0.75, SUBSTRING: 0.5}
+
+# share of the query's trigrams a name needs for a fuzzy match
+FUZZY_THRESHOLD = 0.5
+_FUZZY_MIN_LENGTH = 3
+
+
+def fold(text) -> str:
+    """Lowercase `text`, strip accents and reduce punctuation to single spaces"""
+    if not isinstance(text, str):
+        return ''
+    text = unicodedata.normalize('NFKD', text.casefold())
+    text = ''.join(ch if ch.isalnum() else ' ' for ch in text if not unicodedata.combining(ch))
+    return ' '.join(text.split())
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """Ranked name lookups over a list of records (see module docstring)
+
+    Parameters:
+    -----------
+    names : list
+        name of each record
+
+    records : list
+        what a match returns (dicts)
+
+    weights : sequence of numbers, optional
+        tie-breaker between matches of the same quality (higher first)
+
+    """
+    def __init__(self, names: list, records: list, weights=None):
+        self.records = records
+        self.names = [fold(n) for n in names]
+        n = len(self.names)
+        self.weights = np.zeros(n) if weights is None else np.asarray(weights, dtype=float)
+        self._lengths = np.array([len(name) for name in self.names], dtype=np.int32)
+
+        # whole names and single words, sorted for prefix ranges
+        self._by_name = sorted(range(n), key=self.names.__getitem__)
+        self._sorted_names = [self.names[i] for i in self._by_name]
+        self._by_name = np.array(self._by_name, dtype=np.int32)
+        words = sorted((w, i) for i, name in enumerate(self.names) for w in set(name.split()))
+        self._words = [w for w, _ in words]
+        self._word_docs = np.array([i for _, i in words], dtype=np.int32)
+
+        # trigram postings of every name padded with a space on each side
+        postings = {}
+        for i, name in enumerate(self.names):
+            for gram in _trigrams(f' {name} '):
+                postings.setdefault(gram, []).append(i)
+        self._postings = {gram: np.array(docs, dtype=np.int32) for gram, docs in postings.items()}
+
+    def __repr__(self):
+        return f"<SearchIndex {len(self)} names>"
+
+    def __len__(self):
+        return len(self.names)
+
+    def _prefixed(self, keys: list, prefix: str) -> slice:
+        return slice(bisect.bisect_left(keys, prefix), bisect.bisect_left(keys, prefix + '\U0010ffff'))
+
+    def _exact_and_prefix(self, q: str) -> tuple:
+        span = self._prefixed(self._sorted_names, q)
+        exact_end = bisect.bisect_right(self._sorted_names, q, span.start, span.stop)
+        return self._by_name[span.start:exact_end], self._by_name[exact_end:span.stop]
+
+    def _word_prefix(self, q: str) -> np.ndarray:
+        docs = None
+        for word in set(q.split()):
+            found = np.unique(self._word_docs[self._prefixed(self._words, word)])
+            docs = found if docs is None else np.intersect1d(docs, found, assume_unique=True)
+            if not len(docs):
+                break
+        return docs
+
+    def _gram_hits(self, grams) -> np.ndarray:
+        lists = [self._postings[g] for g in grams if g in self._postings]
+        if not lists:
+            return np.zeros(len(self), dtype=np.int32)
+        return np.bincount(np.concatenate(lists), minlength=len(self))
+
+    def _substring(self, q: str) -> np.ndarray:
+        grams = _trigrams(q)
+        if not grams:
+            return np.empty(0, dtype=np.int32)
+        docs = np.flatnonzero(self._gram_hits(grams) == len(grams))
+        if len(q) > 3:
+            # sharing every trigram doesn't guarantee the order
+            docs = np.array([i for i in docs if q in self.names[i]], dtype=np.int32)
+        return docs
+
+    def _ranked(self, docs: np.ndarray, limit: int, *keys) -> np.ndarray:
+        """`docs` ordered by `keys` (higher first), then weight, then shorter name"""
+        order = np.lexsort((self._lengths[docs], -self.weights[docs], *(-k for k in reversed(keys))))
+        return docs[order[:limit]]
+
+    def lookup(self, query: str, limit: int = 10, fuzzy: bool = True) -> list:
+        """Best `limit` matches of `query` -> [(record index, match type, score)]"""
+        q = fold(query)
+        if not q or limit <= 0:
+            return []
+        found, seen = [], set()
+
+        def _take(docs, match, scores=None):
+            for rank, i in enumerate(docs):
+                i = int(i)
+                if i not in seen and len(found) < limit:
+                    seen.add(i)
+                    found.append((i, match, _SCORES[match] if scores is None else float(scores[rank])))
+
+        exact, prefix = self._exact_and_prefix(q)
+        _take(self._ranked(exact, limit), EXACT)
+        if len(found) < limit:
+            _take(self._ranked(prefix, limit + len(seen)), PREFIX)
+        if len(found) < limit:
+            _take(self._ranked(self._word_prefix(q), limit + len(seen)), WORD)
+        if len(found) < limit:
+            _take(self._ranked(self._substring(q), limit + len(seen)), SUBSTRING)
+        if fuzzy and len(found) < limit and len(q) >= _FUZZY_MIN_LENGTH:
+            grams = _trigrams(f' {q} ')
+            share = self._gram_hits(grams) / len(grams)
+            docs = np.flatnonzero(share >= FUZZY_THRESHOLD)
+            if len(docs):
+                docs = self._ranked(docs, limit + len(seen), share[docs])
+                _take(docs, FUZZY, share[docs] * _SCORES[SUBSTRING])
+        return found
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> list:
+        """Best `limit` matches of `query` as dicts (the record plus 'match' and 'score')"""
+        return [{**self.records[i], 'match': match, 'score': round(score, 3)}
+                for i, match, score in self.lookup(query, limit, fuzzy)]
+
+    def contains(self, query: str) -> np.ndarray:
+        """Indexes of every record whose name contains `query` (in record order)
+
+        A query with nothing left after folding (only punctuation) matches
+        no record
+        """
+        q = fold(query)
+        if not q:
+            return np.empty(0, dtype=np.int32)
+        if len(q) >= 3:
+            return np.sort(self._substring(q))
+        return np.array([i for i, name in enumerate(self.names) if q in name], dtype=np.int32)
+
+
+def _int(value) -> Optional[int]:
+    return None if pd.isna(value) else int(value)
+
+
+def _people_index(df: pd.DataFrame) -> SearchIndex:
+    names = (df['name_first'].fillna('') + ' ' + df['name_last'].fillna('')).tolist()
+    records = [{'kind': 'person', 'mlbam': _int(r['mlbam']), 'name': name.strip(),
+                'bbrefID': r['bbrefID'] if isinstance(r['bbrefID'], str) else None,
+                'year_debut': _int(r['year_debut']), 'year_recent': _int(r['year_recent'])}
+               for name, r in zip(names, df[['mlbam', 'bbrefID', 'year_debut', 'year_recent']].to_dict('records'))]
+    weights = df['year_recent'].fillna(df['year_debut']).fillna(0)
+    return SearchIndex(names, records, weights)
+
+
+def _teams_index(df: pd.DataFrame) -> SearchIndex:
+    # one entry per name a team has gone by
+    names = df.groupby(['mlbam', 'name_full'], sort=False)['season'].agg(['min', 'max']).reset_index()
+    records = [{'kind': 'team', 'mlbam': int(r['mlbam']), 'name': r['name_full'],
+                'first_season': int(r['min']), 'last_season': int(r['max'])}
+               for r in names.to_dict('records')]
+    return SearchIndex(names['name_full'].tolist(), records, names['max'])
+
+
+def _venues_index(df: pd.DataFrame) -> SearchIndex:
+    records = [{'kind': 'venue', 'mlbam': int(r['mlbam']), 'name': r['name'], 'active': bool(r['active']),
+                'city': r['city'] if isinstance(r['city'], str) else None}
+               for r in df[['mlbam', 'name', 'active', 'city']].to_dict('records')]
+    return SearchIndex(df['name'].tolist(), records, df['active'].fillna(False).astype(int))
+
+
+_BUILDERS = {
+    'people': (PEOPLE_CSV, _people_index),
+    'teams': (TEAMS_CSV, _teams_index),
+    'venues': (VENUES_CSV, _venues_index),
+}
+
+
+def get_index(kind: str) -> SearchIndex:
+    """Shared index of 'people', 'teams' or 'venues'"""
+    if kind not in _BUILDERS:
+        raise ValueError(f"kind must be one of {', '.join(KINDS)} (got {kind!r})")
+    path, build = _BUILDERS[kind]
+    return mlbdata.table_index(path, 'search', build)
+
+
+def search(query: str, kind=None, limit: int = 10, fuzzy: bool = True) -> list:
+    """Search people, teams and venues by name
+
+    Parameters:
+    -----------
+    query : str
+        the whole name or part of it (e.g. "white so", "jose abreu" or
+        "wrigly field")
+
+    kind : str or list, optional
+        'people', 'teams' and/or 'venues'; all three by default
+
+    limit : int, default 10
+        maximum number of results
+
+    fuzzy : bool, default True
+        whether to fall back on approximate matches
+
+    Returns a list of dicts, best first, each with the 'kind' ('person',
+    'team' or 'venue'), 'mlbam' and 'name' of the match, a few identifying
+    fields, the 'match' type and a 'score' between 0 and 1
+    """
+    kinds = KINDS if kind is None else ([kind] if isinstance(kind, str) else list(kind))
+    if len(kinds) == 1:
+        return get_index(kinds[0]).search(query, limit, fuzzy)
+    results = []
+    for k in kinds:
+        results.extend((-r['score'], rank, r) for rank, r in enumerate(get_index(k).search(query, limit, fuzzy)))
+    results.sort(key=lambda item: item[:2])
+    return [r for _, _, r in results[:limit]]
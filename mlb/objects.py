@@ -994,13 +994,8 @@ class _teams_data_collection:
         if season is not None:
             df = df[df["season"] == season]
 
-        query = query.lower()
-        found_data = []
-        for idx, row in df.iterrows():
-            if query in row["name_full"].lower():
-                found_data.append(row)
-
-        return pd.DataFrame(data=found_data).reset_index(drop=True)
+        found = df["name_full"].str.contains(query, case=False, regex=False, na=False)
+        return df[found].reset_index(drop=True)
 
 
 class _people_data_collection:
@@ -1031,13 +1026,8 @@ class _people_data_collection:
         # if season is not None:
         #     df = df[df['season']==season]
 
-        name = name.lower()
-        found_data = []
-        for idx, row in df.iterrows():
-            if name in row["name_full"].lower():
-                found_data.append(row)
-
-        return pd.DataFrame(data=found_data).reset_index(drop=True)
+        found = df["name_full"].str.contains(name, case=False, regex=False, na=False)
+        return df[found].reset_index(drop=True)
 
 
 class MlbTeam:
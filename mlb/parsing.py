@@ -68,6 +68,7 @@ def _parse_league_stats(splits:list[dict]) -> pd.DataFrame:
     team_abbrv_col = []
     league_mlbam_col = []
     div_mlbam_col = []
+    _, latest_teams = mlbdata.team_rows()
 
     for tm in splits:
         season = tm.get("season")
@@ -77,9 +78,10 @@ def _parse_league_stats(splits:list[dict]) -> pd.DataFrame:
         season_col.append(season)
         team_mlbam_col.append(team_mlbam)
         team_name_col.append(team_name)
-        team_abbrv_col.append(TEAMS[TEAMS['mlbam']==team_mlbam].iloc[0]['mlbID'])
-        league_mlbam_col.append(TEAMS[TEAMS['mlbam']==team_mlbam].iloc[0]['lg_mlbam'])
-        div_mlbam_col.append(TEAMS[TEAMS['mlbam']==team_mlbam].iloc[0]['div_mlbam'])
+        team_row = latest_teams.get(team_mlbam,{})
+        team_abbrv_col.append(team_row.get('mlbID'))
+        league_mlbam_col.append(team_row.get('lg_mlbam'))
+        div_mlbam_col.append(team_row.get('div_mlbam'))
 
         tm_stats = tm.get("stat")
 
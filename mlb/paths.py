@@ -22,4 +22,7 @@ LEAGUES_CSV             = os.path.join(os.path.dirname(__file__),'data/leagues.c
 PITCH_TYPES_CSV         = os.path.join(os.path.dirname(__file__),'data/pitch_types.csv')
 PITCH_CODES_CSV         = os.path.join(os.path.dirname(__file__),'data/pitch_codes.csv')
 EVENT_TYPES_CSV         = os.path.join(os.path.dirname(__file__),'data/event_types.csv')
-API_TEAMS_CSV           = os.path.join(os.path.dirname(__file__),'data/api_teams.csv')
\ No newline at end of file
+API_TEAMS_CSV           = os.path.join(os.path.dirname(__file__),'data/api_teams.csv')
+
+CACHE_DIR               = os.environ.get('MLB_CACHE_DIR',os.path.join(os.path.expanduser('~'),'.cache','simplestats-mlb'))
+RESPONSE_CACHE_DB       = os.path.join(CACHE_DIR,'responses.sqlite')
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""Id index over people.csv
+
+Looking up one person used to mean loading all of people.csv into a
+DataFrame and calling `set_index("mlbam").loc[...]`. The index maps each id
+column (`mlbam`, `bbrefID`, `retroID`) to the byte offset of the person's
+line in the csv, so a lookup is a binary search plus reading one line:
+
+```
+from mlb.people_index import get_people_index
+
+people = get_people_index()
+people.row(547989)                        # {'name_first': 'Jose', ..., 'mlbam': 547989, ...}
+people.convert('abreujo02', 'bbrefID', 'mlbam')       # 547989
+```
+
+The index lives next to the csv (`people.idx`) and is memory-mapped
+together with the csv, so only the pages a lookup touches are read. When it
+is missing or was built from a different people.csv (its header records the
+csv's size and a hash of its bytes), the same arrays are built in memory
+instead. `build()` (called by `update_people`) rewrites it; the shared index
+is closed first with `close_people_index()`, since a mapped file can't be
+replaced on Windows.
+"""
+import os
+import io
+import csv
+import mmap
+import threading
+from typing import Optional
+
+import numpy as np
+
+from . import columnar
+from .paths import PEOPLE_CSV
+
+SUFFIX = '.idx'
+KEYS = ('mlbam', 'bbrefID', 'retroID')
+
+_INT_COLUMNS = ('mlbam', 'year_debut', 'year_recent')
+
+
+def index_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + SUFFIX
+
+
+def _scan(csv_path: str) -> tuple:
+    """Header, rows and the byte offset of every row of a csv"""
+    with open(csv_path, 'rb') as f:
+        data = f.read()
+    header_end = data.index(b'\n') + 1
+    header = next(csv.reader([data[:header_end].decode('utf-8')]))
+    newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord('\n'))
+    ends = np.append(newlines[1:], len(data))
+    starts = newlines + 1
+    # blank lines (a trailing empty line, CRLF or not) hold no row
+    starts = np.array([start for start, end in zip(starts, ends) if data[start:end].strip()], dtype=np.int64)
+    rows = [r for r in csv.reader(io.StringIO(data[header_end:].decode('utf-8'))) if r and (len(r) > 1 or r[0].strip())]
+    if len(rows) != len(starts):
+        raise ValueError(f"{csv_path} has quoted line breaks; it can't be indexed by line")
+    return header, rows, starts.astype(np.int64)
+
+
+def _arrays(csv_path: str) -> dict:
+    header, rows, offsets = _scan(csv_path)
+    arrays = {'offsets': offsets}
+    for key in KEYS:
+        col = header.index(key)
+        values = [(r[col], i) for i, r in enumerate(rows) if r[col] != '']
+        if key == 'mlbam':
+            keys = np.array([int(v) for v, _ in values], dtype=np.int64)
+        else:
+            keys = np.array([v.encode('utf-8') for v, _ in values], dtype=bytes)
+        order = np.argsort(keys, kind='stable')
+        arrays[f'{key}.keys'] = keys[order]
+        arrays[f'{key}.rows'] = np.array([i for _, i in values], dtype=np.int32)[order]
+    return arrays
+
+
+def build(csv_path: str = PEOPLE_CSV) -> str:
+    """(Re)write the index file of `csv_path`; returns its path"""
+    path = index_path(csv_path)
+    columnar.write_arrays(path, _arrays(csv_path), **columnar.source_meta(csv_path))
+    return path
+
+
+class PeopleIndex:
+    """Id lookups over a people csv (see module docstring)"""
+    def __init__(self, csv_path: str = PEOPLE_CSV):
+        self.csv_path = csv_path
+        path = index_path(csv_path)
+        self.mapped = os.path.exists(path) and columnar.built_from(path, csv_path)
+        self._index_map = None
+        if self.mapped:
+            _, self._arrays, self._index_map = columnar.map_arrays(path)
+        else:
+            self._arrays = _arrays(csv_path)
+        with open(csv_path, 'rb') as f:
+            self._columns = next(csv.reader([f.readline().decode('utf-8')]))
+            self._csv = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __repr__(self):
+        return f"<PeopleIndex {len(self)} people{' (mapped)' if self.mapped else ''}>"
+
+    def __len__(self):
+        return len(self._arrays['offsets'])
+
+    def close(self):
+        """Unmap the csv and the index file (the index can't be used afterwards)"""
+        self._arrays = {}
+        for mapped in (self._index_map, self._csv):
+            if mapped is not None:
+                mapped.close()
+        self._index_map = self._csv = None
+
+    def __contains__(self, mlbam):
+        return self._positions('mlbam', mlbam) is not None
+
+    def _positions(self, key: str, value) -> Optional[slice]:
+        if key not in KEYS:
+            raise KeyError(f"'{key}' is not indexed (indexed columns: {', '.join(KEYS)})")
+        keys = self._arrays[f'{key}.keys']
+        try:
+            value = int(value) if key == 'mlbam' else str(value).encode('utf-8')
+        except (TypeError, ValueError):
+            return None
+        lo = int(np.searchsorted(keys, value, side='left'))
+        if lo == len(keys) or keys[lo] != value:
+            return None
+        return slice(lo, int(np.searchsorted(keys, value, side='right')))
+
+    def _read(self, row: int) -> dict:
+        start = int(self._arrays['offsets'][row])
+        end = self._csv.find(b'\n', start)
+        line = self._csv[start:end if end != -1 else len(self._csv)].decode('utf-8').rstrip('\r')
+        values = next(csv.reader([line]))
+        record = {}
+        for col, value in zip(self._columns, values):
+            if value == '':
+                record[col] = None
+            elif col in _INT_COLUMNS:
+                record[col] = int(float(value))
+            else:
+                record[col] = value
+        return record
+
+    def find(self, key: str, value) -> list:
+        """Every person whose `key` column equals `value` (as dicts)"""
+        positions = self._positions(key, value)
+        if positions is None:
+            return []
+        return [self._read(int(row)) for row in self._arrays[f'{key}.rows'][positions]]
+
+    def row(self, mlbam) -> Optional[dict]:
+        """The people.csv row of `mlbam` as a dict (None if unknown)"""
+        found = self.find('mlbam', mlbam)
+        return found[0] if found else None
+
+    def convert(self, value, source: str = 'bbrefID', target: str = 'mlbam'):
+        """Translate an id between `mlbam`, `bbrefID`, `retroID` (and any other column)
+
+        Returns None for unknown ids; for ids shared by several people, the
+        first one in people.csv wins
+        """
+        found = self.find(source, value)
+        return found[0].get(target) if found else None
+
+
+_index: Optional[PeopleIndex] = None
+_index_stamp = None
+_index_lock = threading.Lock()
+
+
+def _stamp(path: str) -> tuple:
+    stamps = []
+    for p in (path, index_path(path)):
+        try:
+            st = os.stat(p)
+            stamps.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+def close_people_index():
+    """Close the shared index so people.csv and people.idx can be rewritten
+
+    The next `get_people_index()` opens them again
+    """
+    global _index, _index_stamp
+    with _index_lock:
+        if _index is not None:
+            _index.close()
+        _index = _index_stamp = None
+
+
+def get_people_index() -> PeopleIndex:
+    """Shared index over the bundled people.csv (reopened when either file changes)"""
+    global _index, _index_stamp
+    stamp = _stamp(PEOPLE_CSV)
+    if _index is None or _index_stamp != stamp:
+        with _index_lock:
+            if _index is None or _index_stamp != stamp:
+                if _index is not None:
+                    # unmap the stale files now rather than at garbage collection
+                    _index.close()
+                _index = PeopleIndex(PEOPLE_CSV)
+                _index_stamp = stamp
+    return _index
@@ -0,0 +1,88 @@
+"""StatsAPI `fields=` projections
+
+StatsAPI trims a response down to the keys named in its `fields` parameter
+(matched by name at any depth; a dict key survives only if it's listed).
+Heavy endpoints like hydrated schedules come back at a fraction of their
+size when the request only names the keys its parser reads.
+
+The key lists aren't maintained by hand: `parser_fields()` reads the
+parser's source and collects every string literal it uses as a key
+(`d['key']`, `d.get('key')`). Keys a parser reaches any other way (through a
+variable, a helper or `**` unpacking) are stripped from the response without
+an error, so they have to be passed as `extra`. tests/test_projections.py
+runs every projected call on a full payload with and without its projection
+and fails when the results differ; a new projected call needs a case there.
+
+Set MLB_FIELDS=0 (or call `configure_fields(False)`) to request full
+payloads again.
+"""
+import os
+import ast
+import inspect
+import textwrap
+import functools
+from typing import Callable, Optional
+
+_enabled = os.environ.get('MLB_FIELDS', '1') not in ('0', 'false', 'False', 'off')
+
+
+def configure_fields(enabled: bool) -> bool:
+    """Turn `fields=` projections on/off; returns the previous setting"""
+    global _enabled
+    previous = _enabled
+    _enabled = enabled
+    return previous
+
+
+def _literal(node) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def parser_fields(parser: Callable, extra: tuple = ()) -> Optional[str]:
+    """Comma-separated keys that `parser` reads (None if its source isn't available)"""
+    try:
+        source = textwrap.dedent(inspect.getsource(parser))
+    except (OSError, TypeError):
+        return None
+
+    keys = set(extra)
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Subscript) and isinstance(node.ctx, ast.Load):
+            key = _literal(node.slice)
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'get' and node.args:
+            key = _literal(node.args[0])
+        else:
+            continue
+        if key:
+            keys.add(key)
+    return ",".join(sorted(keys))
+
+
+def fields_param(parser: Callable, extra: tuple = ()) -> dict:
+    """`{'fields': ...}` for a request parsed by `parser` ({} when disabled)"""
+    if not _enabled:
+        return {}
+    fields = parser_fields(parser, tuple(extra))
+    return {'fields': fields} if fields else {}
+
+
+def with_fields(url: str, parser: Callable, extra: tuple = ()) -> str:
+    """`url` with the `fields=` projection for `parser` appended"""
+    params = fields_param(parser, extra)
+    if not params:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}fields={params['fields']}"
+
+
+def apply_fields(payload, fields):
+    """Apply a `fields=` projection locally, the way StatsAPI does"""
+    if isinstance(fields, str):
+        fields = set(fields.split(','))
+    if isinstance(payload, dict):
+        return {k: apply_fields(v, fields) for k, v in payload.items() if k in fields}
+    if isinstance(payload, list):
+        return [apply_fields(v, fields) for v in payload]
+    return payload
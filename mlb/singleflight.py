@@ -0,0 +1,98 @@
+"""In-flight request coalescing ("single-flight")
+
+When several callers ask for the same url at the same moment, only the first
+one (the leader) performs the request; everyone else waits for the leader and
+receives the very same result object (or exception). Works across threads and
+across coroutines, including coroutines running on different event loops.
+
+The shared result is handed to every caller, so treat it as read-only.
+"""
+import asyncio
+import threading
+import concurrent.futures
+from typing import Callable, Awaitable, Hashable
+
+
+class _Flight:
+    __slots__ = ['future', 'thread', 'loop', 'waiters']
+
+    def __init__(self, loop):
+        self.future = concurrent.futures.Future()
+        self.thread = threading.get_ident()
+        self.loop = loop
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Registry of requests currently in flight
+
+    Coroutines call `await ado(key, coro_fn)`; callers should keep their key
+    spaces separate when the results have different types.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: "dict[Hashable,_Flight]" = {}
+        self.shared = 0
+
+    def __repr__(self):
+        return f"<SingleFlight in_flight={len(self._flights)} shared={self.shared}>"
+
+    def _join(self, key, loop):
+        """Return (flight, is_leader)"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and flight.thread == threading.get_ident() and flight.loop is not loop:
+                # the leader is suspended on this same thread (e.g. a nested
+                # event loop); waiting for it here would deadlock
+                return None, True
+            if flight is None:
+                flight = _Flight(loop)
+                self._flights[key] = flight
+                return flight, True
+            flight.waiters += 1
+            self.shared += 1
+            return flight, False
+
+    def _land(self, key, flight):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    async def ado(self, key: Hashable, coro_fn: Callable[[], Awaitable]):
+        """Await `coro_fn()` unless a call for `key` is already running; share its result"""
+        loop = asyncio.get_running_loop()
+        while True:
+            flight, leader = self._join(key, loop)
+            if flight is None:
+                return await coro_fn()
+            if leader:
+                break
+            try:
+                # shield -> a cancelled follower doesn't cancel the leader
+                return await asyncio.shield(asyncio.wrap_future(flight.future))
+            except asyncio.CancelledError:
+                if not flight.future.cancelled():
+                    raise
+                # the leader was cancelled; try again (possibly as the leader)
+
+        try:
+            result = await coro_fn()
+        except asyncio.CancelledError:
+            flight.future.cancel()
+            raise
+        except BaseException as e:
+            flight.future.set_exception(e)
+            raise
+        else:
+            flight.future.set_result(result)
+            return result
+        finally:
+            self._land(key, flight)
+
+
+_flights = SingleFlight()
+
+
+def get_singleflight() -> SingleFlight:
+    """The process-wide `SingleFlight` registry"""
+    return _flights
@@ -1,5 +1,5 @@
+import io
 import json
-import requests
 from typing import Union
 
 import pandas as pd
@@ -7,13 +7,20 @@ import numpy as np
 
 from .paths import *
 from .mlbdata import get_teams_df
+from .mlbdata import save_table
 from .constants import COLS_SEASON
 from .async_mlb import fetch
+from .async_mlb import get_json
+from .async_mlb import fetch_text
 from .async_mlb import get_updated_records
 from .async_mlb import fetch_coaching_roster
 from .async_mlb import fetch_standings
 from .async_mlb.coaches import roster_json_to_df
 
+def _read_csv(url,**kwargs) -> pd.DataFrame:
+    # downloaded through the library's transport (so it can be recorded/replayed)
+    return pd.read_csv(io.StringIO(fetch_text([url])[0]),**kwargs)
+
 def update_people(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'people' in the library's CSV files
     
@@ -25,7 +32,7 @@ def update_people(inplace=True) -> Union[pd.DataFrame,None]:
         
     """
     url = "https://raw.githubusercontent.com/chadwickbureau/register/master/data/people.csv"
-    df = pd.read_csv(url,low_memory=False)
+    df = _read_csv(url,low_memory=False)
     
     df = df[["key_mlbam","key_retro","key_bbref","key_bbref_minors","mlb_played_first","mlb_played_last","name_first","name_last","name_given"]]
     df = df.fillna("--")
@@ -56,7 +63,7 @@ def update_people(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(PEOPLE_CSV,index=False)
+        save_table(df,PEOPLE_CSV)
         
 def update_yby_records(inplace=True) -> Union[pd.DataFrame,None]:
     """Update yby records in the package's 'baseball.db'
@@ -74,7 +81,7 @@ def update_yby_records(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(YBY_RECORDS_CSV,index=False)
+        save_table(df,YBY_RECORDS_CSV)
 
 def update_hof(inplace=True) -> Union[pd.DataFrame,None]:
     """Update "Hall Of Fame" data in the library's CSV files
@@ -88,9 +95,9 @@ def update_hof(inplace=True) -> Union[pd.DataFrame,None]:
     """
     url = "https://statsapi.mlb.com/api/v1/awards/MLBHOF/recipients?sportId=1&hydrate=results,team"
 
-    response = requests.get(url)
+    response = get_json(url,use_cache=False)
     recipients = []
-    for r in response.json()["awards"]:
+    for r in response.json["awards"]:
         a_date = r["date"]
         a_id = r["id"]
         a_name = r["name"]
@@ -109,7 +116,7 @@ def update_hof(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(HALL_OF_FAME_CSV,index=False)
+        save_table(df,HALL_OF_FAME_CSV)
 
 def update_seasons(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'seasons' data in the library's CSV files
@@ -148,10 +155,10 @@ def update_seasons(inplace=True) -> Union[pd.DataFrame,None]:
         
     url = "https://statsapi.mlb.com/api/v1/seasons/all?sportId=1"
     
-    resp = requests.get(url)
+    resp = get_json(url,use_cache=False)
 
     data = []
-    for s in resp.json()["seasons"]:
+    for s in resp.json["seasons"]:
         data.append(pd.Series(s))
     
     df = pd.DataFrame(data=data).sort_values(by='seasonId',ascending=False).rename(columns=new_date_cols_map)#[cols]
@@ -163,7 +170,7 @@ def update_seasons(inplace=True) -> Union[pd.DataFrame,None]:
         df : pd.DataFrame = df
         return df
     else:
-        df.to_csv(SEASONS_CSV,index=False)
+        save_table(df,SEASONS_CSV)
 
 def update_venues(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'venues' data in the library's CSV files
@@ -179,9 +186,9 @@ def update_venues(inplace=True) -> Union[pd.DataFrame,None]:
     hydrations = "location,social,timezone,fieldInfo,metadata,images,xrefId,video"
     url = base + f"/venues?hydrate={hydrations}"
 
-    resp = requests.get(url)
+    resp = get_json(url,use_cache=False)
 
-    venues = resp.json()["venues"]
+    venues = resp.json["venues"]
 
     data = []
 
@@ -287,16 +294,16 @@ def update_venues(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(VENUES_CSV,index=False)
+        save_table(df,VENUES_CSV)
 
 def update_bbref_data(inplace=True) -> Union[pd.DataFrame,None]:
     url = "https://www.baseball-reference.com/data/war_daily_bat.txt"
-    hit = pd.read_csv(url)
+    hit = _read_csv(url)
     hit = hit.drop_duplicates(subset='mlb_ID',keep='first')[['name_common','mlb_ID','player_ID']].dropna()
     hit = hit.astype({'mlb_ID':'int32'})
     
     url = "https://www.baseball-reference.com/data/war_daily_pitch.txt"
-    pit = pd.read_csv(url)
+    pit = _read_csv(url)
     pit = pit.drop_duplicates(subset='mlb_ID',keep='first')[['name_common','mlb_ID','player_ID']].dropna()
     pit = pit.astype({'mlb_ID':'int32'})
     
@@ -305,7 +312,7 @@ def update_bbref_data(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df.reset_index(drop=True)
     else:
-        df.to_csv(BBREF_DATA_CSV,index=False)
+        save_table(df,BBREF_DATA_CSV)
         
 def update_leagues(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'leagues' data in the library's CSV files
@@ -325,11 +332,9 @@ def update_leagues(inplace=True) -> Union[pd.DataFrame,None]:
         [0,'-','-','-','-',0,'-']
     ]
 
-    with requests.session() as sesh:
-        divs_resp = sesh.get(divs_url)
-        lgs_resp = sesh.get(lgs_url)
+    divs_resp, lgs_resp = fetch([divs_url,lgs_url],use_cache=False)
 
-    for lg in lgs_resp.json()["leagues"]:
+    for lg in lgs_resp.json["leagues"]:
         data.append([
             lg.get("id"),
             lg.get("name"),
@@ -340,7 +345,7 @@ def update_leagues(inplace=True) -> Union[pd.DataFrame,None]:
             "-",
         ])
 
-    for div in divs_resp.json()["divisions"]:
+    for div in divs_resp.json["divisions"]:
         data.append([
             div.get("id"),
             div.get("name"),
@@ -356,23 +361,23 @@ def update_leagues(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     else:
-        df.to_csv(LEAGUES_CSV,index=False)
+        save_table(df,LEAGUES_CSV)
     
 def update_bbref_hitting_war(inplace=True) -> Union[pd.DataFrame,None]:
     url = "https://www.baseball-reference.com/data/war_daily_bat.txt"
-    df = pd.read_csv(url)
+    df = _read_csv(url)
     if inplace is False:
         return df
     else:
-        df.to_csv(BBREF_BATTING_DATA_CSV,index=False)
+        save_table(df,BBREF_BATTING_DATA_CSV)
 
 def update_bbref_pitching_war(inplace=True) -> Union[pd.DataFrame,None]:
     url = "https://www.baseball-reference.com/data/war_daily_pitch.txt"
-    df = pd.read_csv(url)
+    df = _read_csv(url)
     if inplace is False:
         return df
     else:
-        df.to_csv(BBREF_PITCHING_DATA_CSV,index=False)
+        save_table(df,BBREF_PITCHING_DATA_CSV)
 
 def update_pitch_types(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'pitch_types' in the library's CSV files
@@ -385,9 +390,9 @@ def update_pitch_types(inplace=True) -> Union[pd.DataFrame,None]:
         
     """
     url = 'https://statsapi.mlb.com/api/v1/pitchTypes'
-    resp = requests.get(url)
+    resp = get_json(url,use_cache=False)
     data = []
-    for p in resp.json():
+    for p in resp.json:
         data.append({'code':p['code'],'description':p['description']})
 
     df = pd.DataFrame.from_dict(data).sort_values(by='code')
@@ -396,7 +401,7 @@ def update_pitch_types(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is not True:
         return df
     
-    df.to_csv(PITCH_TYPES_CSV,index=False)
+    save_table(df,PITCH_TYPES_CSV)
     
 def update_pitch_codes(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'pitch_codes' in the library's CSV files
@@ -409,9 +414,9 @@ def update_pitch_codes(inplace=True) -> Union[pd.DataFrame,None]:
         
     """
     url = 'https://statsapi.mlb.com/api/v1/pitchCodes'
-    resp = requests.get(url)
+    resp = get_json(url,use_cache=False)
     data = []
-    for p in resp.json():
+    for p in resp.json:
         data.append({'code':p['code'],'description':p['description']})
 
     df = pd.DataFrame.from_dict(data).sort_values(by='code')
@@ -420,7 +425,7 @@ def update_pitch_codes(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     
-    df.to_csv(PITCH_CODES_CSV,index=False)
+    save_table(df,PITCH_CODES_CSV)
     
 def update_event_types(inplace=True) -> Union[pd.DataFrame,None]:
     """Update 'event_types' in the library's CSV files
@@ -433,9 +438,9 @@ def update_event_types(inplace=True) -> Union[pd.DataFrame,None]:
         
     """
     url = 'https://statsapi.mlb.com/api/v1/eventTypes'
-    resp = requests.get(url)
+    resp = get_json(url,use_cache=False)
     data = []
-    for e in resp.json():
+    for e in resp.json:
         e_type_data = {'code':e['code'],
                        'description':e['description'],
                        'hit':e['hit'],
@@ -449,7 +454,7 @@ def update_event_types(inplace=True) -> Union[pd.DataFrame,None]:
     if inplace is False:
         return df
     
-    df.to_csv(EVENT_TYPES_CSV,index=False)
+    save_table(df,EVENT_TYPES_CSV)
 
 def update_standings(inplace=True,**kwargs) -> Union[pd.DataFrame,None]:
     """Update the year-by-year standings.
@@ -464,7 +469,7 @@ def update_standings(inplace=True,**kwargs) -> Union[pd.DataFrame,None]:
     df.sort_values(by=['season','sport_rank'],ascending=[False,True],inplace=True)
     df.reset_index(drop=True)
     if inplace:
-        df.to_csv(STANDINGS_CSV,index=False)
+        save_table(df,STANDINGS_CSV)
         return None
     return df
 
@@ -479,4 +484,4 @@ def update_coaches():
     """
     responses = fetch_coaching_roster()
     df = roster_json_to_df(responses)
-    df.to_csv(COACHES_MASTER_CSV,index=False)
+    save_table(df,COACHES_MASTER_CSV)
@@ -1,5 +1,4 @@
 import platform
-import requests
 import pandas as pd
 import datetime as dt
 from dateutil import tz
@@ -20,6 +19,13 @@ from .constants import (
 
 from .mlbdata import get_season_info
 
+
+def _get_json(url):
+    # imported lazily; async_mlb imports this module
+    from .async_mlb import get_json
+    return get_json(url)
+
+
 today_date = dt.datetime.today()
 
 utc_zone = tz.tzutc()
@@ -817,9 +823,9 @@ class metadata:
     def baseball_stats(df=False) -> Union[List[Dict], pd.DataFrame]:
         url = "https://statsapi.mlb.com/api/v1/baseballStats"
         data = []
-        resp = requests.get(url)
+        resp = _get_json(url)
         if df is True:
-            for d in resp.json():
+            for d in resp.json:
                 stat_groups = []
                 for sg in d.get("statGroups", [{}]):
                     stat_groups.append(sg.get("displayName"))
@@ -857,21 +863,21 @@ class metadata:
                 ],
             )
         else:
-            return resp.json()
+            return resp.json
 
     def league_leader_types(df=False) -> Union[list, pd.DataFrame]:
         url = "https://statsapi.mlb.com/api/v1/leagueLeaderTypes"
         data = []
-        resp = requests.get(url)
-        for i in resp.json():
+        resp = _get_json(url)
+        for i in resp.json:
             data.append(i["displayName"])
         return data
 
     def stat_groups(df=False) -> Union[list, pd.DataFrame]:
         url = "https://statsapi.mlb.com/api/v1/statGroups"
         data = []
-        resp = requests.get(url)
-        for i in resp.json():
+        resp = _get_json(url)
+        for i in resp.json:
             data.append(i["displayName"])
         if df is True:
             return pd.DataFrame(data=data)
@@ -880,7 +886,7 @@ class metadata:
     def stat_types(df=False) -> Union[list, pd.DataFrame]:
         url = "https://statsapi.mlb.com/api/v1/statTypes"
         data = []
-        resp = requests.get(url)
-        for i in resp.json():
+        resp = _get_json(url)
+        for i in resp.json:
             data.append(i["displayName"])
         return data
@@ -0,0 +1,72 @@
+"""Which responses `cache.ttl_for` keeps for good
+
+Past seasons and past dates are historical, but a schedule date only stops
+changing once its games are over: a late game is still In Progress after
+midnight, suspended games are resumed and postponed ones rescheduled.
+"""
+import datetime as dt
+
+from mlb import cache
+from mlb.endpoints import is_historical
+
+TODAY = dt.date(2022, 6, 2)
+BASE = 'https://statsapi.mlb.com/api/v1'
+
+
+def _schedule(*states):
+    games = [{'gamePk': i, 'status': {'abstractGameState': abstract, 'detailedState': detailed}}
+             for i, (abstract, detailed) in enumerate(states)]
+    return {'totalGames': len(games), 'dates': [{'date': '2022-06-01', 'games': games}]}
+
+
+def test_is_historical():
+    assert is_historical(f'{BASE}/schedule?sportId=1&date=2022-06-01', TODAY)
+    assert is_historical(f'{BASE}/teams/145/roster?season=2021', TODAY)
+    assert not is_historical(f'{BASE}/schedule?sportId=1&date=2022-06-02', TODAY)
+    assert not is_historical(f'{BASE}/schedule?sportId=1&startDate=2022-05-01', TODAY)
+    assert not is_historical(f'{BASE}/schedule?sportId=1&startDate=2022-05-01&endDate=2022-06-03', TODAY)
+    assert not is_historical(f'{BASE}/teams/145/roster?season=2022', TODAY)
+    assert not is_historical(f'{BASE}/teams/145/roster', TODAY)
+
+
+def test_yesterday_in_progress_is_not_forever():
+    url = f'{BASE}/schedule?sportId=1&date=2022-06-01'
+    payload = _schedule(('Final', 'Final'), ('Live', 'In Progress'))
+    assert cache.ttl_for(url, payload, TODAY) == cache.TTLS['schedule']
+
+
+def test_yesterday_suspended_or_postponed_is_not_forever():
+    url = f'{BASE}/schedule?sportId=1&date=2022-06-01'
+    for detailed in ('Suspended: Rain', 'Postponed'):
+        payload = _schedule(('Final', 'Final'), ('Final', detailed))
+        assert cache.ttl_for(url, payload, TODAY) == cache.TTLS['schedule']
+
+
+def test_yesterday_without_payload_is_not_forever():
+    url = f'{BASE}/schedule?sportId=1&startDate=2022-05-30&endDate=2022-06-01'
+    assert cache.ttl_for(url, None, TODAY) == cache.TTLS['schedule']
+
+
+def test_yesterday_all_final_is_forever():
+    url = f'{BASE}/schedule?sportId=1&date=2022-06-01'
+    payload = _schedule(('Final', 'Final'), ('Final', 'Game Over'))
+    assert cache.ttl_for(url, payload, TODAY) is cache.FOREVER
+
+
+def test_settled_after_grace_window():
+    old = TODAY - dt.timedelta(days=cache.SETTLE_DAYS + 1)
+    url = f'{BASE}/schedule?sportId=1&date={old:%Y-%m-%d}'
+    payload = _schedule(('Final', 'Postponed'))
+    assert cache.ttl_for(url, payload, TODAY) is cache.FOREVER
+
+
+def test_season_urls_ignore_the_payload():
+    assert cache.ttl_for(f'{BASE}/schedule?sportId=1&season=2021', None, TODAY) is cache.FOREVER
+    assert cache.ttl_for(f'{BASE}/teams/145/stats?season=2021&group=hitting', None, TODAY) is cache.FOREVER
+    assert cache.ttl_for(f'{BASE}/schedule?sportId=1&date=2022-06-02', None, TODAY) == cache.TTLS['schedule']
+
+
+def test_live_feed():
+    url = f'{BASE}.1/game/661234/feed/live'
+    assert cache.ttl_for(url, {'gameData': {'status': {'abstractGameState': 'Live'}}}, TODAY) == cache.TTLS['live']
+    assert cache.ttl_for(url, {'gameData': {'status': {'abstractGameState': 'Final'}}}, TODAY) is cache.FOREVER
@@ -0,0 +1,152 @@
+"""Merged requests must split back into the payloads of the original urls
+
+A mock StatsAPI builds every payload from the url's parameters (roster
+stat hydrations, stat groups, schedule date ranges), so the planned urls
+can be compared with the unmerged ones request for request.
+"""
+import re
+import json
+import datetime as dt
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+import mlb
+from mlb import functions
+from mlb.async_mlb.fetch import runit
+from mlb.async_mlb.planner import plan_requests
+from mlb.async_mlb.transport import MockTransport, RawResponse, use_transport
+
+BASE = 'https://statsapi.mlb.com/api/v1'
+_HYDRATE = re.compile(r'type=\[([^\]]*)\],group=\[([^\]]*)\]')
+
+
+def _stat(stat_type, group):
+    return {'type': {'displayName': stat_type}, 'group': {'displayName': group},
+            'splits': [{'stat': {'gamesPlayed': len(stat_type) * len(group)}}]}
+
+
+def _roster(params):
+    m = _HYDRATE.search(params['hydrate'][0])
+    person = {}
+    if m is not None:
+        person['stats'] = [_stat(t, g) for t in m.group(1).split(',') for g in m.group(2).split(',')]
+    return {'copyright': 'c', 'roster': [{'person': {'id': i, 'fullName': f'P{i}', **person},
+                                          'jerseyNumber': str(i)} for i in (1, 2)]}
+
+
+def _team_stats(params):
+    return {'copyright': 'c', 'stats': [_stat(t, g) for t in params['stats'][0].split(',')
+                                        for g in params['group'][0].split(',')]}
+
+
+def _schedule(params):
+    day = dt.date.fromisoformat(params['startDate'][0])
+    end = dt.date.fromisoformat(params['endDate'][0])
+    dates = []
+    while day <= end:
+        if day.day % 3:
+            games = [{'gamePk': day.toordinal() * 10 + i,
+                      'status': {'abstractGameState': 'Live' if i else 'Final'}} for i in range(day.day % 2 + 1)]
+            live = sum(g['status']['abstractGameState'] == 'Live' for g in games)
+            dates.append({'date': day.isoformat(), 'totalItems': len(games), 'totalEvents': 0,
+                          'totalGames': len(games), 'totalGamesInProgress': live, 'games': games, 'events': []})
+        day += dt.timedelta(days=1)
+    totals = {k: sum(d[k] for d in dates) for k in ('totalItems', 'totalEvents', 'totalGames', 'totalGamesInProgress')}
+    return {'copyright': 'c', **totals, 'wait': 10, 'dates': dates}
+
+
+def _respond(url, headers):
+    parts = urlsplit(url)
+    params = parse_qs(parts.query)
+    if '/roster/' in parts.path:
+        payload = _roster(params)
+    elif parts.path.endswith('/stats'):
+        payload = _team_stats(params)
+    else:
+        payload = _schedule(params)
+    return RawResponse(url, 200, {'Content-Type': 'application/json'}, json.dumps(payload).encode('utf-8'))
+
+
+@pytest.fixture
+def statsapi():
+    mock = MockTransport()
+    mock.add('/api/v1/', body=_respond)
+    cache_enabled = mlb.configure_cache()['enabled']
+    mlb.configure_cache(enabled=False)
+    try:
+        with use_transport(mock):
+            yield mock
+    finally:
+        mlb.configure_cache(enabled=cache_enabled)
+
+
+def _check(urls, requests):
+    """Plan `urls`, compare the split payloads with the unmerged ones -> plan"""
+    plan = plan_requests(urls)
+    assert len(plan.urls) == requests
+    merged = plan.split([r.json for r in runit(plan.urls)])
+    assert merged == [r.json for r in runit(urls)]
+    return plan
+
+
+def _roster_url(stat_type, group, extra=''):
+    return f"{BASE}/teams/145/roster/40Man?season=2022&hydrate=person(stats(type=[{stat_type}],group=[{group}]{extra},season=2022))"
+
+
+def _schedule_url(start, end):
+    return f"{BASE}/schedule?sportId=1&teamId=145&startDate={start}&endDate={end}&gameType=R"
+
+
+def test_team_urls_plan(statsapi):
+    start, end = '2022-04-07', '2022-10-05'
+    urls = [u for u in functions._team_urls(145, 2022, start, end)
+            if '/roster/40Man' in u or '/stats?' in u or '/schedule' in u]
+    plan = _check(urls, 6)
+    # 2 roster hydrations (the sitCodes ones can't join the others), 3 gameTypes, 1 schedule
+    assert sum('/roster/' in u for u in plan.urls) == 2
+    assert sum('/stats?' in u for u in plan.urls) == 3
+
+
+def test_roster_hydrations(statsapi):
+    urls = [_roster_url('season', 'hitting'), _roster_url('season', 'pitching'),
+            _roster_url('seasonAdvanced', 'hitting'), _roster_url('statSplits', 'pitching', ',sitCodes=[sp,rp]')]
+    plan = _check(urls, 2)
+    assert any('type=[season,seasonAdvanced],group=[hitting,pitching]' in u for u in plan.urls)
+
+
+def test_unmergeable_hydration(statsapi):
+    urls = [f"{BASE}/teams/145/roster/40Man?season=2022&hydrate=person",
+            _roster_url('season', 'hitting'),
+            f"{BASE}/teams/145/roster/40Man?season=2022&hydrate=person(stats(type=[season],group=[pitching],season=2021))"]
+    _check(urls, 3)
+
+
+def test_stat_groups_by_game_type(statsapi):
+    urls = [f"{BASE}/teams/145/stats?stats=season,seasonAdvanced&group={g}&gameType={t}&season=2022"
+            for t in 'SR' for g in ('hitting', 'pitching', 'fielding')]
+    plan = _check(urls, 2)
+    assert all('group=hitting,pitching,fielding' in u for u in plan.urls)
+
+
+def test_schedule_runs_with_gap(statsapi):
+    urls = [_schedule_url('2022-04-01', '2022-04-30'), _schedule_url('2022-07-01', '2022-07-31'),
+            _schedule_url('2022-05-01', '2022-05-31'), _schedule_url('2022-08-01', '2022-08-31')]
+    plan = _check(urls, 2)
+    assert 'startDate=2022-04-01&endDate=2022-05-31' in plan.urls[0]
+    assert 'startDate=2022-07-01&endDate=2022-08-31' in plan.urls[1]
+
+
+def test_schedule_split_totals(statsapi):
+    urls = [_schedule_url('2022-04-01', '2022-04-10'), _schedule_url('2022-04-11', '2022-04-20')]
+    plan = plan_requests(urls)
+    merged = runit(plan.urls)[0].json
+    for part in plan.split([merged]):
+        for key in ('totalItems', 'totalGames', 'totalGamesInProgress'):
+            assert part[key] == sum(d[key] for d in part['dates']) < merged[key]
+
+
+def test_merged_query_is_encoded():
+    urls = [f"{BASE}/teams/145/stats?stats=season&group={g}&names=a%26b+c%23d" for g in ('hitting', 'pitching')]
+    plan = plan_requests(urls)
+    assert plan.urls == [f"{BASE}/teams/145/stats?stats=season&group=hitting,pitching&names=a%26b+c%23d"]
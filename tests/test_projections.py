@@ -0,0 +1,78 @@
+"""`fields=` projections must not change what the parsers return
+
+`parser_fields()` only sees keys a parser reads as string literals, so a key
+reached through a variable, a helper or `**` unpacking would be stripped
+from the response without any error. These tests serve an unprojected,
+fully hydrated schedule payload (tests/fixtures/schedule_hydrated.json)
+through a mock StatsAPI that applies `fields=` the way the real one does,
+and compare the projected run of every projected call with the unprojected
+one.
+"""
+import os
+import json
+from urllib.parse import urlsplit, parse_qs
+
+import pandas as pd
+import pytest
+
+import mlb
+from mlb import projections
+from mlb.async_mlb.transport import MockTransport, RawResponse, use_transport
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+@pytest.fixture
+def statsapi():
+    with open(os.path.join(FIXTURES, 'schedule_hydrated.json'), encoding='utf-8') as f:
+        payload = json.load(f)
+
+    def respond(url, headers):
+        fields = parse_qs(urlsplit(url).query).get('fields')
+        body = projections.apply_fields(payload, fields[0]) if fields else payload
+        return RawResponse(url, 200, {'Content-Type': 'application/json'}, json.dumps(body).encode('utf-8'))
+
+    mock = MockTransport()
+    mock.add('/schedule', body=respond)
+    cache_enabled = mlb.configure_cache()['enabled']
+    mlb.configure_cache(enabled=False)
+    try:
+        with use_transport(mock):
+            yield mock
+    finally:
+        mlb.configure_cache(enabled=cache_enabled)
+        projections.configure_fields(True)
+
+
+def _both(mock, call):
+    """`call()` with and without projections -> (projected, full)"""
+    projections.configure_fields(True)
+    projected = call()
+    assert 'fields=' in mock.urls[-1]
+    projections.configure_fields(False)
+    full = call()
+    assert 'fields=' not in mock.urls[-1]
+    return projected, full
+
+
+def test_schedule(statsapi):
+    projected, full = _both(statsapi, lambda: mlb.schedule(date='2022-06-01'))
+    assert len(full) == 2
+    # the in-progress game reads the lineups through a variable key
+    assert set(full['up_next_name']) - {''}
+    pd.testing.assert_frame_equal(projected, full)
+
+
+def test_game_highlights(statsapi):
+    projected, full = _both(statsapi, lambda: mlb.game_highlights(mlbam=147, date='2022-06-02'))
+    assert len(full) == 2
+    pd.testing.assert_frame_equal(projected, full)
+
+
+def test_projection_strips_unread_keys():
+    with open(os.path.join(FIXTURES, 'schedule_hydrated.json'), encoding='utf-8') as f:
+        payload = json.load(f)
+    fields = projections.parser_fields(mlb.functions._parse_highlights)
+    projected = projections.apply_fields(payload, fields)
+    assert 'copyright' not in projected
+    assert len(json.dumps(projected)) < len(json.dumps(payload))